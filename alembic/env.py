@@ -6,6 +6,7 @@ and discovers our SQLAlchemy models for autogeneration.
 """
 
 import asyncio
+import functools
 from logging.config import fileConfig
 
 from sqlalchemy import pool
@@ -21,12 +22,22 @@ from src.api.models import Base  # This imports all models via __init__.py
 # Alembic Config object
 config = context.config
 
+
+@functools.cache
+def _escaped_db_url() -> str:
+    """
+    Database URL from our settings, escaped for configparser.
+
+    We need to escape % characters as %% because configparser
+    interprets % as interpolation syntax. Cached so any later lookup
+    within the same run reuses the escaped value.
+    """
+    return settings.DATABASE_URL.replace("%", "%%")
+
+
 # Set the database URL from our settings
 # This overrides whatever is in alembic.ini
-# Note: We need to escape % characters as %% because configparser
-# interprets % as interpolation syntax
-escaped_url = settings.DATABASE_URL.replace("%", "%%")
-config.set_main_option("sqlalchemy.url", escaped_url)
+config.set_main_option("sqlalchemy.url", _escaped_db_url())
 
 # Setup logging from config file
 if config.config_file_name is not None:
@@ -58,6 +69,21 @@ def run_migrations_offline() -> None:
         context.run_migrations()
 
 
+def engine_options(url: str) -> dict:
+    """
+    Dialect-specific executemany tuning for data migrations.
+
+    - SQL Server (pyodbc/aioodbc): fast_executemany packs multi-row
+      inserts into a single parameter array instead of one round trip per row
+    - PostgreSQL (asyncpg/psycopg): already batched by SQLAlchemy's
+      insertmanyvalues, nothing to add
+    - SQLite: local file, no change needed
+    """
+    if url.startswith("mssql"):
+        return {"fast_executemany": True}
+    return {}
+
+
 def do_run_migrations(connection: Connection) -> None:
     """Run migrations with an active connection."""
     context.configure(connection=connection, target_metadata=target_metadata)
@@ -71,11 +97,16 @@ async def run_async_migrations() -> None:
     Run migrations in 'online' mode with async support.
 
     Creates an async engine and runs migrations within a connection.
+
+    NullPool is fine here: every migration script runs over the single
+    connection opened below, so nothing reconnects between statements
+    and a persistent pool would only keep a connection open after exit.
     """
     connectable = async_engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
         poolclass=pool.NullPool,
+        **engine_options(settings.DATABASE_URL),
     )
 
     async with connectable.connect() as connection:
@@ -0,0 +1,37 @@
+"""add filtered index on articles with content
+
+Revision ID: a2c4e6f8b1d3
+Revises: f1b6d8e3a5c2
+Create Date: 2026-10-14 12:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "a2c4e6f8b1d3"
+down_revision: str | Sequence[str] | None = "f1b6d8e3a5c2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_articles_id_with_content",
+        "articles",
+        ["id"],
+        unique=False,
+        mssql_where=sa.text("content IS NOT NULL"),
+        postgresql_where=sa.text("content IS NOT NULL"),
+        sqlite_where=sa.text("content IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_articles_id_with_content", table_name="articles")
@@ -21,8 +21,11 @@ down_revision: str | Sequence[str] | None = "a6dfe335ffc8"
 branch_labels: str | Sequence[str] | None = None
 depends_on: str | Sequence[str] | None = None
 
-# Password hashing (same as in security.py)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing for the seeded admin. The API now hashes with argon2id
+# (security.py) but still verifies bcrypt, and the admin's hash is
+# upgraded to argon2id by the rehash-on-login path on first login.
+# Rounds pinned so this migration's output doesn't change with passlib.
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=12)
 
 
 def upgrade() -> None:
@@ -56,24 +59,31 @@ def upgrade() -> None:
     hashed_password = pwd_context.hash(admin_password)
 
     # Insert admin user
-    # Use standard UUID format with hyphens for SQL Server UNIQUEIDENTIFIER compatibility
-    admin_uuid = str(
-        uuid.uuid4()
-    )  # Standard format: xxxxxxxx-xxxx-xxxx-xxxx-xxxxxxxxxxxx
-    op.execute(
-        sa.text(
-            """
-            INSERT INTO users (id, email, hashed_password, full_name, is_active, is_superuser, created_at, updated_at)
-            VALUES (:id, :email, :hashed_password, :full_name, :is_active, :is_superuser, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)
-            """
-        ).bindparams(
-            id=admin_uuid,
-            email=admin_email,
-            hashed_password=hashed_password,
-            full_name="Administrator",
-            is_active=True,
-            is_superuser=True,
-        )
+    # Lightweight table definition with explicit column types, so the bind
+    # parameters are typed up front (Uuid maps to UNIQUEIDENTIFIER on SQL
+    # Server) and op.bulk_insert can use the executemany fast path.
+    # created_at / updated_at are filled in by their server defaults.
+    users_table = sa.table(
+        "users",
+        sa.column("id", sa.Uuid()),
+        sa.column("email", sa.String()),
+        sa.column("hashed_password", sa.String()),
+        sa.column("full_name", sa.String()),
+        sa.column("is_active", sa.Boolean()),
+        sa.column("is_superuser", sa.Boolean()),
+    )
+    op.bulk_insert(
+        users_table,
+        [
+            {
+                "id": uuid.uuid4(),
+                "email": admin_email,
+                "hashed_password": hashed_password,
+                "full_name": "Administrator",
+                "is_active": True,
+                "is_superuser": True,
+            }
+        ],
     )
 
 
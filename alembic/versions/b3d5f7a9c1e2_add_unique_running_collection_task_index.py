@@ -0,0 +1,64 @@
+"""add unique index on running collection tasks per source
+
+Revision ID: b3d5f7a9c1e2
+Revises: a2c4e6f8b1d3
+Create Date: 2026-10-14 14:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b3d5f7a9c1e2"
+down_revision: str | Sequence[str] | None = "a2c4e6f8b1d3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Rows a crashed worker left running would violate the index: keep only
+    # the newest running task per source (or collect-all)
+    tasks = sa.table(
+        "collection_tasks",
+        sa.column("source_id", sa.Uuid()),
+        sa.column("running", sa.Boolean()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    newer = tasks.alias("newer")
+    op.execute(
+        tasks.update()
+        .where(
+            tasks.c.running == sa.true(),
+            sa.exists().where(
+                newer.c.running == sa.true(),
+                sa.or_(
+                    newer.c.source_id == tasks.c.source_id,
+                    sa.and_(newer.c.source_id.is_(None), tasks.c.source_id.is_(None)),
+                ),
+                newer.c.created_at > tasks.c.created_at,
+            ),
+        )
+        .values(running=False)
+    )
+
+    op.create_index(
+        "ux_collection_tasks_one_running_per_source",
+        "collection_tasks",
+        ["source_id"],
+        unique=True,
+        mssql_where=sa.text("running = 1"),
+        postgresql_where=sa.text("running"),
+        sqlite_where=sa.text("running = 1"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ux_collection_tasks_one_running_per_source", table_name="collection_tasks"
+    )
@@ -0,0 +1,32 @@
+"""drop redundant index on collection_tasks.running
+
+Revision ID: c4e6a8b0d2f5
+Revises: b3d5f7a9c1e2
+Create Date: 2026-10-14 15:40:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "c4e6a8b0d2f5"
+down_revision: str | Sequence[str] | None = "b3d5f7a9c1e2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_index(op.f("ix_collection_tasks_running"), table_name="collection_tasks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_collection_tasks_running"),
+        "collection_tasks",
+        ["running"],
+        unique=False,
+    )
@@ -0,0 +1,57 @@
+"""add composite indexes for article and collection task listings
+
+Revision ID: d4e8f2a1c9b7
+Revises: cfe31dc535ab
+Create Date: 2026-10-14 08:05:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d4e8f2a1c9b7"
+down_revision: str | Sequence[str] | None = "cfe31dc535ab"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_articles_source_id_fetched_at",
+        "articles",
+        ["source_id", "fetched_at"],
+        unique=False,
+    )
+    op.create_index("ix_articles_fetched_at", "articles", ["fetched_at"], unique=False)
+    # Covered by the composite index's leftmost column
+    op.drop_index(op.f("ix_articles_source_id"), table_name="articles")
+
+    op.create_index(
+        "ix_collection_tasks_source_id_created_at",
+        "collection_tasks",
+        ["source_id", "created_at"],
+        unique=False,
+    )
+    op.drop_index(op.f("ix_collection_tasks_source_id"), table_name="collection_tasks")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        op.f("ix_collection_tasks_source_id"),
+        "collection_tasks",
+        ["source_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_collection_tasks_source_id_created_at", table_name="collection_tasks"
+    )
+
+    op.create_index(
+        op.f("ix_articles_source_id"), "articles", ["source_id"], unique=False
+    )
+    op.drop_index("ix_articles_fetched_at", table_name="articles")
+    op.drop_index("ix_articles_source_id_fetched_at", table_name="articles")
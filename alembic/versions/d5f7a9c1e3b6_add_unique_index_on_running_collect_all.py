@@ -0,0 +1,63 @@
+"""add unique index on the running collect-all task
+
+Revision ID: d5f7a9c1e3b6
+Revises: c4e6a8b0d2f5
+Create Date: 2026-10-14 17:10:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d5f7a9c1e3b6"
+down_revision: str | Sequence[str] | None = "c4e6a8b0d2f5"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # SQLite and PostgreSQL let several running collect-alls (NULL
+    # source_id) past ux_collection_tasks_one_running_per_source: keep
+    # only the newest
+    tasks = sa.table(
+        "collection_tasks",
+        sa.column("source_id", sa.Uuid()),
+        sa.column("running", sa.Boolean()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    newer = tasks.alias("newer")
+    op.execute(
+        tasks.update()
+        .where(
+            tasks.c.running == sa.true(),
+            tasks.c.source_id.is_(None),
+            sa.exists().where(
+                newer.c.running == sa.true(),
+                newer.c.source_id.is_(None),
+                newer.c.created_at > tasks.c.created_at,
+            ),
+        )
+        .values(running=False)
+    )
+
+    op.create_index(
+        "ux_collection_tasks_one_running_collect_all",
+        "collection_tasks",
+        ["running"],
+        unique=True,
+        mssql_where=sa.text("running = 1 AND source_id IS NULL"),
+        postgresql_where=sa.text("running AND source_id IS NULL"),
+        sqlite_where=sa.text("running = 1 AND source_id IS NULL"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        "ux_collection_tasks_one_running_collect_all", table_name="collection_tasks"
+    )
@@ -0,0 +1,45 @@
+"""add id to article listing indexes for keyset pagination
+
+Revision ID: e7a3c5b9d2f4
+Revises: d4e8f2a1c9b7
+Create Date: 2026-10-14 10:20:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a3c5b9d2f4"
+down_revision: str | Sequence[str] | None = "d4e8f2a1c9b7"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_articles_source_id_fetched_at_id",
+        "articles",
+        ["source_id", "fetched_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_articles_fetched_at_id", "articles", ["fetched_at", "id"], unique=False
+    )
+    op.drop_index("ix_articles_source_id_fetched_at", table_name="articles")
+    op.drop_index("ix_articles_fetched_at", table_name="articles")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index("ix_articles_fetched_at", "articles", ["fetched_at"], unique=False)
+    op.create_index(
+        "ix_articles_source_id_fetched_at",
+        "articles",
+        ["source_id", "fetched_at"],
+        unique=False,
+    )
+    op.drop_index("ix_articles_fetched_at_id", table_name="articles")
+    op.drop_index("ix_articles_source_id_fetched_at_id", table_name="articles")
@@ -0,0 +1,61 @@
+"""add unique index on the running ingest job
+
+Revision ID: e7a9c1e3b5d8
+Revises: d5f7a9c1e3b6
+Create Date: 2026-10-14 18:30:00.000000
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "e7a9c1e3b5d8"
+down_revision: str | Sequence[str] | None = "d5f7a9c1e3b6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Two racing /ingest-all requests could both insert a running job:
+    # keep only the newest
+    jobs = sa.table(
+        "ingest_jobs",
+        sa.column("running", sa.Boolean()),
+        sa.column("created_at", sa.DateTime(timezone=True)),
+    )
+    newer = jobs.alias("newer")
+    op.execute(
+        jobs.update()
+        .where(
+            jobs.c.running == sa.true(),
+            sa.exists().where(
+                newer.c.running == sa.true(),
+                newer.c.created_at > jobs.c.created_at,
+            ),
+        )
+        .values(running=False)
+    )
+
+    op.drop_index(op.f("ix_ingest_jobs_running"), table_name="ingest_jobs")
+    op.create_index(
+        "ux_ingest_jobs_one_running",
+        "ingest_jobs",
+        ["running"],
+        unique=True,
+        mssql_where=sa.text("running = 1"),
+        postgresql_where=sa.text("running"),
+        sqlite_where=sa.text("running = 1"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ux_ingest_jobs_one_running", table_name="ingest_jobs")
+    op.create_index(
+        op.f("ix_ingest_jobs_running"), "ingest_jobs", ["running"], unique=False
+    )
@@ -1,6 +1,6 @@
 "use client";
 
-import { useEffect, useState, useCallback } from "react";
+import { useEffect, useState, useCallback, useRef } from "react";
 import Link from "next/link";
 import { toast } from "sonner";
 import * as api from "@/lib/api-client";
@@ -31,36 +31,62 @@ export default function ArticlesPage() {
   const [sources, setSources] = useState<SourceResponse[]>([]);
   const [total, setTotal] = useState(0);
   const [page, setPage] = useState(1);
+  // cursors[i] fetches page i + 1; pages are keyset-paginated by cursor
+  const [cursors, setCursors] = useState<(string | undefined)[]>([undefined]);
+  const [nextCursor, setNextCursor] = useState<string | null>(null);
   const [perPage] = useState(20);
   const [sourceFilter, setSourceFilter] = useState<string>("all");
   const [isLoading, setIsLoading] = useState(true);
   const [isIngesting, setIsIngesting] = useState(false);
+  const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
+
+  const stopPolling = useCallback(() => {
+    if (pollRef.current) {
+      clearInterval(pollRef.current);
+      pollRef.current = null;
+    }
+  }, []);
+
+  useEffect(() => stopPolling, [stopPolling]);
 
   const fetchData = useCallback(async () => {
     try {
       setIsLoading(true);
+      const sourceId = sourceFilter !== "all" ? sourceFilter : undefined;
       const [articlesData, sourcesData] = await Promise.all([
         api.listArticles({
-          page,
+          cursor: cursors[page - 1],
           per_page: perPage,
-          source_id: sourceFilter !== "all" ? sourceFilter : undefined,
+          source_id: sourceId,
         }),
         api.listSources(),
       ]);
       setArticles(articlesData.items);
-      setTotal(articlesData.total);
+      setNextCursor(articlesData.next_cursor);
       setSources(sourcesData);
     } catch (err) {
       toast.error(err instanceof Error ? err.message : "Failed to load articles");
     } finally {
       setIsLoading(false);
     }
-  }, [page, perPage, sourceFilter]);
+  }, [page, cursors, perPage, sourceFilter]);
 
   useEffect(() => {
     fetchData();
   }, [fetchData]);
 
+  // The total only changes with the filter, so it isn't re-counted per page.
+  // Paging itself relies on next_cursor; the unfiltered total is an estimate
+  useEffect(() => {
+    const sourceId = sourceFilter !== "all" ? sourceFilter : undefined;
+    api
+      .countArticles({ source_id: sourceId, estimate: !sourceId })
+      .then((data) => setTotal(data.total))
+      .catch(() => {
+        // the count is informational - keep the last one
+      });
+  }, [sourceFilter]);
+
   const totalPages = Math.ceil(total / perPage);
 
   const sourceMap = new Map(sources.map((s) => [s.id, s.name]));
@@ -68,13 +94,28 @@ export default function ArticlesPage() {
   const handleIngestAll = async () => {
     setIsIngesting(true);
     try {
-      const result = await api.ingestAllArticles();
-      toast.success(
-        `Ingested ${result.articles_ingested} articles (${result.total_chunks_created} chunks)`
-      );
+      const { job_id } = await api.ingestAllArticles();
+      stopPolling();
+      pollRef.current = setInterval(async () => {
+        try {
+          const job = await api.getIngestJob(job_id);
+          if (!job.running) {
+            stopPolling();
+            setIsIngesting(false);
+            if (job.error) {
+              toast.error(`Ingestion failed: ${job.error}`);
+            } else {
+              toast.success(
+                `Ingested ${job.articles_ingested} articles (${job.total_chunks_created} chunks)`
+              );
+            }
+          }
+        } catch {
+          // ignore polling errors
+        }
+      }, 3000);
     } catch (err) {
       toast.error(err instanceof Error ? err.message : "Ingestion failed");
-    } finally {
       setIsIngesting(false);
     }
   };
@@ -98,6 +139,7 @@ export default function ArticlesPage() {
           value={sourceFilter}
           onValueChange={(v) => {
             setSourceFilter(v);
+            setCursors([undefined]);
             setPage(1);
           }}
         >
@@ -174,7 +216,7 @@ export default function ArticlesPage() {
         </Table>
       )}
 
-      {totalPages > 1 && (
+      {(page > 1 || nextCursor) && (
         <div className="flex items-center justify-center gap-4">
           <Button
             variant="outline"
@@ -191,8 +233,12 @@ export default function ArticlesPage() {
           <Button
             variant="outline"
             size="sm"
-            onClick={() => setPage((p) => Math.min(totalPages, p + 1))}
-            disabled={page === totalPages}
+            onClick={() => {
+              if (!nextCursor) return;
+              setCursors((c) => [...c.slice(0, page), nextCursor]);
+              setPage((p) => p + 1);
+            }}
+            disabled={!nextCursor}
           >
             Next
             <ChevronRight className="h-4 w-4" />
@@ -28,13 +28,14 @@ export default function DashboardPage() {
   const fetchData = async () => {
     try {
       setIsLoading(true);
-      const [sourcesData, articlesData] = await Promise.all([
+      const [sourcesData, articlesData, countData] = await Promise.all([
         api.listSources(),
-        api.listArticles({ page: 1, per_page: 5 }),
+        api.listArticles({ per_page: 5 }),
+        api.countArticles({ estimate: true }),
       ]);
       setSources(sourcesData);
       setArticles(articlesData.items);
-      setTotalArticles(articlesData.total);
+      setTotalArticles(countData.total);
     } catch (err) {
       toast.error(err instanceof Error ? err.message : "Failed to load data");
     } finally {
@@ -37,55 +37,65 @@ export function SourceTable({ sources, onRefresh }: SourceTableProps) {
   const [editingSource, setEditingSource] = useState<SourceResponse | null>(null);
   const [deletingSource, setDeletingSource] = useState<SourceResponse | null>(null);
   const [collectingIds, setCollectingIds] = useState<Set<string>>(new Set());
-  const pollRefs = useRef<Map<string, ReturnType<typeof setInterval>>>(new Map());
+  // One poll for every source being collected, rather than one per source
+  const pollRef = useRef<ReturnType<typeof setInterval> | null>(null);
+  const pollingIds = useRef<Set<string>>(new Set());
 
-  const stopPolling = useCallback((sourceId: string) => {
-    const interval = pollRefs.current.get(sourceId);
-    if (interval) {
-      clearInterval(interval);
-      pollRefs.current.delete(sourceId);
+  const stopPolling = useCallback(() => {
+    if (pollRef.current) {
+      clearInterval(pollRef.current);
+      pollRef.current = null;
     }
   }, []);
 
-  const stopAllPolling = useCallback(() => {
-    pollRefs.current.forEach((interval) => clearInterval(interval));
-    pollRefs.current.clear();
-  }, []);
-
-  // Clean up all polling on unmount
+  // Clean up polling on unmount
   useEffect(() => {
-    return stopAllPolling;
-  }, [stopAllPolling]);
+    return stopPolling;
+  }, [stopPolling]);
+
+  const poll = useCallback(async () => {
+    const ids = [...pollingIds.current];
+    if (ids.length === 0) {
+      stopPolling();
+      return;
+    }
+    try {
+      const statuses = await api.getSourceCollectionStatuses(ids);
+      let finished = false;
+      for (const sourceId of ids) {
+        const status = statuses[sourceId];
+        if (!status || status.running) continue;
+
+        finished = true;
+        pollingIds.current.delete(sourceId);
+        setCollectingIds((prev) => {
+          const next = new Set(prev);
+          next.delete(sourceId);
+          return next;
+        });
+        if (status.error) {
+          toast.error(`Collection failed: ${status.error}`);
+        } else if (status.result) {
+          toast.success(
+            `Collected ${status.result.new} new articles from ${status.result.source}`
+          );
+        }
+      }
+      if (pollingIds.current.size === 0) stopPolling();
+      if (finished) onRefresh();
+    } catch {
+      // ignore polling errors
+    }
+  }, [stopPolling, onRefresh]);
 
   const startPolling = useCallback(
     (sourceId: string) => {
-      stopPolling(sourceId);
-      const interval = setInterval(async () => {
-        try {
-          const status = await api.getSourceCollectionStatus(sourceId);
-          if (!status.running) {
-            stopPolling(sourceId);
-            setCollectingIds((prev) => {
-              const next = new Set(prev);
-              next.delete(sourceId);
-              return next;
-            });
-            if (status.error) {
-              toast.error(`Collection failed: ${status.error}`);
-            } else if (status.result) {
-              toast.success(
-                `Collected ${status.result.new} new articles from ${status.result.source}`
-              );
-            }
-            onRefresh();
-          }
-        } catch {
-          // ignore polling errors
-        }
-      }, 3000);
-      pollRefs.current.set(sourceId, interval);
+      pollingIds.current.add(sourceId);
+      if (!pollRef.current) {
+        pollRef.current = setInterval(poll, 3000);
+      }
     },
-    [stopPolling, onRefresh]
+    [poll]
   );
 
   const handleUpdate = async (data: SourceCreate) => {
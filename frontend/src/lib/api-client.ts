@@ -9,12 +9,14 @@ import type {
   SourceUpdate,
   ArticleResponse,
   ArticleListResponse,
+  ArticleCountResponse,
   BriefingResponse,
   CollectionStatus,
   SourceCollectionStatus,
   SummarizeResponse,
   IngestResponse,
   IngestAllResponse,
+  IngestJobStatus,
 } from "@/types/api";
 
 const API_BASE = process.env.NEXT_PUBLIC_API_URL || "http://localhost:8000";
@@ -155,12 +157,12 @@ export async function deleteSource(id: string): Promise<void> {
 
 // === Articles ===
 export async function listArticles(params?: {
-  page?: number;
+  cursor?: string;
   per_page?: number;
   source_id?: string;
 }): Promise<ArticleListResponse> {
   const searchParams = new URLSearchParams();
-  if (params?.page !== undefined) searchParams.set("page", String(params.page));
+  if (params?.cursor) searchParams.set("cursor", params.cursor);
   if (params?.per_page !== undefined)
     searchParams.set("per_page", String(params.per_page));
   if (params?.source_id) searchParams.set("source_id", params.source_id);
@@ -168,6 +170,17 @@ export async function listArticles(params?: {
   return request<ArticleListResponse>(`/articles/${qs ? `?${qs}` : ""}`);
 }
 
+export async function countArticles(params?: {
+  source_id?: string;
+  estimate?: boolean;
+}): Promise<ArticleCountResponse> {
+  const searchParams = new URLSearchParams();
+  if (params?.source_id) searchParams.set("source_id", params.source_id);
+  if (params?.estimate) searchParams.set("estimate", "true");
+  const qs = searchParams.toString();
+  return request<ArticleCountResponse>(`/articles/count${qs ? `?${qs}` : ""}`);
+}
+
 export async function getArticle(id: string): Promise<ArticleResponse> {
   return request<ArticleResponse>(`/articles/${id}`);
 }
@@ -190,6 +203,10 @@ export async function ingestAllArticles(): Promise<IngestAllResponse> {
   return request<IngestAllResponse>("/articles/ingest-all", { method: "POST" });
 }
 
+export async function getIngestJob(jobId: string): Promise<IngestJobStatus> {
+  return request<IngestJobStatus>(`/articles/ingest-jobs/${jobId}`);
+}
+
 // === Collection ===
 export async function collectAll(): Promise<{ message: string; status: string }> {
   return request<{ message: string; status: string }>("/collection/collect-all", {
@@ -211,6 +228,16 @@ export async function getSourceCollectionStatus(id: string): Promise<SourceColle
   return request<SourceCollectionStatus>(`/collection/status/${id}`);
 }
 
+export async function getSourceCollectionStatuses(
+  ids: string[]
+): Promise<Record<string, SourceCollectionStatus>> {
+  const searchParams = new URLSearchParams();
+  ids.forEach((id) => searchParams.append("source_id", id));
+  return request<Record<string, SourceCollectionStatus>>(
+    `/collection/status/bulk?${searchParams.toString()}`
+  );
+}
+
 // === Intelligence ===
 export async function createBriefing(query: string): Promise<BriefingResponse> {
   return request<BriefingResponse>("/intelligence/briefing", {
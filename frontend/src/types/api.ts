@@ -78,9 +78,14 @@ export interface ArticleResponse {
 
 export interface ArticleListResponse {
   items: ArticleResponse[];
-  total: number;
-  page: number;
   per_page: number;
+  next_cursor: string | null;
+  has_more: boolean;
+}
+
+export interface ArticleCountResponse {
+  total: number;
+  estimated: boolean;
 }
 
 // === Intelligence ===
@@ -136,8 +141,20 @@ export interface IngestResponse {
 }
 
 export interface IngestAllResponse {
+  message: string;
   status: string;
+  job_id: string;
+  status_url: string;
+}
+
+export interface IngestJobStatus {
+  job_id: string;
+  running: boolean;
+  started_at: string | null;
+  finished_at: string | null;
+  articles_total: number;
   articles_ingested: number;
   articles_failed: number;
   total_chunks_created: number;
+  error: string | null;
 }
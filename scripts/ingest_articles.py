@@ -13,44 +13,75 @@ Usage:
 
     # Ingest a specific article by ID
     python scripts/ingest_articles.py --article-id <uuid>
+
+    # Upsert over gRPC instead of REST (needs Qdrant's gRPC port, 6334)
+    QDRANT_PREFER_GRPC=true python scripts/ingest_articles.py
 """
 
 import argparse
 import asyncio
 import sys
+import uuid
 from pathlib import Path
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from sqlalchemy import select
+from sqlalchemy import func, select
+from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from tqdm import tqdm
 
 from src.api.core.config import settings
 from src.api.models import Article
+from src.api.models.article import HAS_CONTENT
 from src.rag.retriever import rag_retriever
 
+# Use SQLite for local dev, or your configured DATABASE_URL
+DB_URL = settings.DATABASE_URL or "sqlite+aiosqlite:///./newsminds.db"
+
+# One engine (and connection pool) shared by every session in this process.
+# No connection is opened until the first query.
+engine = create_async_engine(DB_URL, pool_pre_ping=True)
+async_session = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+
 
 async def get_db_session() -> AsyncSession:
-    """Create a database session."""
-    # Use SQLite for local dev, or your configured DATABASE_URL
-    db_url = settings.DATABASE_URL or "sqlite+aiosqlite:///./newsminds.db"
-    engine = create_async_engine(db_url)
-    async_session = async_sessionmaker(engine, class_=AsyncSession)
+    """Create a database session from the shared engine."""
     return async_session()
 
 
-async def ingest_article(article: Article) -> int:
-    """
-    Ingest a single article into the vector store.
+async def run(coro) -> None:
+    """Run a command, then close pooled connections before the loop exits."""
+    try:
+        await coro
+    finally:
+        await engine.dispose()
 
-    Returns the number of chunks created.
-    """
-    # Skip articles without content
-    if not article.content:
-        print(f"  Skipping {article.id} - no content")
-        return 0
 
+# Number of articles to chunk, embed, and upsert together
+INGEST_BATCH_SIZE = 128
+
+# Number of rows fetched per round trip when streaming articles
+STREAM_BATCH_SIZE = 500
+
+# Max batches fetched ahead of the embedding step
+QUEUE_SIZE = 4
+
+# Only the columns needed for ingestion (skips ORM object construction)
+INGEST_COLUMNS = (
+    Article.id,
+    Article.source_id,
+    Article.title,
+    Article.url,
+    Article.author,
+    Article.content,
+    Article.published_at,
+)
+
+
+def build_metadata(article: Article | Row) -> dict:
+    """Build the vector store metadata for an article."""
     # Build metadata for retrieval filtering
     metadata = {
         "article_id": str(article.id),
@@ -64,34 +95,102 @@ async def ingest_article(article: Article) -> int:
     if article.published_at:
         metadata["published_at"] = article.published_at.isoformat()
 
+    return metadata
+
+
+async def ingest_article(article: Article | Row) -> int:
+    """
+    Ingest a single article into the vector store.
+
+    Returns the number of chunks created.
+    """
+    # Skip articles without content
+    if not article.content:
+        print(f"  Skipping {article.id} - no content")
+        return 0
+
     # Ingest into vector store
     num_chunks = rag_retriever.ingest_document(
         text=article.content,
-        metadata=metadata,
+        metadata=build_metadata(article),
         chunk_size=500,
     )
 
     return num_chunks
 
 
+async def ingest_batch(articles: list[Article | Row]) -> int:
+    """
+    Ingest a batch of articles with one embedding pass and one upsert.
+
+    Articles without content are skipped silently (the full ingest already
+    filters them out in SQL). Returns the number of chunks created.
+    """
+    with_content = [article for article in articles if article.content]
+
+    if not with_content:
+        return 0
+
+    # Embedding is blocking CPU/GPU work - run it in a thread so the event
+    # loop can keep fetching the next batch from the database meanwhile
+    counts = await asyncio.to_thread(
+        rag_retriever.ingest_documents_batch,
+        texts=[article.content for article in with_content],
+        metadatas=[build_metadata(article) for article in with_content],
+        chunk_size=500,
+    )
+
+    return sum(counts)
+
+
 async def ingest_all_articles():
     """Ingest all articles from the database."""
     print("Starting full article ingestion...")
 
     async with await get_db_session() as session:
-        result = await session.execute(select(Article))
-        articles = result.scalars().all()
-
-        print(f"Found {len(articles)} articles to ingest")
-
-        total_chunks = 0
-        for i, article in enumerate(articles, 1):
-            print(f"[{i}/{len(articles)}] Ingesting: {article.title[:50]}...")
-            chunks = await ingest_article(article)
-            total_chunks += chunks
-            print(f"  Created {chunks} chunks")
+        total = (
+            await session.execute(select(func.count(Article.id)).where(HAS_CONTENT))
+        ).scalar() or 0
+        print(f"Found {total} articles with content to ingest")
+
+        # Stream plain rows in server-side batches instead of loading every
+        # Article (and its content) into memory up front
+        result = await session.stream(
+            select(*INGEST_COLUMNS)
+            .where(HAS_CONTENT)
+            .execution_options(yield_per=STREAM_BATCH_SIZE)
+        )
 
-        print(f"\nDone! Ingested {len(articles)} articles into {total_chunks} chunks")
+        # Bounded queue between the DB reader and the embed/upsert worker, so
+        # fetching the next batch overlaps with embedding the current one
+        queue: asyncio.Queue[list[Row] | None] = asyncio.Queue(maxsize=QUEUE_SIZE)
+
+        async def produce() -> None:
+            async for batch in result.partitions(INGEST_BATCH_SIZE):
+                await queue.put(batch)
+            await queue.put(None)  # No more batches
+
+        async def consume() -> tuple[int, int]:
+            total_chunks = 0
+            done = 0
+            # One in-place progress bar (rate-limited redraws) instead of
+            # printing a couple of lines for every batch
+            with tqdm(total=total, unit="article", desc="Ingesting") as progress:
+                while (batch := await queue.get()) is not None:
+                    total_chunks += await ingest_batch(batch)
+                    done += len(batch)
+                    progress.update(len(batch))
+                    progress.set_postfix(chunks=total_chunks, refresh=False)
+            return done, total_chunks
+
+        # TaskGroup cancels the producer if the consumer fails (and vice
+        # versa), so a full queue can never leave it blocked
+        async with asyncio.TaskGroup() as tg:
+            tg.create_task(produce())
+            consumer = tg.create_task(consume())
+
+        done, total_chunks = consumer.result()
+        print(f"\nDone! Ingested {done} articles into {total_chunks} chunks")
 
 
 async def ingest_single_article(article_id: str):
@@ -99,8 +198,11 @@ async def ingest_single_article(article_id: str):
     print(f"Ingesting article {article_id}...")
 
     async with await get_db_session() as session:
-        result = await session.execute(select(Article).where(Article.id == article_id))
-        article = result.scalar_one_or_none()
+        # Plain row with just the ingest columns - no ORM instance needed
+        result = await session.execute(
+            select(*INGEST_COLUMNS).where(Article.id == uuid.UUID(article_id))
+        )
+        article = result.one_or_none()
 
         if not article:
             print(f"Article not found: {article_id}")
@@ -176,21 +278,25 @@ async def ingest_sample_data():
         },
     ]
 
-    total_chunks = 0
-    for i, article in enumerate(sample_articles, 1):
-        print(f"[{i}/{len(sample_articles)}] Ingesting: {article['title']}...")
-
-        chunks = rag_retriever.ingest_document(
-            text=article["content"],
-            metadata={
+    # The articles are independent, so embed and upsert them all together
+    # (in a worker thread) rather than one after another
+    counts = await asyncio.to_thread(
+        rag_retriever.ingest_documents_batch,
+        texts=[article["content"] for article in sample_articles],
+        metadatas=[
+            {
                 "title": article["title"],
                 "source": article["source"],
                 "article_id": f"sample-{i}",
-            },
-            chunk_size=500,
-        )
-        total_chunks += chunks
-        print(f"  Created {chunks} chunks")
+            }
+            for i, article in enumerate(sample_articles, 1)
+        ],
+        chunk_size=500,
+    )
+
+    for i, (article, chunks) in enumerate(zip(sample_articles, counts, strict=True), 1):
+        print(f"[{i}/{len(sample_articles)}] {article['title']}: {chunks} chunks")
+    total_chunks = sum(counts)
 
     print(
         f"\nDone! Ingested {len(sample_articles)} sample articles into {total_chunks} chunks"
@@ -203,12 +309,17 @@ def main():
     parser.add_argument("--sample", action="store_true", help="Ingest sample test data")
     args = parser.parse_args()
 
+    # Load the embedding model and open the collection before ingesting, so
+    # the first batch isn't stuck behind a model download/load
+    print("Preparing embedding model and vector store...")
+    rag_retriever.ensure_ready()
+
     if args.sample:
-        asyncio.run(ingest_sample_data())
+        asyncio.run(run(ingest_sample_data()))
     elif args.article_id:
-        asyncio.run(ingest_single_article(args.article_id))
+        asyncio.run(run(ingest_single_article(args.article_id)))
     else:
-        asyncio.run(ingest_all_articles())
+        asyncio.run(run(ingest_all_articles()))
 
 
 if __name__ == "__main__":
@@ -19,14 +19,18 @@ Usage:
 import asyncio
 import os
 import sys
+from collections.abc import Mapping
+from types import MappingProxyType
 
 # Add project root to path so we can import our modules
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
-from sqlalchemy.orm import sessionmaker
+from sqlalchemy import bindparam, text
+from sqlalchemy.dialects.postgresql import insert as postgresql_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from src.api.models.base import new_id
 from src.api.models.source import Source
 
 # ---------------------------------------------------------------------------
@@ -34,7 +38,7 @@ from src.api.models.source import Source
 # ---------------------------------------------------------------------------
 # Each entry: (name, url, description, source_type, source_config)
 
-DEFAULT_SOURCES = [
+_SOURCES = (
     # --- Wire Services & Global News ---
     (
         "Reuters",
@@ -366,7 +370,87 @@ DEFAULT_SOURCES = [
         "newsapi",
         {"query": "cryptocurrency OR bitcoin OR ethereum OR web3", "language": "en"},
     ),
-]
+)
+
+# Immutable module-level constant: a tuple of tuples with read-only configs,
+# built once at import and safe to share with any importer
+DEFAULT_SOURCES: tuple[tuple[str, str, str, str, Mapping[str, str]], ...] = tuple(
+    (name, url, description, source_type, MappingProxyType(source_config))
+    for name, url, description, source_type, source_config in _SOURCES
+)
+
+
+def _source_rows(dialect_name: str) -> list[dict]:
+    """Convert DEFAULT_SOURCES into insert parameter dicts."""
+    return [
+        {
+            "id": new_id(dialect_name),
+            "name": name,
+            "url": url,
+            "description": description,
+            "source_type": source_type,
+            "source_config": dict(source_config),
+            "is_active": True,
+        }
+        for name, url, description, source_type, source_config in DEFAULT_SOURCES
+    ]
+
+
+async def _insert_missing(session: AsyncSession, rows: list[dict]) -> set[str]:
+    """
+    Insert rows whose name doesn't exist yet, in a single statement.
+
+    Uses the dialect's native upsert so the existence check happens
+    atomically on the server:
+    - SQLite / PostgreSQL: INSERT ... ON CONFLICT (name) DO NOTHING
+    - SQL Server: MERGE ... WHEN NOT MATCHED THEN INSERT
+
+    Only the candidate names are compared against the unique index, so
+    the cost scales with len(rows), not with the size of the table.
+
+    Returns the names that were actually inserted.
+    """
+    dialect = session.bind.dialect.name
+
+    if dialect in ("sqlite", "postgresql"):
+        insert = sqlite_insert if dialect == "sqlite" else postgresql_insert
+        stmt = (
+            insert(Source)
+            .on_conflict_do_nothing(index_elements=["name"])
+            .returning(Source.name)
+        )
+        result = await session.execute(stmt, rows)
+        return set(result.scalars().all())
+
+    if dialect == "mssql":
+        table = Source.__table__
+        columns = list(rows[0])
+        params = []
+        values = []
+        for i, row in enumerate(rows):
+            names = [f"{col}_{i}" for col in columns]
+            params.extend(
+                bindparam(name, row[col], type_=table.c[col].type)
+                for name, col in zip(names, columns, strict=True)
+            )
+            values.append("(" + ", ".join(f":{name}" for name in names) + ")")
+
+        column_list = ", ".join(columns)
+        stmt = text(
+            f"""
+            MERGE INTO sources AS target
+            USING (VALUES {", ".join(values)}) AS src ({column_list})
+            ON target.name = src.name
+            WHEN NOT MATCHED THEN
+                INSERT ({column_list})
+                VALUES ({", ".join(f"src.{col}" for col in columns)})
+            OUTPUT inserted.name;
+            """
+        ).bindparams(*params)
+        result = await session.execute(stmt)
+        return set(result.scalars().all())
+
+    raise ValueError(f"Unsupported database dialect: {dialect}")
 
 
 async def seed_sources():
@@ -380,38 +464,23 @@ async def seed_sources():
         sys.exit(1)
 
     engine = create_async_engine(database_url, echo=False)
-    async_session = sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async_session = async_sessionmaker(engine, expire_on_commit=False)
 
     async with async_session() as session:
-        # Get existing source names to avoid duplicates
-        result = await session.execute(select(Source.name))
-        existing_names = {row[0] for row in result.fetchall()}
-
-        created = 0
-        skipped = 0
-
-        for name, url, description, source_type, source_config in DEFAULT_SOURCES:
-            if name in existing_names:
-                print(f"  SKIP  {name} (already exists)")
-                skipped += 1
-                continue
-
-            source = Source(
-                name=name,
-                url=url,
-                description=description,
-                source_type=source_type,
-                source_config=source_config,
-                is_active=True,
-            )
-            session.add(source)
-            print(f"  ADD   {name} ({source_type})")
-            created += 1
-
+        rows = _source_rows(engine.dialect.name)
+        inserted = await _insert_missing(session, rows)
         await session.commit()
 
     await engine.dispose()
 
+    for row in rows:
+        if row["name"] in inserted:
+            print(f"  ADD   {row['name']} ({row['source_type']})")
+        else:
+            print(f"  SKIP  {row['name']} (already exists)")
+
+    created = len(inserted)
+    skipped = len(rows) - created
     print(f"\nDone! Created {created} sources, skipped {skipped} existing.")
 
 
@@ -1,6 +1,14 @@
 """NewsMinds AI Agents - LangGraph-based intelligent agents."""
 
-from src.agents.intelligence_agent import get_intelligence_briefing
-from src.agents.research_agent import research_agent
+from src.agents.intelligence_agent import (
+    get_intelligence_briefing,
+    get_intelligence_briefings,
+)
+from src.agents.research_agent import get_research_agent, research
 
-__all__ = ["get_intelligence_briefing", "research_agent"]
+__all__ = [
+    "get_intelligence_briefing",
+    "get_intelligence_briefings",
+    "get_research_agent",
+    "research",
+]
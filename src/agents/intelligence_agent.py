@@ -7,36 +7,49 @@ This agent combines:
 - LLM reasoning for deciding what to do
 """
 
+import asyncio
+import functools
+import json
+import logging
+import re
+from collections.abc import AsyncIterator
 from typing import Annotated, TypedDict
 
+import numpy as np
 from langgraph.graph import END, StateGraph
 from langgraph.graph.message import add_messages
-from openai import OpenAI
 
+from src.agents import llm
+from src.agents.llm import chat, chat_stream
+from src.agents.semcache import SemanticCache
+from src.agents.tokens import fit_tokens, source_budget
 from src.api.core.config import settings
+from src.collection.adapters.newsapi_adapter import fetch_newsapi_articles
+from src.rag.embeddings import embedding_service
 from src.rag.retriever import rag_retriever
 
-# Lazy-load OpenAI client to allow app startup without API key
-_openai_client = None
-
-
-def _get_openai_client() -> OpenAI:
-    global _openai_client
-    if _openai_client is None:
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY is not configured")
-        _openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    return _openai_client
-
-
-def chat(messages: list[dict], max_tokens: int = 1000) -> str:
-    """Helper to call ChatGPT."""
-    response = _get_openai_client().chat.completions.create(
-        model=settings.OPENAI_MODEL,
-        max_tokens=max_tokens,
-        messages=messages,
-    )
-    return response.choices[0].message.content
+# Similarity caches for query-level steps (see semcache.py)
+_plan_cache = SemanticCache(
+    embed=embedding_service.embed_query,
+    threshold=settings.AGENT_CACHE_SIMILARITY,
+    max_entries=settings.AGENT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AGENT_CACHE_TTL_SECONDS,
+    enabled=settings.AGENT_CACHE_ENABLED,
+)
+_retrieval_cache = SemanticCache(
+    embed=embedding_service.embed_query,
+    threshold=settings.AGENT_CACHE_SIMILARITY,
+    max_entries=settings.AGENT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AGENT_CACHE_TTL_SECONDS,
+    enabled=settings.AGENT_CACHE_ENABLED,
+)
+# thread_id -> sources of the thread's last search and the query that ran
+# it, so follow-ups on the same topic skip the searches
+_sessions = SemanticCache(
+    max_entries=settings.AGENT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AGENT_CACHE_TTL_SECONDS,
+    enabled=settings.AGENT_CACHE_ENABLED,
+)
 
 
 class IntelligenceState(TypedDict):
@@ -63,36 +76,82 @@ class IntelligenceState(TypedDict):
     iteration: int
 
 
-def plan_search(state: IntelligenceState) -> dict:
-    """
-    Node: Use LLM to plan the search strategy.
+# Queries about recent events go straight to external sources
+RECENCY_PATTERN = re.compile(
+    r"\b(today|tonight|yesterday|latest|breaking|right now|this week)\b",
+    re.IGNORECASE,
+)
 
-    The LLM decides whether to search internal docs, external sources, or both.
-    """
-    query = state["query"]
+# Queries this short carry too little signal to plan on - search everything
+SHORT_QUERY_WORDS = 3
 
-    response = chat(
-        max_tokens=1000,
-        messages=[
-            {
-                "role": "user",
-                "content": f"""For the query: "{query}"
 
-Should I search:
+# Invariant instructions go in the system message, ahead of anything
+# query-specific, so repeated calls share a prompt prefix (which OpenAI's
+# prompt caching can reuse)
+PLAN_PROMPT = """For the user's query, should I search:
 1. INTERNAL - Our indexed articles only
 2. EXTERNAL - External news APIs only
 3. BOTH - Both internal and external sources
 
 Consider: Is this about recent events (external), our historical data (internal), or needs comprehensive coverage (both)?
 
-Reply with only: INTERNAL, EXTERNAL, or BOTH""",
-            }
+Reply with only: INTERNAL, EXTERNAL, or BOTH"""
+
+
+def local_search_strategy(query: str) -> str | None:
+    """
+    Pick a search strategy without the LLM when the query makes it obvious.
+
+    Returns None when the LLM should decide.
+    """
+    if RECENCY_PATTERN.search(query):
+        return "EXTERNAL"
+    if len(query.split()) <= SHORT_QUERY_WORDS:
+        return "BOTH"
+    return None
+
+
+async def plan_search(state: IntelligenceState) -> dict:
+    """
+    Node: Use LLM to plan the search strategy.
+
+    The LLM decides whether to search internal docs, external sources, or both.
+    Obvious cases are decided locally to save a round trip.
+    """
+    query = state["query"]
+
+    strategy = local_search_strategy(query)
+    if strategy:
+        return {
+            "search_strategy": strategy,
+            "messages": [
+                {"role": "assistant", "content": f"Search strategy: {strategy}"}
+            ],
+        }
+
+    # A similar query was planned recently - reuse its strategy
+    cached, vector = await asyncio.to_thread(_plan_cache.get_similar, query)
+    if cached is not None:
+        return {
+            "search_strategy": cached,
+            "messages": [
+                {"role": "assistant", "content": f"Search strategy: {cached}"}
+            ],
+        }
+
+    response = await chat(
+        max_tokens=20,  # One-word answer
+        messages=[
+            {"role": "system", "content": PLAN_PROMPT},
+            {"role": "user", "content": f'Query: "{query}"'},
         ],
     )
 
     strategy = response.strip().upper()
     if strategy not in ["INTERNAL", "EXTERNAL", "BOTH"]:
         strategy = "BOTH"
+    _plan_cache.set_similar(query, strategy, vector)
 
     return {
         "search_strategy": strategy,
@@ -100,8 +159,13 @@ Reply with only: INTERNAL, EXTERNAL, or BOTH""",
     }
 
 
-def search_internal(state: IntelligenceState) -> dict:
-    """Node: Search internal RAG database."""
+async def search_internal(state: IntelligenceState) -> dict:
+    """
+    Node: Search internal RAG database.
+
+    Runs alongside search_external, so the blocking Qdrant lookup
+    goes to a worker thread to keep the event loop free.
+    """
     if state["search_strategy"] == "EXTERNAL":
         return {"internal_docs": []}
 
@@ -109,11 +173,12 @@ def search_internal(state: IntelligenceState) -> dict:
 
     # Try to search, but gracefully handle if Qdrant is unavailable
     try:
-        docs = rag_retriever.retrieve(query, limit=10)
+        docs, vector = await asyncio.to_thread(_retrieval_cache.get_similar, query)
+        if docs is None:
+            docs = await asyncio.to_thread(rag_retriever.retrieve, query, limit=10)
+            _retrieval_cache.set_similar(query, docs, vector)
     except Exception as e:
         # Qdrant not available - continue without internal docs
-        import logging
-
         logging.warning(f"RAG retrieval failed (Qdrant may not be configured): {e}")
         docs = []
 
@@ -133,16 +198,12 @@ async def search_external(state: IntelligenceState) -> dict:
     query = state["query"]
 
     # Use NewsAPI adapter directly for real-time search
-    from src.collection.adapters.newsapi_adapter import fetch_newsapi_articles
-
     try:
         articles = await fetch_newsapi_articles(
             query=query,
             max_articles=5,
         )
     except Exception as e:
-        import logging
-
         logging.warning(f"External search failed: {e}")
         articles = []
 
@@ -165,174 +226,160 @@ async def search_external(state: IntelligenceState) -> dict:
     }
 
 
-def analyze_sources(state: IntelligenceState) -> dict:
+# Structured output for analyze_and_brief: facts, contradictions and the
+# briefing come back from one call, so the sources are only read once
+BRIEFING_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "intelligence_briefing",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "key_facts": {"type": "array", "items": {"type": "string"}},
+                "contradictions": {"type": "array", "items": {"type": "string"}},
+                "briefing": {"type": "string"},
+            },
+            "required": ["key_facts", "contradictions", "briefing"],
+            "additionalProperties": False,
+        },
+    },
+}
+
+
+def combine_sources(state: IntelligenceState, reply_tokens: int) -> str:
     """
-    Node: Analyze all sources, extract facts, find contradictions.
+    Format the retrieved internal and external sources for a prompt.
 
-    This is deep LLM reasoning over the retrieved content.
+    Truncated so the prompt plus a reply of reply_tokens fits the model
+    context window.
     """
-    internal = state.get("internal_docs", [])
-    external = state.get("external_articles", [])
-    query = state["query"]
-
-    # Combine all sources
     all_content = []
-    for doc in internal:
+    for doc in state.get("internal_docs", []):
         all_content.append(f"[Internal] {doc.get('text', '')}")
-    for article in external:
+    for article in state.get("external_articles", []):
         all_content.append(f"[External] {article.get('summary', '')}")
 
     if not all_content:
-        return {
-            "key_facts": [],
-            "contradictions": [],
-        }
+        return "No sources found"
+    return fit_tokens("\n\n".join(all_content), source_budget(reply_tokens))
 
-    combined = "\n\n".join(all_content)
 
-    response = chat(
-        max_tokens=1500,
-        messages=[
-            {
-                "role": "user",
-                "content": f"""Analyze these sources regarding: "{query}"
-
-Sources:
-{combined}
+ANALYSIS_PROMPT = """Analyze the sources the user provides regarding their query.
 
 Provide:
-1. KEY_FACTS: List the most important facts (bullet points)
-2. CONTRADICTIONS: Any conflicting information between sources
+1. key_facts: The most important facts, one per item
+2. contradictions: Any conflicting information between sources (empty list if none)
+3. briefing: An executive intelligence briefing formatted with:
+   - SUMMARY (2-3 sentences)
+   - KEY FINDINGS (bullet points)
+   - UNCERTAINTIES (if any)
+   - RECOMMENDED ACTIONS (if applicable)
 
-Format:
-KEY_FACTS:
-- fact 1
-- fact 2
+Keep the briefing concise and actionable."""
 
-CONTRADICTIONS:
-- contradiction 1 (or "None found" if none)""",
-            }
+
+async def analyze_and_brief(state: IntelligenceState) -> dict:
+    """
+    Node: Analyze all sources and write the briefing in one LLM call.
+
+    Extracts key facts, finds contradictions, and generates the executive
+    briefing from the same prompt, using structured output so the result
+    can be loaded straight into state.
+    """
+    query = state["query"]
+    combined = combine_sources(state, reply_tokens=2500)
+
+    response = await chat(
+        max_tokens=2500,
+        response_format=BRIEFING_SCHEMA,
+        messages=[
+            {"role": "system", "content": ANALYSIS_PROMPT},
+            {"role": "user", "content": f'Query: "{query}"\n\nSources:\n{combined}'},
         ],
     )
 
-    text = response
-
-    # Parse response
-    facts = []
-    contradictions = []
-    current_section = None
-
-    for line in text.split("\n"):
-        line = line.strip()
-        if "KEY_FACTS:" in line:
-            current_section = "facts"
-        elif "CONTRADICTIONS:" in line:
-            current_section = "contradictions"
-        elif line.startswith("- ") and current_section:
-            content = line[2:].strip()
-            if current_section == "facts":
-                facts.append(content)
-            else:
-                if "none" not in content.lower():
-                    contradictions.append(content)
+    try:
+        result = json.loads(response)
+    except (TypeError, json.JSONDecodeError):
+        # Model ignored the schema - keep its text as the briefing
+        result = {"key_facts": [], "contradictions": [], "briefing": response}
+
+    facts = result.get("key_facts", [])
+    contradictions = result.get("contradictions", [])
+    briefing = result.get("briefing")
 
     return {
         "key_facts": facts,
         "contradictions": contradictions,
+        "briefing": briefing,
         "messages": [
             {
                 "role": "assistant",
                 "content": f"Analyzed: {len(facts)} facts, {len(contradictions)} contradictions",
-            }
+            },
+            {"role": "assistant", "content": briefing},
         ],
     }
 
 
-def generate_briefing(state: IntelligenceState) -> dict:
+def build_intelligence_agent(with_briefing: bool = True) -> StateGraph:
     """
-    Node: Generate the final intelligence briefing.
-    """
-    facts = state.get("key_facts", [])
-    contradictions = state.get("contradictions", [])
-    query = state["query"]
-
-    facts_text = "\n".join(f"- {f}" for f in facts) if facts else "No facts extracted"
-    contradictions_text = (
-        "\n".join(f"- {c}" for c in contradictions) if contradictions else "None"
-    )
-
-    response = chat(
-        max_tokens=1500,
-        messages=[
-            {
-                "role": "user",
-                "content": f"""Create an executive intelligence briefing for: "{query}"
-
-Key Facts:
-{facts_text}
-
-Contradictions/Uncertainties:
-{contradictions_text}
-
-Format the briefing with:
-1. SUMMARY (2-3 sentences)
-2. KEY FINDINGS (bullet points)
-3. UNCERTAINTIES (if any)
-4. RECOMMENDED ACTIONS (if applicable)
-
-Keep it concise and actionable.""",
-            }
-        ],
-    )
-
-    briefing = response
-
-    return {
-        "briefing": briefing,
-        "messages": [{"role": "assistant", "content": briefing}],
-    }
-
+    Build the complete Intelligence Agent graph.
 
-def build_intelligence_agent() -> StateGraph:
-    """Build the complete Intelligence Agent graph."""
+    With with_briefing=False the graph stops after the searches, so the
+    briefing can be streamed outside LangGraph (see
+    stream_intelligence_briefing).
+    """
     graph = StateGraph(IntelligenceState)
 
     # Add nodes
     graph.add_node("plan_search", plan_search)
     graph.add_node("search_internal", search_internal)
     graph.add_node("search_external", search_external)
-    graph.add_node("analyze_sources", analyze_sources)
-    graph.add_node("generate_briefing", generate_briefing)
 
     # Define flow
     graph.set_entry_point("plan_search")
 
-    # After planning, do both searches in parallel conceptually
-    # (LangGraph will handle this)
+    # After planning, fan out to both searches so they run concurrently.
+    # They write different state keys, so no reducer is needed to merge
+    # them; analyze_and_brief runs once both have finished.
     graph.add_edge("plan_search", "search_internal")
-    graph.add_edge("search_internal", "search_external")
-    graph.add_edge("search_external", "analyze_sources")
-    graph.add_edge("analyze_sources", "generate_briefing")
-    graph.add_edge("generate_briefing", END)
+    graph.add_edge("plan_search", "search_external")
 
-    return graph.compile()
+    if not with_briefing:
+        graph.add_edge("search_internal", END)
+        graph.add_edge("search_external", END)
+        return graph.compile()
 
+    graph.add_node("analyze_and_brief", analyze_and_brief)
+    graph.add_edge("search_internal", "analyze_and_brief")
+    graph.add_edge("search_external", "analyze_and_brief")
+    graph.add_edge("analyze_and_brief", END)
 
-# Create the agent
-intelligence_agent = build_intelligence_agent()
+    return graph.compile()
 
 
-async def get_intelligence_briefing(query: str) -> str:
+@functools.cache
+def get_intelligence_agent() -> StateGraph:
     """
-    Get an intelligence briefing on any topic.
+    The compiled Intelligence Agent, shared by every request.
 
-    Args:
-        query: What to research
-
-    Returns:
-        Executive briefing
+    Compiled on first use rather than at import, so workers and test
+    runs that never produce a briefing don't pay for building the graph.
     """
-    initial_state = {
+    return build_intelligence_agent()
+
+
+@functools.cache
+def get_search_agent() -> StateGraph:
+    """Same planning and searches, without the final LLM node (for streaming)."""
+    return build_intelligence_agent(with_briefing=False)
+
+
+def initial_state(query: str) -> IntelligenceState:
+    """Empty agent state for a new query."""
+    return {
         "messages": [],
         "query": query,
         "internal_docs": [],
@@ -344,5 +391,158 @@ async def get_intelligence_briefing(query: str) -> str:
         "iteration": 0,
     }
 
-    final_state = await intelligence_agent.ainvoke(initial_state)
-    return final_state["briefing"]
+
+def _query_vector(query: str) -> np.ndarray | None:
+    """Unit-length embedding of a query (None if the model is unavailable)."""
+    try:
+        vector = np.asarray(embedding_service.embed_query(query), dtype=np.float32)
+    except Exception as e:
+        logging.warning(f"Follow-up embedding failed: {e}")
+        return None
+    norm = np.linalg.norm(vector)
+    return vector / norm if norm else vector
+
+
+async def gather_sources(query: str, thread_id: str | None = None) -> IntelligenceState:
+    """
+    Plan and run the searches for a query.
+
+    In a thread, a follow-up whose embedding is within
+    AGENT_FOLLOWUP_SIMILARITY of the query that last searched is given
+    that query's sources instead of searching again. Only the sources
+    are kept per thread, not the rest of the agent state.
+
+    Args:
+        query: What to research
+        thread_id: Conversation the query belongs to (optional)
+
+    Returns:
+        Agent state with internal_docs and external_articles filled in
+    """
+    if thread_id is None:
+        return await get_search_agent().ainvoke(initial_state(query))
+
+    vector = await asyncio.to_thread(_query_vector, query)
+    previous = _sessions.get(thread_id)
+    if (
+        previous is not None
+        and vector is not None
+        and float(previous["vector"] @ vector) >= settings.AGENT_FOLLOWUP_SIMILARITY
+    ):
+        return {
+            **initial_state(query),
+            "internal_docs": previous["internal_docs"],
+            "external_articles": previous["external_articles"],
+        }
+
+    state = await get_search_agent().ainvoke(initial_state(query))
+    if vector is not None:
+        _sessions.set(
+            thread_id,
+            {
+                "vector": vector,
+                "internal_docs": state["internal_docs"],
+                "external_articles": state["external_articles"],
+            },
+        )
+    return state
+
+
+async def get_intelligence_briefing(query: str, thread_id: str | None = None) -> str:
+    """
+    Get an intelligence briefing on any topic.
+
+    With a thread_id, follow-ups on the thread's topic are briefed from
+    the sources already found (see gather_sources); only the analysis
+    runs again, and repeating a question exactly hits the chat cache.
+
+    Args:
+        query: What to research
+        thread_id: Conversation the query belongs to (optional)
+
+    Returns:
+        Executive briefing
+    """
+    if thread_id is None:
+        final_state = await get_intelligence_agent().ainvoke(initial_state(query))
+        return final_state["briefing"]
+
+    state = await gather_sources(query, thread_id)
+    return (await analyze_and_brief(state))["briefing"]
+
+
+BRIEFING_PROMPT = """Create an executive intelligence briefing for the user's query from the sources they provide.
+
+Format the briefing with:
+1. SUMMARY (2-3 sentences)
+2. KEY FINDINGS (bullet points)
+3. UNCERTAINTIES (if any, including contradictions between sources)
+4. RECOMMENDED ACTIONS (if applicable)
+
+Keep it concise and actionable."""
+
+
+async def stream_intelligence_briefing(
+    query: str, thread_id: str | None = None
+) -> AsyncIterator[str]:
+    """
+    Stream an intelligence briefing on any topic.
+
+    Runs the same planning and searches as get_intelligence_briefing
+    before returning, so their failures (and a missing OpenAI key) raise
+    here, while the caller can still answer with an error status. Only
+    the briefing itself is streamed, straight from the sources, so
+    callers see the first words as soon as the model produces them.
+
+    Args:
+        query: What to research
+        thread_id: Conversation the query belongs to (optional)
+
+    Returns:
+        Iterator over pieces of the executive briefing text
+    """
+    state = await gather_sources(query, thread_id)
+    llm.get_openai_client()  # Raises now if OpenAI isn't configured
+
+    return chat_stream(
+        max_tokens=1500,
+        messages=[
+            {"role": "system", "content": BRIEFING_PROMPT},
+            {
+                "role": "user",
+                "content": f'Query: "{query}"\n\n'
+                f"Sources:\n{combine_sources(state, reply_tokens=1500)}",
+            },
+        ],
+    )
+
+
+async def get_intelligence_briefings(
+    queries: list[str],
+    max_concurrent: int | None = None,
+) -> list[str]:
+    """
+    Get intelligence briefings for several topics at once.
+
+    Each query runs through the full agent, but up to max_concurrent of
+    them are in flight together, so a batch takes roughly as long as
+    its slowest few briefings rather than the sum of all of them. The
+    semaphore keeps a large batch from bursting past the OpenAI rate
+    limit (the client also retries 429s with backoff).
+
+    Args:
+        queries: What to research, one briefing per query
+        max_concurrent: Parallel briefings (default AGENT_MAX_CONCURRENT_BRIEFINGS)
+
+    Returns:
+        Executive briefings, in the same order as queries
+    """
+    semaphore = asyncio.Semaphore(
+        max_concurrent or settings.AGENT_MAX_CONCURRENT_BRIEFINGS
+    )
+
+    async def briefing_for(query: str) -> str:
+        async with semaphore:
+            return await get_intelligence_briefing(query)
+
+    return await asyncio.gather(*(briefing_for(query) for query in queries))
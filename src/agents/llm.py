@@ -0,0 +1,96 @@
+"""
+Shared OpenAI access for the agents.
+
+One client, connection pool, concurrency cap and chat cache per process,
+whichever agent makes the call, so OPENAI_MAX_CONCURRENT_REQUESTS bounds
+all of them together.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+import httpx
+from openai import AsyncOpenAI
+
+from src.agents.semcache import SemanticCache, request_key
+from src.api.core.config import settings
+
+# Lazy-load OpenAI client to allow app startup without API key
+_openai_client = None
+
+# Keep-alive pool shared by every call, so concurrent nodes and briefings
+# reuse connections instead of paying a TCP/TLS handshake each time
+OPENAI_HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+# Bound every request, so a stalled call fails (and is retried) instead of
+# hanging its graph node. The SDK retries 429s, 5xx and connection errors
+# with exponential backoff and jitter, honouring Retry-After, without
+# blocking the event loop.
+OPENAI_TIMEOUT = httpx.Timeout(
+    settings.OPENAI_TIMEOUT_SECONDS, connect=settings.OPENAI_CONNECT_TIMEOUT_SECONDS
+)
+
+# Caps in-flight calls so a burst of requests queues here rather than
+# piling up 429s against the OpenAI rate limit
+_openai_semaphore = asyncio.Semaphore(settings.OPENAI_MAX_CONCURRENT_REQUESTS)
+
+# Exact-match cache for chat() (see semcache.py)
+_chat_cache = SemanticCache(
+    max_entries=settings.AGENT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AGENT_CACHE_TTL_SECONDS,
+    enabled=settings.AGENT_CACHE_ENABLED,
+)
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """The shared client (raises ValueError if OPENAI_API_KEY isn't set)."""
+    global _openai_client
+    if _openai_client is None:
+        if not settings.OPENAI_API_KEY:
+            raise ValueError("OPENAI_API_KEY is not configured")
+        _openai_client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY,
+            http_client=httpx.AsyncClient(limits=OPENAI_HTTP_LIMITS),
+            timeout=OPENAI_TIMEOUT,
+            max_retries=settings.OPENAI_MAX_RETRIES,
+        )
+    return _openai_client
+
+
+async def chat(
+    messages: list[dict],
+    max_tokens: int = 1000,
+    response_format: dict | None = None,
+) -> str:
+    """Helper to call ChatGPT without blocking the event loop."""
+    key = request_key(settings.OPENAI_MODEL, messages, max_tokens, response_format)
+    if (cached := _chat_cache.get(key)) is not None:
+        return cached
+
+    kwargs = {"response_format": response_format} if response_format else {}
+    async with _openai_semaphore:
+        response = await get_openai_client().chat.completions.create(
+            model=settings.OPENAI_MODEL,
+            max_tokens=max_tokens,
+            messages=messages,
+            **kwargs,
+        )
+    content = response.choices[0].message.content
+    _chat_cache.set(key, content)
+    return content
+
+
+async def chat_stream(
+    messages: list[dict], max_tokens: int = 1000
+) -> AsyncIterator[str]:
+    """Helper to call ChatGPT and yield the reply as it is generated."""
+    async with _openai_semaphore:
+        stream = await get_openai_client().chat.completions.create(
+            model=settings.OPENAI_MODEL,
+            max_tokens=max_tokens,
+            messages=messages,
+            stream=True,
+        )
+        async for chunk in stream:
+            if chunk.choices and chunk.choices[0].delta.content:
+                yield chunk.choices[0].delta.content
@@ -8,60 +8,144 @@ This agent uses LangGraph to orchestrate:
 4. Generating a final answer
 """
 
+import asyncio
+import functools
+import logging
+from collections import defaultdict
+
+import numpy as np
+import orjson
 from langgraph.graph import END, StateGraph
 from mcp import ClientSession, StdioServerParameters
 from mcp.client.stdio import stdio_client
-from openai import OpenAI
 
+from src.agents.llm import chat
+from src.agents.semcache import SemanticCache
 from src.agents.state import ResearchAgentState
+from src.agents.tokens import fit_tokens, source_budget
 from src.api.core.config import settings
+from src.rag.embeddings import embedding_service
 from src.rag.retriever import rag_retriever
 
-# Lazy-load OpenAI client to allow app startup without API key
-_openai_client = None
+logger = logging.getLogger(__name__)
 
+# Similarity cache for retrieval (see semcache.py)
+_retrieval_cache = SemanticCache(
+    embed=embedding_service.embed_query,
+    threshold=settings.AGENT_CACHE_SIMILARITY,
+    max_entries=settings.AGENT_CACHE_MAX_ENTRIES,
+    ttl_seconds=settings.AGENT_CACHE_TTL_SECONDS,
+    enabled=settings.AGENT_CACHE_ENABLED,
+)
 
-def _get_openai_client() -> OpenAI:
-    global _openai_client
-    if _openai_client is None:
-        if not settings.OPENAI_API_KEY:
-            raise ValueError("OPENAI_API_KEY is not configured")
-        _openai_client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    return _openai_client
 
+class _MCPConnection:
+    """
+    A long-lived MCP server process and client session.
 
-def chat(messages: list[dict], max_tokens: int = 1000) -> str:
-    """Helper to call ChatGPT."""
-    response = _get_openai_client().chat.completions.create(
-        model=settings.OPENAI_MODEL,
-        max_tokens=max_tokens,
-        messages=messages,
-    )
-    return response.choices[0].message.content
+    anyio requires stdio_client / ClientSession to be entered and exited
+    from the same task, so a background task owns them and keeps them
+    open until close() is called (or the server process dies).
+    """
+
+    def __init__(self, server_params: StdioServerParameters):
+        self.server_params = server_params
+        self.session: ClientSession | None = None
+        self._error: Exception | None = None
+        self._ready = asyncio.Event()
+        self._stop = asyncio.Event()
+        self._task = asyncio.create_task(self._run())
+
+    async def _run(self) -> None:
+        try:
+            async with stdio_client(self.server_params) as (read, write):
+                async with ClientSession(read, write) as session:
+                    # Initialize the connection (once per server process)
+                    await session.initialize()
+                    self.session = session
+                    self._ready.set()
+                    await self._stop.wait()
+        except Exception as e:
+            self._error = e
+        finally:
+            self.session = None
+            self._ready.set()
+
+    @property
+    def alive(self) -> bool:
+        return not self._task.done()
+
+    async def get_session(self) -> ClientSession:
+        """Wait for the server to start and return its session."""
+        await self._ready.wait()
+        if self.session is None:
+            raise self._error or RuntimeError("MCP server exited")
+        return self.session
+
+    async def close(self) -> None:
+        self._stop.set()
+        await self._task
+
+
+# One server process per MCP server, reused across tool calls - spawning
+# Python and running the initialize handshake costs more than most calls
+_mcp_connections: dict[str, _MCPConnection] = {}
+_mcp_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+
+async def _get_mcp_session(server_name: str) -> ClientSession:
+    """Get the shared session for a server, starting it if needed."""
+    async with _mcp_locks[server_name]:
+        connection = _mcp_connections.get(server_name)
+        if connection is None or not connection.alive:
+            # Define server configuration
+            server_params = StdioServerParameters(
+                command="python",
+                args=[f"src/mcp_servers/{server_name}/server.py"],
+            )
+            connection = _MCPConnection(server_params)
+            _mcp_connections[server_name] = connection
+
+    return await connection.get_session()
+
+
+async def close_mcp_sessions() -> None:
+    """Shut down every MCP server process started by call_mcp_tool."""
+    connections = list(_mcp_connections.values())
+    _mcp_connections.clear()
+    for connection in connections:
+        await connection.close()
 
 
 async def call_mcp_tool(server_name: str, tool_name: str, arguments: dict) -> str:
     """
     Call a tool on an MCP server.
 
-    This is how your agent uses MCP tools!
+    This is how your agent uses MCP tools! The server process is started
+    on first use and kept running for later calls.
     """
-    # Define server configuration
-    server_params = StdioServerParameters(
-        command="python",
-        args=[f"src/mcp_servers/{server_name}/server.py"],
-    )
+    session = await _get_mcp_session(server_name)
 
-    async with stdio_client(server_params) as (read, write):
-        async with ClientSession(read, write) as session:
-            # Initialize the connection
-            await session.initialize()
+    # Call the tool
+    try:
+        result = await session.call_tool(tool_name, arguments)
+    except Exception:
+        # Tool failures come back as results, so an exception means the
+        # transport broke (e.g. the server process died since the last
+        # call) - replace the server and retry once
+        connection = _mcp_connections.get(server_name)
+        if connection is not None and connection.session is session:
+            del _mcp_connections[server_name]
+            await connection.close()
+        session = await _get_mcp_session(server_name)
+        result = await session.call_tool(tool_name, arguments)
 
-            # Call the tool
-            result = await session.call_tool(tool_name, arguments)
+    # Return the text content
+    return result.content[0].text if result.content else ""
 
-            # Return the text content
-            return result.content[0].text if result.content else ""
+
+# Tool results bigger than this (UTF-8 encoded) are parsed off the event loop
+LARGE_JSON_BYTES = 100_000
 
 
 # Example: Using MCP in a node
@@ -76,10 +160,13 @@ async def search_external_news(state: ResearchAgentState) -> dict:
         arguments={"query": query, "max_results": 5},
     )
 
-    # Parse and add to state
-    import json
-
-    news_data = json.loads(result)
+    # Parse and add to state (big payloads in a thread so other agents
+    # sharing the event loop aren't held up)
+    payload = result.encode()
+    if len(payload) > LARGE_JSON_BYTES:
+        news_data = await asyncio.to_thread(orjson.loads, payload)
+    else:
+        news_data = orjson.loads(payload)
 
     return {
         "external_sources": news_data.get("articles", []),
@@ -92,6 +179,10 @@ async def search_external_news(state: ResearchAgentState) -> dict:
     }
 
 
+# Chunks retrieved per question
+RETRIEVE_LIMIT = 10
+
+
 def retrieve_documents(state: ResearchAgentState) -> dict:
     """
     Node: Retrieve relevant documents from the vector store.
@@ -100,8 +191,11 @@ def retrieve_documents(state: ResearchAgentState) -> dict:
     """
     query = state["query"]
 
-    # Get relevant chunks from RAG
-    docs = rag_retriever.retrieve(query, limit=5)
+    # Get relevant chunks from RAG (or a cached result for a similar query)
+    docs, vector = _retrieval_cache.get_similar(query)
+    if docs is None:
+        docs = rag_retriever.retrieve(query, limit=RETRIEVE_LIMIT)
+        _retrieval_cache.set_similar(query, docs, vector)
 
     return {
         "retrieved_docs": docs,
@@ -114,42 +208,87 @@ def retrieve_documents(state: ResearchAgentState) -> dict:
     }
 
 
-def extract_facts(state: ResearchAgentState) -> dict:
-    """
-    Node: Use Claude to extract facts from retrieved documents.
+# System prompts: the fixed instructions come first so every call starts
+# with the same cacheable prefix; documents and facts go in the user turn
+EXTRACT_FACTS_PROMPT = """Given the documents the user provides, extract the key facts relevant to answering their question.
 
-    This is where the LLM does reasoning work.
-    """
-    docs = state["retrieved_docs"]
-    query = state["query"]
+Only include facts that are directly stated in the documents.
+Return JSON: {"facts": ["fact 1", "fact 2"]}"""
+
+
+# With at least this many documents - more than half a full retrieval -
+# extract from each one concurrently (map) and merge the results (reduce)
+# instead of sending one long prompt
+MAP_EXTRACT_MIN_DOCS = RETRIEVE_LIMIT // 2 + 1
+MAP_EXTRACT_CONCURRENCY = 10
 
-    # Build context from documents
-    context = "\n\n".join(
-        [f"Document {i + 1}:\n{doc['text']}" for i, doc in enumerate(docs)]
-    )
 
-    # Ask Claude to extract relevant facts
-    response = chat(
+async def _extract_from(query: str, context: str) -> list[str]:
+    """Ask the LLM for the facts in context that answer query."""
+    response = await chat(
         max_tokens=1000,
+        response_format={"type": "json_object"},
         messages=[
+            {"role": "system", "content": EXTRACT_FACTS_PROMPT},
             {
                 "role": "user",
-                "content": f"""Given the following documents, extract the key facts relevant to answering this question: "{query}"
-
-Documents:
-{context}
-
-List the relevant facts as bullet points. Only include facts that are directly stated in the documents.""",
-            }
+                "content": f'Question: "{query}"\n\nDocuments:\n{context}',
+            },
         ],
     )
 
-    facts_text = response
-    facts = [
-        line.strip("- ").strip()
-        for line in facts_text.split("\n")
-        if line.strip().startswith("-")
-    ]
+    try:
+        return [str(fact) for fact in orjson.loads(response).get("facts", [])]
+    except (TypeError, AttributeError, orjson.JSONDecodeError):
+        # Model ignored the JSON instruction - fall back to bullet lines
+        return [
+            line.strip().lstrip("-*").strip()
+            for line in (response or "").split("\n")
+            if line.strip().startswith(("-", "*"))
+        ]
+
+
+def merge_facts(fact_lists: list[list[str]]) -> list[str]:
+    """Concatenate per-document facts, dropping repeats (case-insensitive)."""
+    seen = set()
+    merged = []
+    for facts in fact_lists:
+        for fact in facts:
+            key = " ".join(fact.lower().split())
+            if key not in seen:
+                seen.add(key)
+                merged.append(fact)
+    return merged
+
+
+async def extract_facts(state: ResearchAgentState) -> dict:
+    """
+    Node: Use Claude to extract facts from retrieved documents.
+
+    This is where the LLM does reasoning work. A handful of documents go
+    in one prompt; larger retrievals fan out to one call per document.
+    """
+    docs = state["retrieved_docs"]
+    query = state["query"]
+
+    if len(docs) >= MAP_EXTRACT_MIN_DOCS:
+        semaphore = asyncio.Semaphore(MAP_EXTRACT_CONCURRENCY)
+        budget = source_budget(reply_tokens=1000)
+
+        async def extract_one(doc: dict) -> list[str]:
+            async with semaphore:
+                return await _extract_from(query, fit_tokens(doc["text"], budget))
+
+        facts = merge_facts(await asyncio.gather(*map(extract_one, docs)))
+    else:
+        # Build context from documents
+        context = "\n\n".join(
+            [f"Document {i + 1}:\n{doc['text']}" for i, doc in enumerate(docs)]
+        )
+        context = fit_tokens(context, source_budget(reply_tokens=1000))
+
+        # Ask Claude to extract relevant facts
+        facts = await _extract_from(query, context)
 
     return {
         "facts": facts,
@@ -162,66 +301,76 @@ List the relevant facts as bullet points. Only include facts that are directly s
     }
 
 
-def decide_next_step(state: ResearchAgentState) -> str:
+# Enough to answer: at least this many facts...
+MIN_FACTS = 5
+# ...whose mean embedding is this close (cosine) to the question
+COVERAGE_THRESHOLD = 0.55
+
+
+def fact_coverage(query: str, facts: list[str]) -> float:
+    """
+    Cosine similarity between the question and the mean fact embedding.
+
+    A rough measure of how much of the question the facts talk about.
+    The query and facts are embedded together in one batch.
+    """
+    vectors = np.asarray(embedding_service.embed_texts([query, *facts]))
+    query_vec, fact_vec = vectors[0], vectors[1:].mean(axis=0)
+    norm = np.linalg.norm(query_vec) * np.linalg.norm(fact_vec)
+    return float(query_vec @ fact_vec / norm) if norm else 0.0
+
+
+async def decide_next_step(state: ResearchAgentState) -> str:
     """
     Conditional Edge: Decide whether we need more research or can answer.
 
-    This is the "reasoning" part - the LLM decides the control flow!
+    Decided locally from the facts (how many, and how well they cover
+    the question) rather than spending an LLM round trip on a YES/NO.
     """
     facts = state["facts"]
     query = state["query"]
     iteration = state.get("iteration_count", 0)
 
     # Limit iterations to prevent infinite loops
-    if iteration >= 3:
+    if iteration >= 2:
         return "generate_answer"
 
-    # Ask Claude if we have enough information
-    response = chat(
-        max_tokens=1000,
-        messages=[
-            {
-                "role": "user",
-                "content": f"""Question: "{query}"
+    if len(facts) < MIN_FACTS:
+        return "retrieve_documents"  # Need more research
 
-Facts gathered so far:
-{chr(10).join(f"- {fact}" for fact in facts)}
+    try:
+        coverage = await asyncio.to_thread(fact_coverage, query, facts)
+    except Exception as e:
+        # Embedding model unavailable - answer with what we have
+        logger.warning(f"Fact coverage check failed: {e}")
+        return "generate_answer"
 
-Do we have enough information to fully answer this question?
-Reply with ONLY "YES" or "NO".""",
-            }
-        ],
-    )
+    if coverage < COVERAGE_THRESHOLD:
+        return "retrieve_documents"  # Need more research
+    return "generate_answer"  # Ready to answer
 
-    decision = response.strip().upper()
 
-    if "NO" in decision and iteration < 2:
-        return "retrieve_documents"  # Need more research
-    else:
-        return "generate_answer"  # Ready to answer
+ANSWER_PROMPT = """Based on the facts the user provides, give a comprehensive answer to their question.
 
+Provide a clear, well-structured answer. If the facts don't fully answer the question, acknowledge what's missing."""
 
-def generate_answer(state: ResearchAgentState) -> dict:
+
+async def generate_answer(state: ResearchAgentState) -> dict:
     """
     Node: Generate the final answer using gathered facts.
     """
     facts = state["facts"]
     query = state["query"]
 
-    response = chat(
+    response = await chat(
         max_tokens=1000,
         messages=[
+            {"role": "system", "content": ANSWER_PROMPT},
             {
                 "role": "user",
-                "content": f"""Based on the following facts, provide a comprehensive answer to the question.
-
-Question: "{query}"
-
-Facts:
-{chr(10).join(f"- {fact}" for fact in facts)}
-
-Provide a clear, well-structured answer. If the facts don't fully answer the question, acknowledge what's missing.""",
-            }
+                "content": f'Question: "{query}"\n\nFacts:\n'
+                + "\n".join(f"- {fact}" for fact in facts),
+            },
         ],
     )
 
@@ -290,8 +439,10 @@ def build_research_agent() -> StateGraph:
     return graph.compile()
 
 
-# Create the agent
-research_agent = build_research_agent()
+@functools.cache
+def get_research_agent() -> StateGraph:
+    """The compiled Research Agent, built on first use and then shared."""
+    return build_research_agent()
 
 
 async def research(query: str) -> str:
@@ -316,6 +467,6 @@ async def research(query: str) -> str:
     }
 
     # Run the agent
-    final_state = research_agent.invoke(initial_state)
+    final_state = await get_research_agent().ainvoke(initial_state)
 
     return final_state["answer"]
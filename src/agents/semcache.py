@@ -0,0 +1,168 @@
+"""
+Semantic cache for agent LLM calls and retrieval.
+
+Two tiers:
+- Exact: a hash of the full request, so an identical call is answered
+  without touching the LLM or Qdrant
+- Semantic: the embedding of a query; a cached query with cosine
+  similarity above the threshold counts as a hit, so paraphrases
+  ("latest AI news" / "newest AI news") share one result
+
+Entries live in process memory, evicted least-recently-used, with a TTL
+so cached retrieval results don't go stale as new articles are ingested.
+"""
+
+import hashlib
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from typing import Any
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+def request_key(*parts: Any) -> str:
+    """Stable hash of a request (model, messages, options...) for exact lookups."""
+    payload = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class SemanticCache:
+    """In-memory exact + embedding-similarity cache."""
+
+    def __init__(
+        self,
+        embed: Callable[[str], list[float]] | None = None,
+        threshold: float = 0.95,
+        max_entries: int = 10_000,
+        ttl_seconds: float | None = None,
+        enabled: bool = True,
+    ):
+        self.embed = embed
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+
+        # key -> (stored_at, value), oldest first
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        # key -> unit-length query vector (semantic tier only)
+        self._vectors: dict[str, np.ndarray] = {}
+        # Stacked vectors for one matrix-vector product per lookup,
+        # rebuilt lazily after the set of vectors changes
+        self._matrix: np.ndarray | None = None
+        self._matrix_keys: list[str] = []
+        # Agent nodes may hit the cache from worker threads
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Any | None:
+        """Exact lookup. Returns None on a miss."""
+        if not self.enabled:
+            return None
+        with self._lock:
+            return self._get_locked(key)
+
+    def set(self, key: str, value: Any, vector: np.ndarray | None = None) -> None:
+        """Store a value, optionally with its query vector for similarity hits."""
+        if not self.enabled or value is None:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value)
+            self._entries.move_to_end(key)
+            if vector is not None:
+                self._vectors[key] = vector
+                self._matrix = None
+            while len(self._entries) > self.max_entries:
+                self._evict_locked(next(iter(self._entries)))
+
+    def get_similar(self, text: str) -> tuple[Any | None, np.ndarray | None]:
+        """
+        Look up a query by exact text, then by embedding similarity.
+
+        Returns (value, vector). value is None on a miss; pass vector back
+        to set_similar() so storing the fresh result doesn't embed the query again.
+        """
+        if not self.enabled:
+            return None, None
+
+        key = request_key(text)
+        with self._lock:
+            value = self._get_locked(key)
+        if value is not None or self.embed is None:
+            return value, None
+
+        try:
+            vector = self._normalize(self.embed(text))
+        except Exception as e:
+            # Embedding model unavailable - behave like a plain exact cache
+            logger.warning(f"Semantic cache embedding failed: {e}")
+            return None, None
+
+        with self._lock:
+            if self._matrix is None:
+                self._matrix_keys = list(self._vectors)
+                self._matrix = (
+                    np.stack([self._vectors[k] for k in self._matrix_keys])
+                    if self._matrix_keys
+                    else None
+                )
+            if self._matrix is None:
+                return None, vector
+
+            keys = self._matrix_keys
+            scores = self._matrix @ vector
+            # Best match first; an expired one is evicted and the next
+            # best above the threshold takes its place
+            candidates = np.flatnonzero(scores >= self.threshold)
+            for i in candidates[np.argsort(-scores[candidates])]:
+                value = self._get_locked(keys[i])
+                if value is not None:
+                    break
+        return value, vector
+
+    def set_similar(
+        self, text: str, value: Any, vector: np.ndarray | None = None
+    ) -> None:
+        """Store the result for a query (see get_similar)."""
+        self.set(request_key(text), value, vector)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._vectors.clear()
+            self._matrix = None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def _get_locked(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, value = entry
+        if (
+            self.ttl_seconds is not None
+            and time.monotonic() - stored_at > self.ttl_seconds
+        ):
+            self._evict_locked(key)
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _evict_locked(self, key: str) -> None:
+        self._entries.pop(key, None)
+        if self._vectors.pop(key, None) is not None:
+            self._matrix = None
+
+    @staticmethod
+    def _normalize(embedding: list[float]) -> np.ndarray:
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
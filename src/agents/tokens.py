@@ -0,0 +1,97 @@
+"""
+Token counting for agent prompts.
+
+Uses tiktoken's encoding for the configured OpenAI model, loaded once per
+process (at startup, see load_encoding). If the encoding can't be loaded
+(tiktoken downloads its BPE file on first use), falls back to the same
+~4 characters per token estimate the RAG retriever uses, and tries the
+load again later.
+"""
+
+import logging
+import threading
+import time
+
+import tiktoken
+
+from src.api.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+# Encoding for models tiktoken doesn't know yet (gpt-4o family and newer)
+DEFAULT_ENCODING = "o200k_base"
+
+# Room left for the instructions wrapped around the sources in a prompt
+PROMPT_OVERHEAD_TOKENS = 500
+
+CHARS_PER_TOKEN = 4
+
+# After a failed load (BPE download unreachable), estimate for this long
+# before trying again
+ENCODING_RETRY_SECONDS = 300
+
+_loaded: tiktoken.Encoding | None = None
+_failed_at: float | None = None
+_load_lock = threading.Lock()
+
+
+def _encoding() -> tiktoken.Encoding | None:
+    """
+    The tokenizer, loaded once (None if it isn't available).
+
+    Only a successful load is kept; a failure is retried after
+    ENCODING_RETRY_SECONDS. Call load_encoding() at startup so the first
+    briefing doesn't download the BPE file on the event loop.
+    """
+    global _loaded, _failed_at
+    if _loaded is not None:
+        return _loaded
+    if (
+        _failed_at is not None
+        and time.monotonic() - _failed_at < ENCODING_RETRY_SECONDS
+    ):
+        return None
+
+    with _load_lock:
+        if _loaded is not None:
+            return _loaded
+        try:
+            try:
+                _loaded = tiktoken.encoding_for_model(settings.OPENAI_MODEL)
+            except KeyError:
+                _loaded = tiktoken.get_encoding(DEFAULT_ENCODING)
+        except Exception as e:  # noqa: BLE001 - download/cache errors vary; estimate instead
+            logger.warning(f"tiktoken encoding unavailable, estimating tokens: {e}")
+            _failed_at = time.monotonic()
+        return _loaded
+
+
+def load_encoding() -> bool:
+    """Load the tokenizer now (blocking). Returns whether it's available."""
+    return _encoding() is not None
+
+
+def count_tokens(text: str) -> int:
+    """Number of tokens in text for the configured model."""
+    encoding = _encoding()
+    if encoding is None:
+        return len(text) // CHARS_PER_TOKEN
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def fit_tokens(text: str, budget: int) -> str:
+    """Truncate text to at most budget tokens."""
+    encoding = _encoding()
+    if encoding is None:
+        return text[: budget * CHARS_PER_TOKEN]
+
+    # Scraped text may contain "<|endoftext|>" and the like - plain text here
+    tokens = encoding.encode(text, disallowed_special=())
+    if len(tokens) <= budget:
+        return text
+    return encoding.decode(tokens[:budget])
+
+
+def source_budget(reply_tokens: int) -> int:
+    """Tokens available for sources in a prompt that reserves reply_tokens."""
+    return settings.OPENAI_CONTEXT_TOKENS - reply_tokens - PROMPT_OVERHEAD_TOKENS
@@ -29,6 +29,14 @@ class Settings(BaseSettings):
     SECRET_KEY: str = "change-me-in-production"  # For JWT signing
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     ALLOW_PUBLIC_REGISTRATION: bool = False  # Disable public registration by default
+    # argon2id cost for new password hashes (OWASP minimum). Each login pays
+    # this in CPU time and memory; raising it slows brute force and logins alike
+    PASSWORD_HASH_TIME_COST: int = 2  # Iterations
+    PASSWORD_HASH_MEMORY_KIB: int = 19456  # 19 MiB
+    # Rate limit counters. "memory://" is per process; point every worker at
+    # the same store (e.g. "redis://host:6379", needs the redis package) to
+    # share limits across workers
+    RATE_LIMIT_STORAGE_URI: str = "memory://"
 
     # Database (Azure SQL)
     DATABASE_URL: str = ""  # Will be loaded from Key Vault in production
@@ -39,14 +47,29 @@ class Settings(BaseSettings):
     # AI Agent Configuration (OpenAI)
     OPENAI_API_KEY: str | None = None
     OPENAI_MODEL: str = "gpt-4o"  # or "gpt-4o-mini" for cheaper option
+    OPENAI_CONTEXT_TOKENS: int = 128_000  # Context window of OPENAI_MODEL
+    OPENAI_TIMEOUT_SECONDS: float = 30.0  # Per request, so a stalled call can't hang
+    OPENAI_CONNECT_TIMEOUT_SECONDS: float = 5.0
+    OPENAI_MAX_RETRIES: int = 4  # 429/5xx/connection errors, exponential backoff
+    OPENAI_MAX_CONCURRENT_REQUESTS: int = 50  # In-flight calls per process
 
     # Vector Database (Qdrant)
     QDRANT_URL: str = "http://localhost:6333"
     QDRANT_API_KEY: str | None = None
+    QDRANT_PREFER_GRPC: bool = False  # Use gRPC (port below) for bulk ingest
+    QDRANT_GRPC_PORT: int = 6334
 
     # Embedding Model
     EMBEDDING_MODEL: str = "all-MiniLM-L6-v2"
 
+    # Agent caching (in-memory, per process) for LLM calls and retrieval
+    AGENT_CACHE_ENABLED: bool = True
+    AGENT_CACHE_SIMILARITY: float = 0.95  # Cosine similarity for a paraphrase hit
+    AGENT_FOLLOWUP_SIMILARITY: float = 0.7  # Follow-up close enough to reuse its thread's sources
+    AGENT_CACHE_TTL_SECONDS: int = 600
+    AGENT_CACHE_MAX_ENTRIES: int = 10_000
+    AGENT_MAX_CONCURRENT_BRIEFINGS: int = 4  # Parallel agent runs per batch
+
     # CORS
     CORS_ORIGINS: str = ""  # Comma-separated list of allowed origins (e.g., "https://frontend.example.com,https://other.example.com")
 
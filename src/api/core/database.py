@@ -9,26 +9,32 @@ SQLAlchemy 2.0 uses:
 For Azure SQL, we use the aioodbc driver which provides async ODBC support.
 """
 
+import time
 from collections.abc import AsyncGenerator
 
-from sqlalchemy import event
+from sqlalchemy import event, exc
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 
 from src.api.core.config import settings
 
 
 # Determine engine kwargs based on database type
-# SQLite doesn't support pool_size, max_overflow, pool_timeout
 engine_kwargs = {
-    "echo": settings.DEBUG,  # Log SQL statements when DEBUG=True
-    "pool_pre_ping": True,  # Verify connections before using them
+    # SQL logging goes through the "sqlalchemy.engine" logger (see logging.py)
+    # rather than echo, so it never bypasses the log level
+    "echo": False,
 }
 
-# Add pool settings only for non-SQLite databases
+# Connections idle longer than this are pinged on checkout (see below)
+POOL_PING_IDLE_SECONDS = 300
+
+# Pool settings for Azure SQL
 if not settings.DATABASE_URL.startswith("sqlite"):
     engine_kwargs.update(
         {
@@ -36,17 +42,63 @@ if not settings.DATABASE_URL.startswith("sqlite"):
             "max_overflow": 10,  # Allow 10 additional connections beyond pool_size
             "pool_timeout": 30,  # Seconds to wait for available connection
             "pool_recycle": 1800,  # Recycle connections after 30 minutes
+            "pool_use_lifo": True,  # Reuse the most recent (warm) connection first
         }
     )
 
+# File-based SQLite: keep a fixed set of connections open for the life
+# of the process, so requests reuse them (and their pragmas) instead of
+# opening a new aiosqlite connection and thread. Under WAL all of them
+# can read concurrently. (In-memory SQLite uses a single StaticPool
+# connection, so it keeps the defaults.)
+elif ":memory:" not in settings.DATABASE_URL:
+    engine_kwargs.update(
+        {
+            "poolclass": AsyncAdaptedQueuePool,
+            "pool_size": 8,
+            "max_overflow": 0,  # Wait for a pooled connection rather than open more
+            "pool_recycle": -1,  # Local file - never stale
+        }
+    )
+
+# Azure SQL: send executemany() (bulk Article inserts) as one batched
+# parameter array instead of a round trip per row
+if settings.DATABASE_URL.startswith("mssql"):
+    engine_kwargs["fast_executemany"] = True
+
 # Create the async engine
 # The engine manages the connection pool to the database
 engine = create_async_engine(settings.DATABASE_URL, **engine_kwargs)
 
+# Azure SQL: instead of pool_pre_ping's round trip on every checkout,
+# only ping connections that sat idle long enough to have been dropped
+# by the server or a load balancer. pool_recycle retires old ones.
+if not settings.DATABASE_URL.startswith("sqlite"):
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def _mark_last_used(dbapi_connection, connection_record):
+        connection_record.info["last_used"] = time.monotonic()
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _ping_if_idle(dbapi_connection, connection_record, connection_proxy):
+        last_used = connection_record.info.get("last_used")
+        if last_used is None or time.monotonic() - last_used < POOL_PING_IDLE_SECONDS:
+            return
+        try:
+            engine.dialect.do_ping(dbapi_connection)
+        except Exception as e:
+            # Makes the pool discard this connection and check out a new one
+            raise exc.DisconnectionError() from e
+
+
 # SQLite: enable WAL mode and busy timeout for multi-worker concurrency.
 # WAL allows concurrent readers alongside one writer.
 # busy_timeout makes SQLite retry for 5 s instead of immediately failing
 # with "database is locked".
+# synchronous=NORMAL drops the fsync on every commit; with WAL the database
+# can't be corrupted, only the last commits lost on power failure.
+# A 64 MB page cache, in-memory temp tables and a 256 MB memory map keep
+# the read-heavy article/source queries out of read() syscalls.
 if settings.DATABASE_URL.startswith("sqlite"):
 
     @event.listens_for(engine.sync_engine, "connect")
@@ -54,13 +106,48 @@ if settings.DATABASE_URL.startswith("sqlite"):
         cursor = dbapi_connection.cursor()
         cursor.execute("PRAGMA journal_mode=WAL")
         cursor.execute("PRAGMA busy_timeout=5000")
+        cursor.execute("PRAGMA synchronous=NORMAL")
+        cursor.execute("PRAGMA temp_store=MEMORY")
+        cursor.execute("PRAGMA cache_size=-65536")  # Negative = KiB
+        cursor.execute("PRAGMA mmap_size=268435456")
         cursor.close()
 
+
+class TrackedSession(Session):
+    """Session that remembers whether it has written anything not yet committed."""
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _mark_flushed(session, flush_context):
+    session.info["pending_writes"] = True
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _mark_dml(orm_execute_state: ORMExecuteState):
+    # insert()/update()/delete() statements bypass the unit of work
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        orm_execute_state.session.info["pending_writes"] = True
+
+
+@event.listens_for(TrackedSession, "after_commit")
+@event.listens_for(TrackedSession, "after_rollback")
+def _clear_writes(session):
+    session.info.pop("pending_writes", None)
+
+
+def has_pending_writes(session: AsyncSession) -> bool:
+    """True if the session has changes that a commit would save."""
+    return bool(
+        session.new or session.dirty or session.deleted or session.info.get("pending_writes")
+    )
+
+
 # Create a session factory
 # async_sessionmaker creates AsyncSession instances with consistent settings
 AsyncSessionLocal = async_sessionmaker(
     bind=engine,
     class_=AsyncSession,
+    sync_session_class=TrackedSession,
     expire_on_commit=False,  # Don't expire objects after commit (useful for returning data)
     autocommit=False,
     autoflush=False,
@@ -78,11 +165,14 @@ async def get_db() -> AsyncGenerator[AsyncSession, None]:
             return result.scalars().all()
 
     The session is automatically closed after the request completes.
+    It is only committed if the request left changes to save; read-only
+    requests skip the commit round trip (most routes commit themselves).
     """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
+            if has_pending_writes(session):
+                await session.commit()
         except Exception:
             await session.rollback()
             raise
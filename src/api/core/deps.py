@@ -6,12 +6,14 @@ They handle cross-cutting concerns like authentication, database connections, et
 """
 
 import uuid
-from typing import Annotated
+from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, status
-from fastapi.security import OAuth2PasswordBearer
-from sqlalchemy import select
+from cachetools import TTLCache
+from fastapi import Depends, Form, HTTPException, status
+from fastapi.security import OAuth2PasswordBearer, OAuth2PasswordRequestForm
+from sqlalchemy import inspect, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import make_transient_to_detached
 
 from src.api.core.database import get_db
 from src.api.core.security import decode_access_token
@@ -22,6 +24,27 @@ from src.api.models import User
 # tokenUrl is where clients POST to get a token (used for OpenAPI docs)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login")
 
+# Column values of recently authenticated users, so most requests skip the
+# users SELECT. Kept short (and per process) so deactivations apply quickly;
+# routes that change a user call invalidate_user_cache().
+_user_cache: TTLCache[uuid.UUID, dict[str, Any]] = TTLCache(maxsize=5000, ttl=30)
+
+
+def invalidate_user_cache(user_id: uuid.UUID) -> None:
+    """Drop a user's cached row after changing it."""
+    _user_cache.pop(user_id, None)
+
+
+def _cached_user(user_id: uuid.UUID) -> User | None:
+    columns = _user_cache.get(user_id)
+    if columns is None:
+        return None
+    # A fresh instance per request, marked as already persisted, so the
+    # request's session can track and save changes to it like a loaded row
+    user = User(**columns)
+    make_transient_to_detached(user)
+    return user
+
 
 async def get_current_user(
     db: Annotated[AsyncSession, Depends(get_db)],
@@ -59,6 +82,12 @@ async def get_current_user(
     except ValueError:
         raise credentials_exception
 
+    # Use the cached row if we've seen this user recently
+    user = _cached_user(user_id)
+    if user is not None:
+        db.add(user)
+        return user
+
     # Fetch user from database
     result = await db.execute(select(User).where(User.id == user_id))
     user = result.scalar_one_or_none()
@@ -66,6 +95,9 @@ async def get_current_user(
     if user is None:
         raise credentials_exception
 
+    _user_cache[user_id] = {
+        attr.key: getattr(user, attr.key) for attr in inspect(User).column_attrs
+    }
     return user
 
 
@@ -86,6 +118,39 @@ async def get_current_active_user(
     return current_user
 
 
+async def get_current_superuser(
+    current_user: Annotated[User, Depends(get_current_active_user)],
+) -> User:
+    """
+    Dependency that ensures the user is a superuser.
+
+    Use this for admin operations that affect every user.
+    """
+    if not current_user.is_superuser:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Not enough permissions",
+        )
+    return current_user
+
+
+async def password_form(
+    username: Annotated[str, Form()],
+    password: Annotated[str, Form()],
+    scope: Annotated[str, Form()] = "",
+) -> OAuth2PasswordRequestForm:
+    """
+    Dependency that reads the OAuth2 password-flow login form.
+
+    Same fields as Depends(OAuth2PasswordRequestForm), but as an async
+    function: FastAPI runs class (and other sync) dependencies in its
+    threadpool, which caps concurrent logins at the pool size.
+    """
+    return OAuth2PasswordRequestForm(username=username, password=password, scope=scope)
+
+
 # Type aliases for cleaner route signatures
 CurrentUser = Annotated[User, Depends(get_current_active_user)]
+CurrentSuperuser = Annotated[User, Depends(get_current_superuser)]
 DbSession = Annotated[AsyncSession, Depends(get_db)]
+PasswordForm = Annotated[OAuth2PasswordRequestForm, Depends(password_form)]
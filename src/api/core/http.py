@@ -0,0 +1,11 @@
+"""
+Conditional request helpers shared by the routers.
+"""
+
+
+def etag_matches(if_none_match: str, etag: str) -> bool:
+    """If-None-Match check (weak comparison, so W/ prefixes are ignored)."""
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
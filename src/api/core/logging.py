@@ -2,12 +2,16 @@
 Structured logging configuration with Azure Monitor integration.
 
 This module sets up logging that:
-- Outputs structured logs to stdout (for container environments)
+- Outputs structured logs to stdout (for container environments), written
+  from a background thread
 - Integrates with Azure Monitor when APPLICATIONINSIGHTS_CONNECTION_STRING is set
 - Reduces noise from third-party libraries
 """
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 
 from src.api.core.config import settings
@@ -25,14 +29,36 @@ def setup_logging() -> logging.Logger:
 
     # Configure root logger with structured format
     # Format: timestamp | level | logger_name | message
+    # Records are handed to a queue and written to stdout by a background
+    # thread, so a slow stdout never blocks the event loop.
+    stdout_handler = logging.StreamHandler(sys.stdout)
+    stdout_handler.setFormatter(
+        logging.Formatter(
+            "%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
+            datefmt="%Y-%m-%d %H:%M:%S",
+        )
+    )
+    log_queue: queue.SimpleQueue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, stdout_handler)
+    listener.start()
+    atexit.register(listener.stop)  # Flush queued records on exit
+
+    # The stdout handler applies the real format; the queue only carries
+    # the message
+    queue_handler = logging.handlers.QueueHandler(log_queue)
+    queue_handler.setFormatter(logging.Formatter("%(message)s"))
+
     logging.basicConfig(
         level=log_level,
-        format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
-        datefmt="%Y-%m-%d %H:%M:%S",
-        handlers=[logging.StreamHandler(sys.stdout)],
+        handlers=[queue_handler],
         force=True,  # Override any existing configuration
     )
 
+    # SQL statements are only logged in DEBUG (the engine no longer echoes)
+    logging.getLogger("sqlalchemy.engine").setLevel(
+        logging.INFO if settings.DEBUG else logging.WARNING
+    )
+
     # Reduce noise from third-party libraries
     logging.getLogger("httpx").setLevel(logging.WARNING)
     logging.getLogger("httpcore").setLevel(logging.WARNING)
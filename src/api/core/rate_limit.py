@@ -8,9 +8,12 @@ external services like Azure API Management.
 from slowapi import Limiter
 from slowapi.util import get_remote_address
 
+from src.api.core.config import settings
+
 # Create limiter instance
-# Uses client IP address for rate limiting
-limiter = Limiter(key_func=get_remote_address)
+# Uses client IP address for rate limiting. The in-memory store expires
+# counters once their window passes, so it only holds IPs seen recently.
+limiter = Limiter(key_func=get_remote_address, storage_uri=settings.RATE_LIMIT_STORAGE_URI)
 
 # Rate limit constants
 RATE_LIMIT_DEFAULT = "100/minute"  # General API calls
@@ -2,14 +2,16 @@
 Security utilities for password hashing and JWT tokens.
 
 Uses:
-- passlib with bcrypt for password hashing
+- passlib with argon2 (bcrypt for older hashes) for password hashing
 - python-jose for JWT encoding/decoding
 """
 
 from datetime import datetime, timedelta, timezone
 from typing import Any
+import time
 import uuid
 
+from cachetools import TTLCache
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
@@ -18,9 +20,24 @@ from src.api.core.config import settings
 
 # --- Password Hashing ---
 
-# CryptContext handles hashing algorithm selection and verification
-# bcrypt is the recommended algorithm for password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# CryptContext handles hashing algorithm selection and verification.
+# New hashes use argon2id, by default with the OWASP minimum parameters
+# (19 MiB, 2 iterations), which costs far less CPU per login than bcrypt's
+# default 12 rounds. bcrypt stays listed so existing hashes still verify;
+# deprecated="auto" flags them (and argon2 hashes made with other costs)
+# for rehashing (see password_needs_rehash).
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.PASSWORD_HASH_TIME_COST,
+    argon2__memory_cost=settings.PASSWORD_HASH_MEMORY_KIB,
+    argon2__parallelism=1,
+)
+
+# Verified against when a login names an unknown email, so that answer
+# takes as long as a wrong password and doesn't reveal which emails exist
+DUMMY_PASSWORD_HASH = pwd_context.hash("not-a-real-password")
 
 
 def hash_password(password: str) -> str:
@@ -50,10 +67,29 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """
+    Check whether a stored hash uses an old scheme or parameters.
+
+    Args:
+        hashed_password: Stored hash from database
+
+    Returns:
+        True if the password should be hashed again on the next login
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 # --- JWT Tokens ---
 
 ALGORITHM = "HS256"  # HMAC with SHA-256
 
+# Payloads of recently verified tokens. A client sends the same token on
+# every request, so the signature check and JSON parsing run about once
+# a minute per token instead of on each call. Only valid tokens are
+# stored, so bad tokens can't fill the cache.
+_token_cache: TTLCache[str, dict[str, Any]] = TTLCache(maxsize=10_000, ttl=60)
+
 
 def create_access_token(subject: uuid.UUID, expires_delta: timedelta | None = None) -> str:
     """
@@ -92,8 +128,19 @@ def decode_access_token(token: str) -> dict[str, Any] | None:
     Returns:
         Decoded payload dict if valid, None if invalid/expired
     """
+    payload = _token_cache.get(token)
+    if payload is not None:
+        # The token may have expired since it was cached
+        if payload["exp"] > time.time():
+            return payload
+        _token_cache.pop(token, None)
+        return None
+
     try:
         payload = jwt.decode(token, settings.SECRET_KEY, algorithms=[ALGORITHM])
-        return payload
     except JWTError:
         return None
+
+    if "exp" in payload:
+        _token_cache[token] = payload
+    return payload
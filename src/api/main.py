@@ -9,14 +9,17 @@ This is the entry point for the API. It:
 - Integrates with Azure Monitor for observability
 """
 
+import asyncio
 import os
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI
+from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 
+from src.agents.research_agent import close_mcp_sessions
+from src.agents.tokens import load_encoding
 from src.api.core.config import settings
 from src.api.core.database import engine
 from src.api.core.logging import logger
@@ -65,12 +68,22 @@ async def lifespan(app: FastAPI):
     else:
         logger.info("Telemetry: Azure Monitor not configured")
 
+    # Build the OpenAPI schema now (it's cached on the app) rather than
+    # on the first request to the docs
+    app.openapi()
+
+    # Load the tokenizer (may download its BPE file) off the event loop now,
+    # not inside the first briefing
+    if not await asyncio.to_thread(load_encoding):
+        logger.warning("Tokenizer unavailable: prompt budgets are estimated")
+
     yield
 
     # Shutdown
     logger.info(f"Shutting down {settings.APP_NAME}...")
     await engine.dispose()
     logger.info("Database connections closed")
+    await close_mcp_sessions()
 
 
 # Create the FastAPI application
@@ -100,8 +113,11 @@ if _azure_monitor_configured:
 
 # Configure CORS (Cross-Origin Resource Sharing)
 # This allows frontend apps on different domains to call our API
+# A frozenset so each request's Origin check is a hash lookup, not a list scan
 cors_origins = (
-    ["*"] if settings.DEBUG else [o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip()]
+    frozenset({"*"})
+    if settings.DEBUG
+    else frozenset(o.strip() for o in settings.CORS_ORIGINS.split(",") if o.strip())
 )
 app.add_middleware(
     CORSMiddleware,
@@ -112,12 +128,15 @@ app.add_middleware(
 )
 
 # Include routers with API version prefix
-app.include_router(auth.router, prefix=settings.API_V1_PREFIX)
-app.include_router(users.router, prefix=settings.API_V1_PREFIX)
-app.include_router(sources.router, prefix=settings.API_V1_PREFIX)
-app.include_router(articles.router, prefix=settings.API_V1_PREFIX)
-app.include_router(intelligence.router, prefix=settings.API_V1_PREFIX)
-app.include_router(collection_router, prefix="/api/v1")
+# (collected under one router, so the app's route table is built once)
+api_router = APIRouter(prefix=settings.API_V1_PREFIX)
+api_router.include_router(auth.router)
+api_router.include_router(users.router)
+api_router.include_router(sources.router)
+api_router.include_router(articles.router)
+api_router.include_router(intelligence.router)
+api_router.include_router(collection_router)
+app.include_router(api_router)
 
 
 # Health check endpoint (no auth required)
@@ -5,5 +5,14 @@ from src.api.models.user import User
 from src.api.models.source import Source
 from src.api.models.article import Article
 from src.api.models.collection_task import CollectionTask
+from src.api.models.ingest_job import IngestJob
 
-__all__ = ["Base", "TimestampMixin", "User", "Source", "Article", "CollectionTask"]
+__all__ = [
+    "Base",
+    "TimestampMixin",
+    "User",
+    "Source",
+    "Article",
+    "CollectionTask",
+    "IngestJob",
+]
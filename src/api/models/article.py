@@ -6,10 +6,10 @@ import uuid
 from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
-from sqlalchemy import String, Text, DateTime, ForeignKey
+from sqlalchemy import String, Text, DateTime, ForeignKey, Index, and_, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.api.models.base import Base, TimestampMixin
+from src.api.models.base import Base, TimestampMixin, time_ordered_id
 
 if TYPE_CHECKING:
     from src.api.models.source import Source
@@ -26,17 +26,34 @@ class Article(Base, TimestampMixin):
     """
 
     __tablename__ = "articles"
+    __table_args__ = (
+        # GET /articles filters by source and pages newest-first by
+        # (fetched_at, id); this also serves plain source_id lookups
+        # (leftmost column)
+        Index("ix_articles_source_id_fetched_at_id", "source_id", "fetched_at", "id"),
+        # Unfiltered GET /articles, newest-first
+        Index("ix_articles_fetched_at_id", "fetched_at", "id"),
+        # /ingest-all walks articles with content by id and counts them;
+        # a filtered index skips the metadata-only rows without reading
+        # the wide content column
+        Index(
+            "ix_articles_id_with_content",
+            "id",
+            mssql_where=text("content IS NOT NULL"),
+            postgresql_where=text("content IS NOT NULL"),
+            sqlite_where=text("content IS NOT NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=time_ordered_id,
     )
 
     # Foreign key to source
     source_id: Mapped[uuid.UUID] = mapped_column(
         ForeignKey("sources.id"),
         nullable=False,
-        index=True,
     )
 
     # Article metadata
@@ -80,8 +97,16 @@ class Article(Base, TimestampMixin):
         nullable=False,  # When we scraped it
     )
 
-    # Relationship back to source
+    # Relationship back to source. Never lazy-loaded (that would be a query
+    # per article, and fails under async anyway); queries that need it must
+    # ask for it with selectinload(Article.source)
     source: Mapped["Source"] = relationship(
         "Source",
         back_populates="articles",
+        lazy="raise",
     )
+
+
+# Articles worth ingesting - filtered in SQL so empty rows are never fetched.
+# (Compared with "" rather than length(), which SQL Server spells LEN.)
+HAS_CONTENT = and_(Article.content.isnot(None), Article.content != "")
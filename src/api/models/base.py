@@ -3,14 +3,64 @@ Base model class for all SQLAlchemy models.
 
 This provides:
 - Common columns (id, created_at, updated_at)
+- Time-ordered UUIDs for primary keys (uuid7, or its SQL Server layout)
 - Consistent naming conventions
 - A declarative base for model inheritance
 """
 
-from datetime import datetime
+import os
+import re
+import time
+import uuid
+from datetime import UTC, datetime
 
 from sqlalchemy import DateTime, func
-from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.orm import DeclarativeBase, Mapped, declared_attr, mapped_column
+
+# Position before each uppercase letter except the first (UserSession -> User_Session)
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
+
+
+def uuid7() -> uuid.UUID:
+    """
+    Generate a time-ordered UUID (version 7, RFC 9562).
+
+    The first 48 bits are the Unix time in milliseconds and the rest is
+    random, so new IDs sort after older ones. Used as the primary key
+    default for high-volume tables: inserts append to the end of the
+    index instead of landing on random pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    value = (timestamp_ms << 80) | int.from_bytes(os.urandom(10), "big")
+    value &= ~(0xF << 76) & ~(0x3 << 62)  # Clear version and variant bits
+    value |= (0x7 << 76) | (0x2 << 62)  # Version 7, RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+def _utcnow() -> datetime:
+    return datetime.now(UTC)
+
+
+def mssql_sequential_uuid() -> uuid.UUID:
+    """
+    uuid7 rearranged for SQL Server.
+
+    UNIQUEIDENTIFIER compares the last six bytes first, so the timestamp
+    goes there (the layout NEWSEQUENTIALID() and COMB GUIDs use) and new
+    IDs still append to the end of the clustered index.
+    """
+    raw = uuid7().bytes
+    return uuid.UUID(bytes=raw[6:] + raw[:6])
+
+
+def new_id(dialect_name: str) -> uuid.UUID:
+    """Time-ordered primary key in the byte order the database sorts by."""
+    return mssql_sequential_uuid() if dialect_name == "mssql" else uuid7()
+
+
+def time_ordered_id(context) -> uuid.UUID:
+    """Column default: new_id for the dialect the INSERT runs on."""
+    return new_id(context.dialect.name)
 
 
 class Base(DeclarativeBase):
@@ -26,14 +76,10 @@ class Base(DeclarativeBase):
 
     # Automatically generate table names from class names
     # UserSession -> user_session
-    @classmethod
+    @declared_attr.directive
     def __tablename__(cls) -> str:
         """Generate table name from class name (CamelCase -> snake_case)."""
-        name = cls.__name__
-        # Insert underscore before uppercase letters and lowercase everything
-        import re
-
-        return re.sub(r"(?<!^)(?=[A-Z])", "_", name).lower()
+        return _CAMEL_RE.sub("_", cls.__name__).lower()
 
 
 class TimestampMixin:
@@ -51,9 +97,11 @@ class TimestampMixin:
         nullable=False,
     )
 
+    # Set in Python on update: the server's now() has one-second resolution
+    # on SQLite, and ETags built from updated_at must change on every write
     updated_at: Mapped[datetime] = mapped_column(
         DateTime(timezone=True),
         server_default=func.now(),
-        onupdate=func.now(),
+        onupdate=_utcnow,
         nullable=False,
     )
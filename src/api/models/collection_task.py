@@ -9,10 +9,10 @@ import uuid
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, DateTime, ForeignKey, JSON, Text
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, JSON, Text, text
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.api.models.base import Base, TimestampMixin
+from src.api.models.base import Base, TimestampMixin, time_ordered_id
 
 if TYPE_CHECKING:
     from src.api.models.source import Source
@@ -27,24 +27,51 @@ class CollectionTask(Base, TimestampMixin):
     """
 
     __tablename__ = "collection_tasks"
+    __table_args__ = (
+        # Task history per source (or collect-all, source_id IS NULL),
+        # newest-first; also serves the "already running?" source lookups
+        Index("ix_collection_tasks_source_id_created_at", "source_id", "created_at"),
+        # At most one running task per source, enforced by the database so
+        # it holds across gunicorn workers and replicas
+        Index(
+            "ux_collection_tasks_one_running_per_source",
+            "source_id",
+            unique=True,
+            mssql_where=text("running = 1"),
+            postgresql_where=text("running"),
+            sqlite_where=text("running = 1"),
+        ),
+        # ...and at most one running collect-all. SQLite and PostgreSQL treat
+        # NULL source_ids as distinct in the index above, so it doesn't
+        # cover them; every row here has running = 1, so unique on it
+        # allows a single one
+        Index(
+            "ux_collection_tasks_one_running_collect_all",
+            "running",
+            unique=True,
+            mssql_where=text("running = 1 AND source_id IS NULL"),
+            postgresql_where=text("running AND source_id IS NULL"),
+            sqlite_where=text("running = 1 AND source_id IS NULL"),
+        ),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=time_ordered_id,
     )
 
     # NULL = collect-all; set = single-source collection
     source_id: Mapped[Optional[uuid.UUID]] = mapped_column(
         ForeignKey("sources.id"),
         nullable=True,
-        index=True,
     )
 
+    # Not indexed on its own: "running?" lookups always name the source
+    # and use the ux_collection_tasks_one_running_* indexes
     running: Mapped[bool] = mapped_column(
         Boolean,
         default=False,
         nullable=False,
-        index=True,
     )
 
     started_at: Mapped[Optional[datetime]] = mapped_column(
@@ -71,5 +98,5 @@ class CollectionTask(Base, TimestampMixin):
     # Relationship to Source (optional, for single-source tasks)
     source: Mapped[Optional["Source"]] = relationship(
         "Source",
-        lazy="selectin",
+        lazy="raise",
     )
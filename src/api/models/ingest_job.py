@@ -0,0 +1,65 @@
+"""
+IngestJob model - tracks background bulk ingests into Qdrant.
+
+Each row represents one POST /articles/ingest-all run. Progress is written
+after every batch, so any gunicorn worker or Azure replica can report it.
+"""
+
+import uuid
+from datetime import datetime
+
+from sqlalchemy import Boolean, DateTime, Index, Integer, Text, text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from src.api.models.base import Base, TimestampMixin, time_ordered_id
+
+
+class IngestJob(Base, TimestampMixin):
+    """A background bulk ingest of all articles into the vector store."""
+
+    __tablename__ = "ingest_jobs"
+    __table_args__ = (
+        # At most one running job, enforced by the database so it holds
+        # across gunicorn workers and replicas; every row here has
+        # running = 1, so unique on it allows a single one
+        Index(
+            "ux_ingest_jobs_one_running",
+            "running",
+            unique=True,
+            mssql_where=text("running = 1"),
+            postgresql_where=text("running"),
+            sqlite_where=text("running = 1"),
+        ),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(
+        primary_key=True,
+        default=time_ordered_id,
+    )
+
+    running: Mapped[bool] = mapped_column(
+        Boolean,
+        default=False,
+        nullable=False,
+    )
+
+    started_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    finished_at: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True),
+        nullable=True,
+    )
+
+    # Progress, updated after every batch
+    total: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    ingested: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    failed: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    chunks_created: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+
+    error: Mapped[str | None] = mapped_column(
+        Text,
+        nullable=True,
+    )
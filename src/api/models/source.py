@@ -8,7 +8,7 @@ from typing import Optional, TYPE_CHECKING
 from sqlalchemy import String, Boolean, Text, JSON
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from src.api.models.base import Base, TimestampMixin
+from src.api.models.base import Base, TimestampMixin, time_ordered_id
 
 if TYPE_CHECKING:
     from src.api.models.article import Article
@@ -25,7 +25,7 @@ class Source(Base, TimestampMixin):
 
     id: Mapped[uuid.UUID] = mapped_column(
         primary_key=True,
-        default=uuid.uuid4,
+        default=time_ordered_id,
     )
 
     # Source identification
@@ -59,7 +59,7 @@ class Source(Base, TimestampMixin):
     articles: Mapped[list["Article"]] = relationship(
         "Article",
         back_populates="source",
-        lazy="selectin",
+        lazy="raise",
     )
 
     # Type of source: "rss", "newsapi", or "static"
@@ -2,123 +2,295 @@
 Article management endpoints (CRUD).
 """
 
+import asyncio
+import base64
+import binascii
+import json
+import logging
 import uuid
-
-from fastapi import APIRouter, HTTPException, status, Query
-from sqlalchemy import select, func
-
-
-from src.api.core.deps import DbSession, CurrentUser
-from src.api.models import Article, Source
+from datetime import UTC, datetime, timedelta
+
+import orjson
+from fastapi import (
+    APIRouter,
+    BackgroundTasks,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import Row, and_, delete, func, insert, literal, or_, select, text, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.api.core.config import settings
+from src.api.core.database import AsyncSessionLocal
+from src.api.core.deps import CurrentSuperuser, CurrentUser, DbSession
+from src.api.core.http import etag_matches
+from src.api.models import Article, IngestJob, Source
+from src.api.models.article import HAS_CONTENT
+from src.api.models.base import new_id
 from src.api.schemas import (
+    ArticleCountResponse,
     ArticleCreate,
-    ArticleUpdate,
-    ArticleResponse,
     ArticleListResponse,
+    ArticleResponse,
+    ArticleUpdate,
 )
-
 from src.api.services.ai import ai_service
 from src.rag.retriever import rag_retriever
-import logging
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/articles", tags=["Articles"])
 
+# Bulk ingest: articles read from the database per query, chunks embedded
+# and upserted to Qdrant per request, and batches in flight at once
+INGEST_ARTICLES_PER_BATCH = 64
+INGEST_CHUNKS_PER_BATCH = 64
+INGEST_CONCURRENT_BATCHES = 4
+
+# A running job whose row hasn't been updated for this long died with its
+# worker (restart, crash, scale-in) - every batch bumps updated_at
+INGEST_JOB_STALE_SECONDS = 600
+
+# Only the columns bulk ingest needs (plain rows, no ORM objects)
+INGEST_COLUMNS = (
+    Article.id,
+    Article.source_id,
+    Article.title,
+    Article.url,
+    Article.author,
+    Article.content,
+    Article.published_at,
+)
+
+# The columns of an ArticleResponse, selected as plain rows for listings
+LIST_COLUMNS = tuple(getattr(Article, name) for name in ArticleResponse.model_fields)
+
+
+def _article_metadata(article: Article | Row) -> dict:
+    """Payload stored with an article's chunks in Qdrant."""
+    metadata = {
+        "article_id": str(article.id),
+        "source_id": str(article.source_id),
+        "title": article.title,
+        "url": article.url,
+        "author": article.author or "Unknown",
+    }
+    if article.published_at:
+        metadata["published_at"] = article.published_at.isoformat()
+    return metadata
+
+
+def _ingest_article(article_id: uuid.UUID, content: str, metadata: dict) -> None:
+    """
+    Chunk, embed and store a new article in Qdrant.
+
+    Runs as a background task (Starlette puts sync tasks in its threadpool),
+    so it only gets plain values - never the request's session or ORM objects.
+    """
+    try:
+        num_chunks = rag_retriever.ingest_document(
+            text=content,
+            metadata=metadata,
+            chunk_size=500,
+        )
+        logger.info(f"Ingested article {article_id} into Qdrant ({num_chunks} chunks)")
+    except Exception as e:  # noqa: BLE001 - embed/upsert errors vary; must not fail the task
+        # Article creation already succeeded; it can be re-ingested later
+        logger.warning(f"Failed to ingest article {article_id} to Qdrant: {e}")
+
 
 @router.post("/", response_model=ArticleResponse, status_code=status.HTTP_201_CREATED)
 async def create_article(
     article_data: ArticleCreate,
     db: DbSession,
     current_user: CurrentUser,
+    background_tasks: BackgroundTasks,
 ) -> Article:
     """Create a new article."""
-    # Verify source exists
-    result = await db.execute(select(Source).where(Source.id == article_data.source_id))
-    if not result.scalar_one_or_none():
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Source not found",
+    # One round trip: INSERT ... SELECT FROM sources WHERE id = :source_id.
+    # It inserts nothing if the source doesn't exist, and the unique index
+    # on url rejects duplicates - also between concurrent requests, which a
+    # check-then-insert would let through
+    values = {"id": new_id(db.bind.dialect.name), **article_data.model_dump()}
+    columns = Article.__table__.c
+    stmt = (
+        insert(Article)
+        .from_select(
+            list(values),
+            select(
+                *(literal(value, columns[key].type).label(key) for key, value in values.items())
+            ).where(Source.id == article_data.source_id),
         )
+        .returning(Article)
+    )
 
-    # Check if article URL already exists
-    result = await db.execute(select(Article).where(Article.url == article_data.url))
-    if result.scalar_one_or_none():
+    try:
+        result = await db.execute(stmt)
+        article = result.scalar_one_or_none()
+    except IntegrityError:
+        await db.rollback()
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Article with this URL already exists",
         )
 
-    article = Article(**article_data.model_dump())
-    db.add(article)
+    if article is None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Source not found",
+        )
     await db.commit()
-    await db.refresh(article)
 
-    # Auto-ingest to Qdrant for RAG retrieval
+    # Auto-ingest to Qdrant for RAG retrieval, after the response is sent
     if article.content:
-        try:
-            metadata = {
-                "article_id": str(article.id),
-                "source_id": str(article.source_id),
-                "title": article.title,
-                "url": article.url,
-                "author": article.author or "Unknown",
-            }
-            if article.published_at:
-                metadata["published_at"] = article.published_at.isoformat()
-
-            num_chunks = rag_retriever.ingest_document(
-                text=article.content,
-                metadata=metadata,
-                chunk_size=500,
-            )
-            logger.info(f"Ingested article {article.id} into Qdrant ({num_chunks} chunks)")
-        except Exception as e:
-            # Don't fail article creation if Qdrant ingestion fails
-            logger.warning(f"Failed to ingest article {article.id} to Qdrant: {e}")
+        background_tasks.add_task(
+            _ingest_article, article.id, article.content, _article_metadata(article)
+        )
 
     return article
 
 
+def _encode_cursor(article: Article | Row) -> str:
+    """Opaque cursor pointing just past article in newest-first order."""
+    payload = {"f": article.fetched_at.isoformat(), "i": str(article.id)}
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, uuid.UUID]:
+    """Inverse of _encode_cursor. Raises HTTPException 400 if malformed."""
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["f"]), uuid.UUID(payload["i"])
+    except (binascii.Error, ValueError, KeyError, TypeError):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+
+
 @router.get("/", response_model=ArticleListResponse)
 async def list_articles(
     db: DbSession,
-    page: int = Query(1, ge=1),
+    cursor: str | None = None,
     per_page: int = Query(20, ge=1, le=100),
     source_id: uuid.UUID | None = None,
-) -> ArticleListResponse:
-    """List articles with pagination."""
-    # Base query
-    query = select(Article)
-    count_query = select(func.count(Article.id))
+) -> Response:
+    """
+    List articles newest first, one page at a time.
+
+    Keyset pagination: each page ends with next_cursor, and passing it back
+    as ?cursor= continues after the last article seen. Every page is an
+    index seek on (fetched_at, id), however deep, and articles collected
+    in the meantime don't shift items between pages.
+    """
+    query = select(*LIST_COLUMNS)
 
     # Filter by source if provided
     if source_id:
         query = query.where(Article.source_id == source_id)
-        count_query = count_query.where(Article.source_id == source_id)
 
-    # Get total count
-    total_result = await db.execute(count_query)
-    total = total_result.scalar() or 0
+    # Continue after the cursor's article. Spelled out rather than as a
+    # row-value comparison, which SQL Server doesn't support
+    if cursor:
+        fetched_at, article_id = _decode_cursor(cursor)
+        query = query.where(
+            or_(
+                Article.fetched_at < fetched_at,
+                and_(Article.fetched_at == fetched_at, Article.id < article_id),
+            )
+        )
 
-    # Apply pagination and ordering
-    offset = (page - 1) * per_page
-    query = query.order_by(Article.fetched_at.desc()).offset(offset).limit(per_page)
+    # One extra row tells us whether there's another page
+    query = query.order_by(Article.fetched_at.desc(), Article.id.desc()).limit(per_page + 1)
 
     result = await db.execute(query)
-    items = list(result.scalars().all())
+    rows = list(result.all())
+    has_more = len(rows) > per_page
+    rows = rows[:per_page]
+
+    # The hottest endpoint: rows go straight to orjson, which handles UUIDs
+    # and datetimes natively, instead of through an ArticleResponse per row
+    # and response validation. response_model still documents the shape;
+    # OPT_UTC_Z keeps datetimes formatted the way Pydantic writes them
+    payload = {
+        "items": [row._asdict() for row in rows],
+        "per_page": per_page,
+        "next_cursor": _encode_cursor(rows[-1]) if has_more else None,
+        "has_more": has_more,
+    }
+    return Response(orjson.dumps(payload, option=orjson.OPT_UTC_Z), media_type="application/json")
 
-    return ArticleListResponse(
-        items=items,
-        total=total,
-        page=page,
-        per_page=per_page,
-    )
+
+# Row count SQL Server keeps in the catalog for the heap/clustered index.
+# Approximate while writes are in flight, but a metadata read, not a scan
+# (and unlike the sys.dm_* views it doesn't need VIEW DATABASE STATE)
+_MSSQL_ARTICLE_ROWS = text(
+    "SELECT SUM(rows) FROM sys.partitions "
+    "WHERE object_id = OBJECT_ID('articles') AND index_id IN (0, 1)"
+)
+
+
+@router.get("/count", response_model=ArticleCountResponse)
+async def count_articles(
+    db: DbSession,
+    source_id: uuid.UUID | None = None,
+    estimate: bool = False,
+) -> ArticleCountResponse:
+    """
+    Count articles, optionally for one source (kept off the listing path).
+
+    With ?estimate=true the unfiltered total is read from SQL Server's
+    catalog instead of counted. Per-source counts are always exact - they
+    only scan that source's entries in the (source_id, ...) index.
+    """
+    if estimate and source_id is None and settings.DATABASE_URL.startswith("mssql"):
+        result = await db.execute(_MSSQL_ARTICLE_ROWS)
+        return ArticleCountResponse(total=result.scalar() or 0, estimated=True)
+
+    query = select(func.count(Article.id))
+    if source_id:
+        query = query.where(Article.source_id == source_id)
+
+    result = await db.execute(query)
+    return ArticleCountResponse(total=result.scalar() or 0)
+
+
+def _article_etag(article_id: uuid.UUID, updated_at: datetime) -> str:
+    """Weak ETag for an article version - it changes whenever updated_at does."""
+    return f'W/"{article_id}-{int(updated_at.timestamp() * 1_000_000)}"'
 
 
-@router.get("/{article_id}", response_model=ArticleResponse)
-async def get_article(article_id: uuid.UUID, db: DbSession) -> Article:
-    """Get a specific article by ID."""
+@router.get(
+    "/{article_id}",
+    response_model=ArticleResponse,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Client copy is current"}},
+)
+async def get_article(
+    article_id: uuid.UUID,
+    response: Response,
+    db: DbSession,
+    if_none_match: str | None = Header(None),
+) -> Article | Response:
+    """
+    Get a specific article by ID.
+
+    Responses carry an ETag. A client sending it back as If-None-Match
+    gets 304 Not Modified if the article hasn't changed - checked by
+    reading updated_at alone, without loading or sending the content.
+    """
+    if if_none_match:
+        result = await db.execute(select(Article.updated_at).where(Article.id == article_id))
+        updated_at = result.scalar_one_or_none()
+        if updated_at is not None:
+            etag = _article_etag(article_id, updated_at)
+            if etag_matches(if_none_match, etag):
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+
     result = await db.execute(select(Article).where(Article.id == article_id))
     article = result.scalar_one_or_none()
 
@@ -127,6 +299,8 @@ async def get_article(article_id: uuid.UUID, db: DbSession) -> Article:
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found",
         )
+
+    response.headers["ETag"] = _article_etag(article.id, article.updated_at)
     return article
 
 
@@ -138,7 +312,14 @@ async def update_article(
     current_user: CurrentUser,
 ) -> Article:
     """Update an article (e.g., add AI-generated summary)."""
-    result = await db.execute(select(Article).where(Article.id == article_id))
+    # Update only provided fields - one UPDATE ... RETURNING (OUTPUT on
+    # SQL Server) rather than loading the row, flushing and refreshing it
+    update_data = article_data.model_dump(exclude_unset=True)
+    query = select(Article)
+    if update_data:
+        query = update(Article).values(**update_data).returning(Article)
+
+    result = await db.execute(query.where(Article.id == article_id))
     article = result.scalar_one_or_none()
 
     if not article:
@@ -147,13 +328,7 @@ async def update_article(
             detail="Article not found",
         )
 
-    # Update only provided fields
-    update_data = article_data.model_dump(exclude_unset=True)
-    for field, value in update_data.items():
-        setattr(article, field, value)
-
     await db.commit()
-    await db.refresh(article)
     return article
 
 
@@ -164,16 +339,16 @@ async def delete_article(
     current_user: CurrentUser,
 ) -> None:
     """Delete an article."""
-    result = await db.execute(select(Article).where(Article.id == article_id))
-    article = result.scalar_one_or_none()
+    # A single DELETE; the row count says whether it existed, so the
+    # article (content and all) is never loaded
+    result = await db.execute(delete(Article).where(Article.id == article_id))
 
-    if not article:
+    if result.rowcount == 0:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Article not found",
         )
 
-    await db.delete(article)
     await db.commit()
 
 
@@ -230,19 +405,9 @@ async def ingest_article_to_qdrant(
 
     # Ingest to Qdrant
     try:
-        metadata = {
-            "article_id": str(article.id),
-            "source_id": str(article.source_id),
-            "title": article.title,
-            "url": article.url,
-            "author": article.author or "Unknown",
-        }
-        if article.published_at:
-            metadata["published_at"] = article.published_at.isoformat()
-
         num_chunks = rag_retriever.ingest_document(
             text=article.content,
-            metadata=metadata,
+            metadata=_article_metadata(article),
             chunk_size=500,
         )
 
@@ -255,50 +420,216 @@ async def ingest_article_to_qdrant(
         raise HTTPException(status_code=500, detail=f"Ingestion failed: {str(e)}")
 
 
-@router.post("/ingest-all")
-async def ingest_all_articles_to_qdrant(
-    db: DbSession,
-    current_user: CurrentUser,
-) -> dict:
-    """
-    Ingest all articles from the database into Qdrant.
+# ---------------------------------------------------------------------------
+# Bulk ingest - runs as a background job, progress kept in ingest_jobs
+# ---------------------------------------------------------------------------
+
+# Strong references to running jobs (the event loop only keeps weak ones)
+_ingest_tasks: set[asyncio.Task] = set()
+
+
+def _ingest_job_to_status(job: IngestJob) -> dict:
+    """Convert an IngestJob row to the API status response dict."""
+    return {
+        "job_id": str(job.id),
+        "running": job.running,
+        "started_at": job.started_at.isoformat() if job.started_at else None,
+        "finished_at": job.finished_at.isoformat() if job.finished_at else None,
+        "articles_total": job.total,
+        "articles_ingested": job.ingested,
+        "articles_failed": job.failed,
+        "total_chunks_created": job.chunks_created,
+        "error": job.error,
+    }
+
+
+async def _update_ingest_job(job_id: uuid.UUID, **values) -> None:
+    """Write progress to an IngestJob row (in its own short session)."""
+    async with AsyncSessionLocal() as db:
+        await db.execute(update(IngestJob).where(IngestJob.id == job_id).values(**values))
+        await db.commit()
+
 
-    This is a bulk operation for initial setup or re-indexing.
+async def _fail_stale_ingest_jobs(db: AsyncSession) -> None:
     """
-    # Get all articles with content
-    result = await db.execute(select(Article).where(Article.content.isnot(None)))
-    articles = result.scalars().all()
+    Mark running jobs that stopped making progress as failed.
 
-    total_chunks = 0
-    ingested = 0
-    failed = 0
+    Otherwise a job lost mid-run would block every later /ingest-all and
+    leave Qdrant's HNSW indexing paused, so the pause is undone here too
+    unless another job is still running.
+    """
+    cutoff = datetime.now(UTC) - timedelta(seconds=INGEST_JOB_STALE_SECONDS)
+    result = await db.execute(
+        update(IngestJob)
+        .where(IngestJob.running == true(), IngestJob.updated_at < cutoff)
+        .values(
+            running=False,
+            finished_at=datetime.now(UTC),
+            error=f"Abandoned: no progress for {INGEST_JOB_STALE_SECONDS} seconds",
+        )
+    )
+    if not result.rowcount:
+        return
 
-    for article in articles:
+    logger.warning(f"Failed {result.rowcount} abandoned ingest job(s)")
+    running = await db.scalar(select(IngestJob.id).where(IngestJob.running == true()).limit(1))
+    if running is None:
         try:
-            metadata = {
-                "article_id": str(article.id),
-                "source_id": str(article.source_id),
-                "title": article.title,
-                "url": article.url,
-                "author": article.author or "Unknown",
-            }
-            if article.published_at:
-                metadata["published_at"] = article.published_at.isoformat()
+            await asyncio.to_thread(rag_retriever.store.resume_indexing)
+        except Exception as e:  # noqa: BLE001 - Qdrant client errors vary; the sweep still counts
+            logger.warning(f"Could not resume Qdrant indexing: {e}")
 
-            num_chunks = rag_retriever.ingest_document(
-                text=article.content,
-                metadata=metadata,
+
+async def _create_running_ingest_job(db: AsyncSession) -> IngestJob | None:
+    """
+    Insert a running ingest job.
+
+    Returns None if one is already running. The unique index on running
+    jobs makes the INSERT itself the guard, so two requests that both
+    passed the "already running?" check (in different workers, say) can't
+    both start an ingest.
+    """
+    job = IngestJob(running=True, started_at=datetime.now(UTC))
+    db.add(job)
+    try:
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+    return job
+
+
+async def _fetch_ingest_batch(after_id: uuid.UUID | None) -> list[Row]:
+    """
+    Next batch of articles with content, in id order.
+
+    Keyset iteration with a short session per batch, so a long job never
+    holds a connection or transaction open between batches.
+    """
+    query = select(*INGEST_COLUMNS).where(HAS_CONTENT)
+    if after_id is not None:
+        query = query.where(Article.id > after_id)
+    query = query.order_by(Article.id).limit(INGEST_ARTICLES_PER_BATCH)
+
+    async with AsyncSessionLocal() as db:
+        return list((await db.execute(query)).all())
+
+
+async def _run_ingest_job(job_id: uuid.UUID) -> None:
+    """
+    Ingest every article with content into Qdrant.
+
+    Each batch's chunks are embedded and upserted together, with a few
+    batches in flight while the next ones are read. HNSW indexing is
+    paused for the upload and the index built once at the end.
+    """
+    slots = asyncio.Semaphore(INGEST_CONCURRENT_BATCHES)
+
+    async def ingest_batch(articles: list[Row]) -> None:
+        try:
+            # Embedding is blocking CPU/GPU work - keep it off the event loop
+            counts = await asyncio.to_thread(
+                rag_retriever.ingest_documents_batch,
+                texts=[article.content for article in articles],
+                metadatas=[_article_metadata(article) for article in articles],
                 chunk_size=500,
+                batch_size=INGEST_CHUNKS_PER_BATCH,
             )
-            total_chunks += num_chunks
-            ingested += 1
-        except Exception as e:
-            logger.warning(f"Failed to ingest article {article.id}: {e}")
-            failed += 1
+        except Exception as e:  # noqa: BLE001 - embed/upsert errors vary; count the batch as failed
+            logger.warning(f"Failed to ingest a batch of {len(articles)} articles: {e}")
+            progress = {"failed": IngestJob.failed + len(articles)}
+        else:
+            progress = {
+                "ingested": IngestJob.ingested + len(articles),
+                "chunks_created": IngestJob.chunks_created + sum(counts),
+            }
+        finally:
+            slots.release()
+        # Increment in SQL - batches finish concurrently
+        await _update_ingest_job(job_id, **progress)
+
+    error = None
+    tasks = []
+    try:
+        async with AsyncSessionLocal() as db:
+            total = await db.scalar(select(func.count(Article.id)).where(HAS_CONTENT))
+        await _update_ingest_job(job_id, total=total or 0)
+
+        threshold = await asyncio.to_thread(rag_retriever.store.pause_indexing)
+        try:
+            after_id = None
+            while True:
+                # Wait for a free slot before reading on, so only a bounded
+                # number of batches are held in memory
+                await slots.acquire()
+                articles = await _fetch_ingest_batch(after_id)
+                if not articles:
+                    slots.release()
+                    break
+                after_id = articles[-1].id
+                tasks.append(asyncio.create_task(ingest_batch(articles)))
+        finally:
+            # Let in-flight batches land before the index is rebuilt
+            await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.to_thread(rag_retriever.store.resume_indexing, threshold)
+    except Exception as e:  # noqa: BLE001 - any failure must still finish the job row
+        logger.error(f"Bulk ingest {job_id} failed: {e}")
+        error = str(e)
+
+    await _update_ingest_job(job_id, running=False, finished_at=datetime.now(UTC), error=error)
+
+
+@router.post("/ingest-all", status_code=status.HTTP_202_ACCEPTED)
+async def ingest_all_articles_to_qdrant(
+    request: Request,
+    db: DbSession,
+    current_user: CurrentSuperuser,
+) -> dict:
+    """
+    Start ingesting all articles from the database into Qdrant.
+
+    This is a bulk operation for initial setup or re-indexing. It runs in
+    the background, so the response is immediate; poll status_url
+    (GET /articles/ingest-jobs/{job_id}) to track progress.
+
+    Searches scan newly added points without the HNSW index until the job
+    finishes. Superusers only, since that slows search for everyone.
+    """
+    # Only one bulk ingest at a time - they'd fight over the indexing pause
+    await _fail_stale_ingest_jobs(db)
+    running_job = select(IngestJob).where(IngestJob.running == true()).limit(1)
+    job = (await db.execute(running_job)).scalar_one_or_none()
+    message = "Ingest already in progress"
+
+    if job is None:
+        job = await _create_running_ingest_job(db)
+        if job is None:
+            # Another request started one since the check above
+            job = (await db.execute(running_job)).scalar_one()
+        else:
+            message = "Ingest started"
+            task = asyncio.create_task(_run_ingest_job(job.id))
+            _ingest_tasks.add(task)
+            task.add_done_callback(_ingest_tasks.discard)
 
     return {
-        "status": "complete",
-        "articles_ingested": ingested,
-        "articles_failed": failed,
-        "total_chunks_created": total_chunks,
+        "message": message,
+        "status": "running",
+        "job_id": str(job.id),
+        "status_url": request.app.url_path_for("get_ingest_job", job_id=str(job.id)),
     }
+
+
+@router.get("/ingest-jobs/{job_id}")
+async def get_ingest_job(
+    job_id: uuid.UUID,
+    db: DbSession,
+    current_user: CurrentUser,
+) -> dict:
+    """Return the progress of a bulk ingest job."""
+    result = await db.execute(select(IngestJob).where(IngestJob.id == job_id))
+    job = result.scalar_one_or_none()
+
+    if not job:
+        raise HTTPException(status_code=404, detail="Ingest job not found")
+    return _ingest_job_to_status(job)
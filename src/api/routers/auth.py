@@ -2,19 +2,34 @@
 Authentication endpoints: login, register, 2FA setup.
 """
 
+import asyncio
+import base64
+from io import BytesIO
+
 import pyotp
-from fastapi import APIRouter, Depends, HTTPException, Request, status
-from fastapi.security import OAuth2PasswordRequestForm
+from fastapi import APIRouter, HTTPException, Request, status
 from pydantic import BaseModel
 from sqlalchemy import select
 
 from src.api.core.config import settings
-from src.api.core.deps import CurrentUser, DbSession
+from src.api.core.deps import CurrentUser, DbSession, PasswordForm, invalidate_user_cache
 from src.api.core.rate_limit import RATE_LIMIT_AUTH, RATE_LIMIT_REGISTER, limiter
-from src.api.core.security import create_access_token, hash_password, verify_password
+from src.api.core.security import (
+    DUMMY_PASSWORD_HASH,
+    create_access_token,
+    hash_password,
+    password_needs_rehash,
+    verify_password,
+)
 from src.api.models import User
 from src.api.schemas import Token, UserCreate, UserResponse
 
+# QR code generation for 2FA setup is optional
+try:
+    import qrcode
+except ImportError:
+    qrcode = None
+
 
 router = APIRouter(prefix="/auth", tags=["Authentication"])
 
@@ -47,10 +62,11 @@ async def register(request: Request, user_data: UserCreate, db: DbSession) -> Us
             detail="Email already registered",
         )
 
-    # Create new user with hashed password
+    # Create new user with hashed password (in a thread: hashing is
+    # deliberately CPU-heavy and would stall every other request)
     user = User(
         email=user_data.email,
-        hashed_password=hash_password(user_data.password),
+        hashed_password=await asyncio.to_thread(hash_password, user_data.password),
         full_name=user_data.full_name,
     )
 
@@ -65,7 +81,7 @@ async def register(request: Request, user_data: UserCreate, db: DbSession) -> Us
 @limiter.limit(RATE_LIMIT_AUTH)
 async def login(
     request: Request,
-    form_data: OAuth2PasswordRequestForm = Depends(),
+    form_data: PasswordForm,
     db: DbSession = None,
 ) -> Token:
     """
@@ -87,13 +103,22 @@ async def login(
     if ":" in password:
         password, totp_code = password.rsplit(":", 1)
 
-    if not user or not verify_password(password, user.hashed_password):
+    # Always run a full hash check (in a thread: it's deliberately CPU-heavy),
+    # even for unknown emails, so response time doesn't reveal which exist
+    hashed_password = user.hashed_password if user else DUMMY_PASSWORD_HASH
+    password_ok = await asyncio.to_thread(verify_password, password, hashed_password)
+    if not user or not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # Upgrade hashes from older schemes (bcrypt) now that we have the password
+    if password_needs_rehash(user.hashed_password):
+        user.hashed_password = await asyncio.to_thread(hash_password, password)
+        await db.commit()
+
     if not user.is_active:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -108,8 +133,6 @@ async def login(
                 detail="2FA code required. Provide as password:code",
                 headers={"WWW-Authenticate": "Bearer"},
             )
-        import pyotp
-
         totp = pyotp.TOTP(user.totp_secret)
         if not totp.verify(totp_code):
             raise HTTPException(
@@ -143,6 +166,27 @@ class TOTPVerifyRequest(BaseModel):
     code: str
 
 
+def _qr_code_base64(data: str) -> str | None:
+    """Base64 PNG QR code for data (None if qrcode isn't installed)."""
+    if qrcode is None:
+        return None
+
+    # Low error correction (the code is scanned off a screen, not print)
+    # and a fixed mask: qrcode.make() scores all eight masks to pick one,
+    # most of its ~15ms. box_size 4 renders about the size it's shown at
+    qr = qrcode.QRCode(
+        error_correction=qrcode.constants.ERROR_CORRECT_L,
+        box_size=4,
+        mask_pattern=0,
+    )
+    qr.add_data(data)
+    qr.make(fit=True)
+
+    buffer = BytesIO()
+    qr.make_image().save(buffer, format="PNG")
+    return base64.b64encode(buffer.getvalue()).decode()
+
+
 @router.post("/2fa/setup", response_model=TOTPSetupResponse)
 async def setup_2fa(
     current_user: CurrentUser,
@@ -174,25 +218,13 @@ async def setup_2fa(
         issuer_name=settings.APP_NAME,
     )
 
-    # Generate QR code
-    qr_base64 = None
-    try:
-        import qrcode
-        import qrcode.image.svg
-        from io import BytesIO
-        import base64
-
-        qr = qrcode.make(provisioning_uri)
-        buffer = BytesIO()
-        qr.save(buffer, format="PNG")
-        qr_base64 = base64.b64encode(buffer.getvalue()).decode()
-    except ImportError:
-        pass  # QR code generation is optional
+    qr_base64 = _qr_code_base64(provisioning_uri)
 
     # Store secret temporarily (not enabled until verified)
     # We store it but 2FA isn't enforced until user verifies
     current_user.totp_secret = secret
     await db.commit()
+    invalidate_user_cache(current_user.id)
 
     return TOTPSetupResponse(
         secret=secret,
@@ -255,5 +287,6 @@ async def disable_2fa(
 
     current_user.totp_secret = None
     await db.commit()
+    invalidate_user_cache(current_user.id)
 
     return {"message": "2FA disabled successfully"}
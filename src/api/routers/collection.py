@@ -1,24 +1,32 @@
 """
 Collection endpoints - trigger news article collection.
 
-Collection runs in a **thread pool** so it doesn't block the async event-loop
-(the collection pipeline contains synchronous CPU-bound work: feedparser,
-sentence-transformer embeddings, synchronous Qdrant client calls).
+Collection runs as a background task on the app's event loop. The pipeline's
+synchronous CPU-bound steps (feedparser, sentence-transformer embeddings,
+synchronous Qdrant client calls) are pushed to worker threads with
+asyncio.to_thread inside the collection service, so they don't block it.
 
 Status is stored in the database (collection_tasks table) so it's shared
 across gunicorn worker processes and Azure Container App replicas.
 """
 
 import asyncio
+import hashlib
 import logging
 import uuid
 from datetime import UTC, datetime
+from typing import Annotated
 
-from fastapi import APIRouter, HTTPException
-from sqlalchemy import select
+from cachetools import TTLCache
+from fastapi import APIRouter, Header, HTTPException, Query, Response, status
+from sqlalchemy import Row, and_, bindparam, func, select, true, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import aliased
 
 from src.api.core.database import AsyncSessionLocal
 from src.api.core.deps import CurrentUser, DbSession
+from src.api.core.http import etag_matches
 from src.api.models import CollectionTask, Source
 from src.collection.service import collect_all, collect_from_source
 
@@ -56,90 +64,203 @@ def _task_to_status(task: CollectionTask | None) -> dict:
 
 
 # ---------------------------------------------------------------------------
-# Background helpers — run blocking collection in a thread
+# Status reads — concurrent polls share one query
+# ---------------------------------------------------------------------------
+
+# Polls for the same status within this window (many open tabs, say) are
+# answered by a single query, at the cost of being up to this stale
+STATUS_COALESCE_SECONDS = 0.25
+
+# source_id (None = collect-all) -> in-flight or just-finished status read
+_status_reads: TTLCache[uuid.UUID | None, asyncio.Task] = TTLCache(
+    maxsize=1024, ttl=STATUS_COALESCE_SECONDS
+)
+
+
+# Built once: each poll only binds source_id instead of rebuilding the
+# statement and recomputing its compiled-cache key
+_LATEST_TASK = select(CollectionTask).order_by(CollectionTask.created_at.desc()).limit(1)
+_COLLECT_ALL_STATUS = _LATEST_TASK.where(CollectionTask.source_id.is_(None))
+_SOURCE_STATUS = _LATEST_TASK.where(CollectionTask.source_id == bindparam("source_id"))
+
+
+async def _read_status(source_id: uuid.UUID | None) -> dict:
+    """Status of the most recent task for a source (None = collect-all)."""
+    # Own session: the read outlives whichever request happened to start it
+    async with AsyncSessionLocal() as db:
+        if source_id is None:
+            result = await db.execute(_COLLECT_ALL_STATUS)
+        else:
+            result = await db.execute(_SOURCE_STATUS, {"source_id": source_id})
+        return _task_to_status(result.scalar_one_or_none())
+
+
+async def _coalesced_status(source_id: uuid.UUID | None) -> dict:
+    """_read_status, shared with other polls within STATUS_COALESCE_SECONDS."""
+    read = _status_reads.get(source_id)
+    if read is None:
+        read = asyncio.create_task(_read_status(source_id))
+        _status_reads[source_id] = read
+    # A poller disconnecting mustn't cancel the read for the others
+    return await asyncio.shield(read)
+
+
+def _status_etag(task_status: dict) -> str:
+    """
+    Weak ETag for a status payload.
+
+    result and error are only written together with finished_at, so
+    (running, started_at, finished_at) is enough to tell versions apart.
+    """
+    version = f"{task_status['running']}:{task_status['started_at']}:{task_status['finished_at']}"
+    return f'W/"{hashlib.md5(version.encode(), usedforsecurity=False).hexdigest()}"'
+
+
+def _status_response(
+    task_status: dict, response: Response, if_none_match: str | None
+) -> dict | Response:
+    """
+    The status payload, or 304 Not Modified if the poller already has it.
+
+    no-cache makes browsers revalidate every poll, so fetch() sends
+    If-None-Match on its own and turns the 304 back into the cached body.
+    """
+    headers = {"ETag": _status_etag(task_status), "Cache-Control": "no-cache"}
+    if if_none_match and etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return task_status
+
+
+# ---------------------------------------------------------------------------
+# Background helpers — run collection as a task on the event loop
 # ---------------------------------------------------------------------------
 
 async def _finish_task(task_id: str, result: dict | None, error: str | None) -> None:
     """Update a CollectionTask row as finished (success or failure)."""
     async with AsyncSessionLocal() as db:
-        row = (
-            await db.execute(
-                select(CollectionTask).where(
-                    CollectionTask.id == uuid.UUID(task_id)
-                )
-            )
-        ).scalar_one()
-        row.running = False
-        row.finished_at = datetime.now(UTC)
-        row.result = result
-        row.error = error
+        await db.execute(
+            update(CollectionTask)
+            .where(CollectionTask.id == uuid.UUID(task_id))
+            .values(running=False, finished_at=datetime.now(UTC), result=result, error=error)
+        )
         await db.commit()
 
 
-async def _run_collect_all_in_thread(task_id: str) -> None:
-    """Spawn blocking collection work in a thread so the event-loop stays free."""
+async def _finish_cancelled_task(task_id: str) -> None:
+    """
+    Record a collection cancelled mid-run (shutdown, scale-in) as finished.
+
+    Otherwise its row stays running and every later trigger for it reports
+    "already in progress". Shielded, so a second cancellation can't
+    interrupt the write.
+    """
+    await asyncio.shield(_finish_task(task_id, result=None, error="Cancelled"))
+
+
+# Running collections - the event loop only keeps weak references to tasks
+_collection_tasks: set[asyncio.Task] = set()
+
+
+def _start_collection(coro) -> None:
+    """Run a collection coroutine in the background on the current event loop."""
+    task = asyncio.create_task(coro)
+    _collection_tasks.add(task)
+    task.add_done_callback(_collection_tasks.discard)
+
+
+async def _run_collect_all(task_id: str) -> None:
+    """Collect from all sources, then record the outcome on the task row."""
     try:
-        result = await asyncio.to_thread(_collect_all_sync)
+        async with AsyncSessionLocal() as db:
+            result = await collect_all(db)
         await _finish_task(task_id, result=result, error=None)
         logger.info("Background collection completed successfully")
+    except asyncio.CancelledError:
+        logger.warning("Background collection cancelled")
+        await _finish_cancelled_task(task_id)
+        raise
     except Exception as e:
         logger.error(f"Background collection failed: {e}")
         await _finish_task(task_id, result=None, error=str(e))
 
 
-def _collect_all_sync() -> dict:
-    """Run collect_all inside a new event-loop on the worker thread."""
-    import asyncio as _asyncio
-
-    loop = _asyncio.new_event_loop()
-    try:
-        return loop.run_until_complete(_collect_all_async())
-    finally:
-        loop.close()
-
-
-async def _collect_all_async() -> dict:
-    """Async helper that creates its own DB session."""
-    async with AsyncSessionLocal() as db:
-        return await collect_all(db)
-
-
-async def _run_collect_source_in_thread(
-    task_id: str, source_id: str, source_name: str
-) -> None:
-    """Spawn single-source collection in a thread."""
+async def _run_collect_source(task_id: str, source_id: str, source_name: str) -> None:
+    """Collect from a single source, then record the outcome on the task row."""
     try:
-        stats = await asyncio.to_thread(_collect_source_sync, source_id)
+        async with AsyncSessionLocal() as db:
+            result = await db.execute(
+                select(Source).where(Source.id == uuid.UUID(source_id))
+            )
+            source = result.scalar_one_or_none()
+            if not source:
+                raise ValueError(f"Source {source_id} not found")
+            stats = await collect_from_source(source, db)
         await _finish_task(
             task_id, result={"source": source_name, **stats}, error=None
         )
         logger.info(f"Background collection for source '{source_name}' completed")
+    except asyncio.CancelledError:
+        logger.warning(f"Background collection for source '{source_name}' cancelled")
+        await _finish_cancelled_task(task_id)
+        raise
     except Exception as e:
         logger.error(f"Background collection for source '{source_name}' failed: {e}")
         await _finish_task(task_id, result=None, error=str(e))
 
 
-def _collect_source_sync(source_id: str) -> dict:
-    """Run collect_from_source inside a new event-loop on the worker thread."""
-    import asyncio as _asyncio
+def _running_task_query(source_id: uuid.UUID | None):
+    """
+    Query for the running task of a source (None = the running collect-all).
+
+    Selects started_at alone - all the trigger endpoints report - so the
+    check doesn't load a CollectionTask into the session.
+    """
+    if source_id is None:
+        source_filter = CollectionTask.source_id.is_(None)
+    else:
+        source_filter = CollectionTask.source_id == source_id
+    return (
+        select(CollectionTask.started_at)
+        .where(source_filter, CollectionTask.running == true())
+        .limit(1)
+    )
 
-    loop = _asyncio.new_event_loop()
+
+async def _create_running_task(
+    db: AsyncSession, source_id: uuid.UUID | None
+) -> CollectionTask | None:
+    """
+    Insert a running task for a source (None = collect-all).
+
+    Returns None if one is already running. The unique indexes on running
+    tasks (one per source, one for collect-all) make the INSERT itself
+    the guard, so two requests that both passed the "already running?"
+    check (in different workers, say) can't both start a collection.
+    """
+    task = CollectionTask(
+        source_id=source_id,
+        running=True,
+        started_at=datetime.now(UTC),
+    )
+    db.add(task)
     try:
-        return loop.run_until_complete(_collect_source_async(source_id))
-    finally:
-        loop.close()
+        await db.commit()
+    except IntegrityError:
+        await db.rollback()
+        return None
+    return task
 
 
-async def _collect_source_async(source_id: str) -> dict:
-    """Async helper that creates its own DB session for single-source."""
-    async with AsyncSessionLocal() as db:
-        result = await db.execute(
-            select(Source).where(Source.id == uuid.UUID(source_id))
-        )
-        source = result.scalar_one_or_none()
-        if not source:
-            raise ValueError(f"Source {source_id} not found")
-        return await collect_from_source(source, db)
+def _already_running(message: str, existing: Row | None) -> dict:
+    """Response for a trigger that found a collection already in progress."""
+    return {
+        "message": message,
+        "status": "running",
+        "started_at": existing.started_at.isoformat()
+        if existing and existing.started_at
+        else None,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -154,58 +275,38 @@ async def trigger_collect_all(
     """
     Kick off article collection from all active sources.
 
-    Runs in a background thread so the response is immediate.
+    Runs in the background so the response is immediate.
     Poll GET /collection/status to track progress.
     """
     # Check if a collect-all task is already running
-    existing = (
-        await db.execute(
-            select(CollectionTask).where(
-                CollectionTask.source_id.is_(None),
-                CollectionTask.running.is_(True),
-            )
-        )
-    ).scalar_one_or_none()
+    result = await db.execute(_running_task_query(None))
+    existing = result.first()
 
-    if existing:
-        return {
-            "message": "Collection already in progress",
-            "status": "running",
-            "started_at": existing.started_at.isoformat()
-            if existing.started_at
-            else None,
-        }
+    if existing is None:
+        task = await _create_running_task(db, None)
+        if task is not None:
+            _start_collection(_run_collect_all(str(task.id)))
+            return {"message": "Collection started", "status": "running"}
 
-    # Create a new task record
-    task = CollectionTask(
-        source_id=None,
-        running=True,
-        started_at=datetime.now(UTC),
-    )
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
+        # Lost a race with another request
+        result = await db.execute(_running_task_query(None))
+        existing = result.first()
 
-    # Fire-and-forget in a background thread
-    asyncio.create_task(_run_collect_all_in_thread(str(task.id)))
-    return {"message": "Collection started", "status": "running"}
+    return _already_running("Collection already in progress", existing)
 
 
-@router.get("/status")
+@router.get(
+    "/status",
+    response_model=dict,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Status is unchanged"}},
+)
 async def get_collection_status(
-    db: DbSession,
+    response: Response,
     current_user: CurrentUser,
-) -> dict:
+    if_none_match: str | None = Header(None),
+) -> dict | Response:
     """Return the current collection status (most recent collect-all task)."""
-    task = (
-        await db.execute(
-            select(CollectionTask)
-            .where(CollectionTask.source_id.is_(None))
-            .order_by(CollectionTask.created_at.desc())
-            .limit(1)
-        )
-    ).scalar_one_or_none()
-    return _task_to_status(task)
+    return _status_response(await _coalesced_status(None), response, if_none_match)
 
 
 @router.post("/collect/{source_id}")
@@ -217,13 +318,26 @@ async def trigger_collect_source(
     """
     Kick off article collection from a specific source.
 
-    Runs in a background thread so the response is immediate.
+    Runs in the background so the response is immediate.
     Poll GET /collection/status/{source_id} to track progress.
     """
-    # Verify source exists and is collectible
+    # Verify source exists and is collectible, and find its running task
+    # (at most one, by the unique index) in the same round trip
     source = (
-        await db.execute(select(Source).where(Source.id == source_id))
-    ).scalar_one_or_none()
+        await db.execute(
+            select(
+                Source.source_type,
+                Source.name,
+                CollectionTask.id.label("running_task_id"),
+                CollectionTask.started_at,
+            )
+            .outerjoin(
+                CollectionTask,
+                and_(CollectionTask.source_id == Source.id, CollectionTask.running == true()),
+            )
+            .where(Source.id == source_id)
+        )
+    ).first()
 
     if not source:
         raise HTTPException(status_code=404, detail="Source not found")
@@ -234,55 +348,66 @@ async def trigger_collect_source(
             detail="Cannot collect from a static source. Update source_type first.",
         )
 
-    # Check if already running for this source
-    existing = (
-        await db.execute(
-            select(CollectionTask).where(
-                CollectionTask.source_id == source_id,
-                CollectionTask.running.is_(True),
-            )
-        )
-    ).scalar_one_or_none()
+    source_name = source.name
+    existing = source if source.running_task_id is not None else None
 
-    if existing:
-        return {
-            "message": f"Collection already in progress for '{source.name}'",
-            "status": "running",
-            "started_at": existing.started_at.isoformat()
-            if existing.started_at
-            else None,
-        }
+    if existing is None:
+        task = await _create_running_task(db, source_id)
+        if task is not None:
+            _start_collection(_run_collect_source(str(task.id), str(source_id), source_name))
+            return {"message": f"Collection started for '{source_name}'", "status": "running"}
 
-    # Create a new task record
-    task = CollectionTask(
-        source_id=source_id,
-        running=True,
-        started_at=datetime.now(UTC),
-    )
-    db.add(task)
-    await db.commit()
-    await db.refresh(task)
+        # Lost a race with another request
+        result = await db.execute(_running_task_query(source_id))
+        existing = result.first()
+
+    return _already_running(f"Collection already in progress for '{source_name}'", existing)
 
-    # Fire-and-forget in a background thread
-    asyncio.create_task(
-        _run_collect_source_in_thread(str(task.id), str(source_id), source.name)
+
+@router.get("/status/bulk")
+async def get_bulk_collection_status(
+    db: DbSession,
+    current_user: CurrentUser,
+    source_id: Annotated[list[uuid.UUID] | None, Query()] = None,
+) -> dict:
+    """
+    Return the latest collection status of several sources in one query.
+
+    Pass ?source_id= once per source, or nothing for every source that
+    has been collected. Keyed by source id; sources never collected are
+    left out.
+    """
+    # Latest task per source: ROW_NUMBER() OVER (PARTITION BY source_id
+    # ORDER BY created_at DESC) = 1, served by the (source_id, created_at)
+    # index. Portable, unlike Postgres's DISTINCT ON
+    row_number = (
+        func.row_number()
+        .over(
+            partition_by=CollectionTask.source_id,
+            order_by=CollectionTask.created_at.desc(),
+        )
+        .label("recency")
     )
-    return {"message": f"Collection started for '{source.name}'", "status": "running"}
+    tasks = select(CollectionTask, row_number).where(CollectionTask.source_id.isnot(None))
+    if source_id:
+        tasks = tasks.where(CollectionTask.source_id.in_(source_id))
+    tasks = tasks.subquery()
+    latest = aliased(CollectionTask, tasks)
+
+    result = await db.execute(select(latest).where(tasks.c.recency == 1))
+    return {str(task.source_id): _task_to_status(task) for task in result.scalars()}
 
 
-@router.get("/status/{source_id}")
+@router.get(
+    "/status/{source_id}",
+    response_model=dict,
+    responses={status.HTTP_304_NOT_MODIFIED: {"description": "Status is unchanged"}},
+)
 async def get_source_collection_status(
     source_id: uuid.UUID,
-    db: DbSession,
+    response: Response,
     current_user: CurrentUser,
-) -> dict:
+    if_none_match: str | None = Header(None),
+) -> dict | Response:
     """Return the collection status for a specific source (most recent task)."""
-    task = (
-        await db.execute(
-            select(CollectionTask)
-            .where(CollectionTask.source_id == source_id)
-            .order_by(CollectionTask.created_at.desc())
-            .limit(1)
-        )
-    ).scalar_one_or_none()
-    return _task_to_status(task)
+    return _status_response(await _coalesced_status(source_id), response, if_none_match)
@@ -5,12 +5,15 @@ Expose the AI agent capabilities via REST API.
 """
 
 from fastapi import APIRouter, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 
-from src.agents.intelligence_agent import get_intelligence_briefing
+from src.agents.intelligence_agent import (
+    get_intelligence_briefing,
+    stream_intelligence_briefing,
+)
 from src.api.core.deps import CurrentUser
 
-
 router = APIRouter(prefix="/intelligence", tags=["Intelligence"])
 
 
@@ -18,6 +21,8 @@ class BriefingRequest(BaseModel):
     """Request for an intelligence briefing."""
 
     query: str
+    # Follow-ups on the same topic and session_id reuse its sources
+    session_id: str | None = None
 
 
 class BriefingResponse(BaseModel):
@@ -27,6 +32,11 @@ class BriefingResponse(BaseModel):
     briefing: str
 
 
+def _thread_id(request: BriefingRequest, user: CurrentUser) -> str | None:
+    """Agent thread for the request's session, scoped to the user."""
+    return f"{user.id}:{request.session_id}" if request.session_id else None
+
+
 @router.post("/briefing", response_model=BriefingResponse)
 async def create_briefing(
     request: BriefingRequest,
@@ -42,10 +52,34 @@ async def create_briefing(
     4. Generate an executive briefing
     """
     try:
-        briefing = await get_intelligence_briefing(request.query)
+        briefing = await get_intelligence_briefing(
+            request.query, thread_id=_thread_id(request, current_user)
+        )
         return BriefingResponse(
             query=request.query,
             briefing=briefing,
         )
     except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+
+@router.post("/briefing/stream")
+async def stream_briefing(
+    request: BriefingRequest,
+    current_user: CurrentUser,
+) -> StreamingResponse:
+    """
+    Generate an intelligence briefing and stream it as plain text.
+
+    Same agent as /briefing, but the briefing is sent as it is
+    generated, so clients can render it progressively. The searches
+    finish before the response starts, so their failures are a 500.
+    """
+    try:
+        chunks = await stream_intelligence_briefing(
+            request.query, thread_id=_thread_id(request, current_user)
+        )
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e)) from e
+
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
@@ -17,6 +17,7 @@ from src.api.schemas.article import (
     ArticleUpdate,
     ArticleResponse,
     ArticleListResponse,
+    ArticleCountResponse,
 )
 
 __all__ = [
@@ -35,4 +36,5 @@ __all__ = [
     "ArticleUpdate",
     "ArticleResponse",
     "ArticleListResponse",
+    "ArticleCountResponse",
 ]
@@ -4,7 +4,6 @@ Pydantic schemas for Article API endpoints.
 
 import uuid
 from datetime import datetime
-from typing import Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
@@ -15,21 +14,21 @@ class ArticleCreate(BaseModel):
     source_id: uuid.UUID
     title: str = Field(min_length=1, max_length=512)
     url: str = Field(min_length=1, max_length=1024)
-    content: Optional[str] = None
-    summary: Optional[str] = None
-    author: Optional[str] = Field(default=None, max_length=255)
-    published_at: Optional[datetime] = None
+    content: str | None = None
+    summary: str | None = None
+    author: str | None = Field(default=None, max_length=255)
+    published_at: datetime | None = None
     fetched_at: datetime
 
 
 class ArticleUpdate(BaseModel):
     """Schema for updating an article (all fields optional)."""
 
-    title: Optional[str] = Field(default=None, min_length=1, max_length=512)
-    content: Optional[str] = None
-    summary: Optional[str] = None
-    author: Optional[str] = Field(default=None, max_length=255)
-    published_at: Optional[datetime] = None
+    title: str | None = Field(default=None, min_length=1, max_length=512)
+    content: str | None = None
+    summary: str | None = None
+    author: str | None = Field(default=None, max_length=255)
+    published_at: datetime | None = None
 
 
 class ArticleResponse(BaseModel):
@@ -39,10 +38,10 @@ class ArticleResponse(BaseModel):
     source_id: uuid.UUID
     title: str
     url: str
-    content: Optional[str]
-    summary: Optional[str]
-    author: Optional[str]
-    published_at: Optional[datetime]
+    content: str | None
+    summary: str | None
+    author: str | None
+    published_at: datetime | None
     fetched_at: datetime
     created_at: datetime
     updated_at: datetime
@@ -51,9 +50,16 @@ class ArticleResponse(BaseModel):
 
 
 class ArticleListResponse(BaseModel):
-    """Schema for paginated article list."""
+    """Schema for a page of articles, newest first."""
 
     items: list[ArticleResponse]
-    total: int
-    page: int
     per_page: int
+    next_cursor: str | None = None  # Pass back as ?cursor= for the next page
+    has_more: bool
+
+
+class ArticleCountResponse(BaseModel):
+    """Schema for the number of articles matching a filter."""
+
+    total: int
+    estimated: bool = False  # True if read from table statistics, not counted
@@ -1,6 +1,8 @@
 """RSS feed adapter - fetches articles from RSS/Atom feeds."""
 
+import asyncio
 import logging
+import re
 from datetime import UTC, datetime
 
 import feedparser
@@ -8,6 +10,9 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+_WHITESPACE_RE = re.compile(r"\s+")
+
 
 async def fetch_rss_articles(
     feed_url: str,
@@ -34,7 +39,8 @@ async def fetch_rss_articles(
         )
         response.raise_for_status()
 
-    feed = feedparser.parse(response.text)
+    # Parsing is synchronous and can take a while on large feeds
+    feed = await asyncio.to_thread(feedparser.parse, response.text)
 
     articles = []
     for entry in feed.entries[:max_articles]:
@@ -68,8 +74,6 @@ async def fetch_rss_articles(
 
 def _strip_html(text: str) -> str:
     """Remove HTML tags from text. Simple approach."""
-    import re
-
-    clean = re.sub(r"<[^>]+>", " ", text)
-    clean = re.sub(r"\s+", " ", clean).strip()
+    clean = _HTML_TAG_RE.sub(" ", text)
+    clean = _WHITESPACE_RE.sub(" ", clean).strip()
     return clean
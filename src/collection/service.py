@@ -4,6 +4,7 @@ Collection Service - fetches articles from configured sources.
 Orchestrates the adapters and handles deduplication + storage + ingestion.
 """
 
+import asyncio
 import logging
 from datetime import UTC, datetime
 
@@ -74,8 +75,8 @@ async def collect_from_source(
             stats["skipped"] += 1
             continue
 
-        # Check if article already exists
-        result = await db.execute(select(Article).where(Article.url == url))
+        # Check if article already exists (id only - no need to read its body)
+        result = await db.execute(select(Article.id).where(Article.url == url))
         if result.scalar_one_or_none():
             stats["skipped"] += 1
             continue
@@ -107,7 +108,9 @@ async def collect_from_source(
                 if article.published_at:
                     metadata["published_at"] = article.published_at.isoformat()
 
-                rag_retriever.ingest_document(
+                # Embedding is blocking CPU/GPU work - keep it off the event loop
+                await asyncio.to_thread(
+                    rag_retriever.ingest_document,
                     text=article.content,
                     metadata=metadata,
                     chunk_size=500,
@@ -6,6 +6,9 @@ Why chunk? LLMs have token limits, and smaller chunks = more precise retrieval.
 
 from dataclasses import dataclass
 
+# Preferred break points, strongest first
+_SENTENCE_SEPARATORS = (". ", "! ", "? ", "\n\n", "\n")
+
 
 @dataclass
 class Chunk:
@@ -47,11 +50,12 @@ def chunk_text(
 
         # Try to break at a sentence boundary
         if end < len(text):
-            # Look for sentence endings
-            for sep in [". ", "! ", "? ", "\n\n", "\n"]:
-                last_sep = text[start:end].rfind(sep)
+            # Look for sentence endings. str.rfind with bounds searches the
+            # window in C without copying it into a new string first.
+            for sep in _SENTENCE_SEPARATORS:
+                last_sep = text.rfind(sep, start, end)
                 if last_sep != -1:
-                    end = start + last_sep + len(sep)
+                    end = last_sep + len(sep)
                     break
 
         chunk_text = text[start:end].strip()
@@ -66,7 +70,10 @@ def chunk_text(
             )
             chunk_index += 1
 
-        # Move start, accounting for overlap
-        start = end - chunk_overlap
+        # Move start, accounting for overlap. If the break point was found
+        # inside the overlap window, stepping back would land at or before
+        # the current start and loop forever, so continue from the break.
+        next_start = end - chunk_overlap
+        start = next_start if next_start > start else end
 
     return chunks
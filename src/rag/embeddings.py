@@ -5,6 +5,8 @@ Embeddings convert text into vectors that capture semantic meaning.
 Similar texts have similar vectors (close in vector space).
 """
 
+from functools import lru_cache
+
 from sentence_transformers import SentenceTransformer
 
 from src.api.core.config import settings
@@ -17,6 +19,11 @@ class EmbeddingService:
         self.model_name = model_name or settings.EMBEDDING_MODEL
         self._model: SentenceTransformer | None = None
 
+        # Recent query embeddings. One agent run embeds the same query for
+        # its caches and again for the vector search, so only the first
+        # call pays for a forward pass
+        self._cached_query = lru_cache(maxsize=1024)(self._embed_query)
+
     @property
     def model(self) -> SentenceTransformer:
         """Lazy load the model."""
@@ -29,14 +36,34 @@ class EmbeddingService:
         """Get embedding dimension."""
         return self.model.get_sentence_embedding_dimension()
 
+    def warmup(self) -> None:
+        """
+        Load the model and run one throwaway encode.
+
+        The first encode allocates buffers (and, on GPU, initializes
+        kernels), so doing it up front keeps that cost out of the first
+        real batch.
+        """
+        self.model.encode(["warmup"], convert_to_numpy=True)
+
     def embed_text(self, text: str) -> list[float]:
         """Convert a single text to an embedding vector."""
         embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
-    def embed_texts(self, texts: list[str]) -> list[list[float]]:
+    def embed_query(self, query: str) -> list[float]:
+        """Embed a search query, reusing the result for repeated queries."""
+        return list(self._cached_query(query))
+
+    def _embed_query(self, query: str) -> tuple[float, ...]:
+        # Tuples so callers can't mutate the cached vector
+        return tuple(self.embed_text(query))
+
+    def embed_texts(self, texts: list[str], batch_size: int = 128) -> list[list[float]]:
         """Convert multiple texts to embedding vectors (more efficient)."""
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
+        embeddings = self.model.encode(
+            texts, batch_size=batch_size, convert_to_numpy=True
+        )
         return embeddings.tolist()
 
 
@@ -5,6 +5,7 @@ This combines chunking, embedding, and retrieval into a simple interface.
 """
 
 from src.rag.chunking import chunk_text
+from src.rag.embeddings import embedding_service
 from src.rag.vector_store import VectorStore, vector_store
 
 
@@ -16,6 +17,17 @@ class RAGRetriever:
         if collection_name != "articles":
             self.store = VectorStore(collection_name)
 
+    def ensure_ready(self) -> None:
+        """
+        Warm up the embedding model and the Qdrant collection.
+
+        Both are otherwise initialized lazily by the first ingest call.
+        Call this once before a long ingestion run so the model load and
+        collection creation don't stall the first batch.
+        """
+        embedding_service.warmup()
+        self.store.ensure_collection()
+
     def ingest_document(
         self,
         text: str,
@@ -45,6 +57,54 @@ class RAGRetriever:
 
         return len(chunks)
 
+    def ingest_documents_batch(
+        self,
+        texts: list[str],
+        metadatas: list[dict] | None = None,
+        chunk_size: int = 500,
+        batch_size: int | None = None,
+    ) -> list[int]:
+        """
+        Ingest many documents with batched embedding and upserts.
+
+        Chunking is still done per document, but chunks from all documents
+        are embedded together and written to Qdrant in one request per
+        batch, which is much faster than calling ingest_document() in a loop.
+
+        Args:
+            texts: The document texts
+            metadatas: Metadata for each document (same order as texts)
+            chunk_size: Size of chunks
+            batch_size: Embed and upsert every batch_size chunks instead of
+                all at once, so a few very long documents can't make one
+                oversized request (None = single batch)
+
+        Returns:
+            Number of chunks created for each document
+        """
+        if metadatas is None:
+            metadatas = [{}] * len(texts)
+
+        pending = []
+        counts = []
+        for text, metadata in zip(texts, metadatas, strict=True):
+            chunks = chunk_text(
+                text=text,
+                chunk_size=chunk_size,
+                metadata=metadata or {},
+            )
+            pending.extend(chunks)
+            counts.append(len(chunks))
+
+            while batch_size and len(pending) >= batch_size:
+                self.store.add_chunks(pending[:batch_size])
+                pending = pending[batch_size:]
+
+        if pending:
+            self.store.add_chunks(pending)
+
+        return counts
+
     def retrieve(
         self,
         query: str,
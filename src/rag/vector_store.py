@@ -12,6 +12,7 @@ from qdrant_client.models import (
     FieldCondition,
     Filter,
     MatchValue,
+    OptimizersConfigDiff,
     PointStruct,
     VectorParams,
 )
@@ -20,6 +21,10 @@ from src.api.core.config import settings
 from src.rag.chunking import Chunk
 from src.rag.embeddings import embedding_service
 
+# Qdrant's default indexing_threshold (KB of vectors per segment before it
+# builds an HNSW index), used when the collection doesn't report one
+DEFAULT_INDEXING_THRESHOLD = 10_000
+
 
 class VectorStore:
     """Interface to Qdrant vector database."""
@@ -32,9 +37,13 @@ class VectorStore:
     def client(self) -> QdrantClient:
         """Lazy initialize client."""
         if self._client is None:
+            # gRPC (protobuf over HTTP/2) is cheaper than REST/JSON for large
+            # upserts, but needs the gRPC port exposed, so it's opt-in
             self._client = QdrantClient(
                 url=settings.QDRANT_URL,
                 api_key=settings.QDRANT_API_KEY,
+                prefer_grpc=settings.QDRANT_PREFER_GRPC,
+                grpc_port=settings.QDRANT_GRPC_PORT,
             )
         return self._client
 
@@ -52,6 +61,38 @@ class VectorStore:
                 ),
             )
 
+    def pause_indexing(self) -> int:
+        """
+        Stop building the HNSW index, for a bulk upload.
+
+        Points are then appended without graph maintenance on every insert,
+        and the index is built once by resume_indexing(). Until then,
+        searches scan the unindexed segments in full (slower, still exact).
+
+        Returns the threshold to pass to resume_indexing().
+        """
+        self.ensure_collection()
+        info = self.client.get_collection(self.collection_name)
+        # 0 means another bulk upload has indexing paused - restore the
+        # default afterwards rather than leaving it off for good
+        threshold = (
+            info.config.optimizer_config.indexing_threshold
+            or DEFAULT_INDEXING_THRESHOLD
+        )
+
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            optimizer_config=OptimizersConfigDiff(indexing_threshold=0),
+        )
+        return threshold
+
+    def resume_indexing(self, threshold: int = DEFAULT_INDEXING_THRESHOLD) -> None:
+        """Re-enable HNSW indexing after pause_indexing()."""
+        self.client.update_collection(
+            collection_name=self.collection_name,
+            optimizer_config=OptimizersConfigDiff(indexing_threshold=threshold),
+        )
+
     def add_chunks(self, chunks: list[Chunk]) -> list[str]:
         """
         Add chunks to the vector store.
@@ -82,6 +123,8 @@ class VectorStore:
             )
 
         # Upsert to Qdrant
+        # The REST client serializes points with pydantic-core's
+        # model_dump_json (Rust), so there is no stdlib json cost to avoid here
         self.client.upsert(
             collection_name=self.collection_name,
             points=points,
@@ -106,8 +149,8 @@ class VectorStore:
         Returns:
             List of matching chunks with scores
         """
-        # Generate query embedding
-        query_embedding = embedding_service.embed_text(query)
+        # Generate query embedding (cached for repeated queries)
+        query_embedding = embedding_service.embed_query(query)
 
         # Build filter if needed
         search_filter = None
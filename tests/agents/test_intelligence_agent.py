@@ -1,15 +1,34 @@
 """Tests for the Intelligence Agent."""
 
-from unittest.mock import MagicMock, patch
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 
+@pytest.fixture(autouse=True)
+def no_agent_cache():
+    """Disable the agent caches so tests don't share results."""
+    from src.agents import intelligence_agent, llm
+    from src.agents.semcache import SemanticCache
+
+    with (
+        patch.object(llm, "_chat_cache", SemanticCache(enabled=False)),
+        patch.object(intelligence_agent, "_plan_cache", SemanticCache(enabled=False)),
+        patch.object(
+            intelligence_agent, "_retrieval_cache", SemanticCache(enabled=False)
+        ),
+        patch.object(intelligence_agent, "_sessions", SemanticCache()),
+    ):
+        yield
+
+
 @pytest.fixture
 def mock_openai():
     """Mock OpenAI API responses."""
-    with patch("src.agents.intelligence_agent._get_openai_client") as mock:
+    with patch("src.agents.llm.get_openai_client") as mock:
         mock_client = MagicMock()
+        mock_client.chat.completions.create = AsyncMock()
         mock.return_value = mock_client
         yield mock_client
 
@@ -21,7 +40,8 @@ def mock_rag():
         yield mock
 
 
-def test_plan_search_returns_valid_strategy(mock_openai):
+@pytest.mark.asyncio
+async def test_plan_search_returns_valid_strategy(mock_openai):
     """Test that plan_search returns a valid strategy."""
     from src.agents.intelligence_agent import plan_search
 
@@ -35,12 +55,13 @@ def test_plan_search_returns_valid_strategy(mock_openai):
         "messages": [],
     }
 
-    result = plan_search(state)
+    result = await plan_search(state)
 
     assert result["search_strategy"] in ["INTERNAL", "EXTERNAL", "BOTH"]
 
 
-def test_search_internal_respects_strategy(mock_rag):
+@pytest.mark.asyncio
+async def test_search_internal_respects_strategy(mock_rag):
     """Test that internal search respects the strategy."""
     from src.agents.intelligence_agent import search_internal
 
@@ -48,12 +69,12 @@ def test_search_internal_respects_strategy(mock_rag):
 
     # When strategy is INTERNAL, should search
     state = {"query": "test", "search_strategy": "INTERNAL"}
-    result = search_internal(state)
+    result = await search_internal(state)
     assert len(result["internal_docs"]) > 0
 
     # When strategy is EXTERNAL, should skip
     state = {"query": "test", "search_strategy": "EXTERNAL"}
-    result = search_internal(state)
+    result = await search_internal(state)
     assert len(result["internal_docs"]) == 0
 
 
@@ -62,27 +83,24 @@ async def test_full_agent_flow(mock_openai, mock_rag):
     """Test the complete agent flow."""
     from src.agents.intelligence_agent import get_intelligence_briefing
 
-    # Mock all OpenAI calls
+    # Short query: strategy is chosen locally, so the only OpenAI call is
+    # the combined analysis + briefing
     mock_openai.chat.completions.create.side_effect = [
-        MagicMock(
-            choices=[MagicMock(message=MagicMock(content="BOTH"))]
-        ),  # plan_search
         MagicMock(
             choices=[
                 MagicMock(
                     message=MagicMock(
-                        content="KEY_FACTS:\n- Fact 1\n- Fact 2\n\nCONTRADICTIONS:\nNone"
+                        content=json.dumps(
+                            {
+                                "key_facts": ["Fact 1", "Fact 2"],
+                                "contradictions": [],
+                                "briefing": "## Briefing\n\nThis is the briefing.",
+                            }
+                        )
                     )
                 )
             ]
-        ),  # analyze
-        MagicMock(
-            choices=[
-                MagicMock(
-                    message=MagicMock(content="## Briefing\n\nThis is the briefing.")
-                )
-            ]
-        ),  # generate
+        ),  # analyze_and_brief
     ]
 
     mock_rag.retrieve.return_value = [{"text": "Test content", "score": 0.9}]
@@ -91,3 +109,145 @@ async def test_full_agent_flow(mock_openai, mock_rag):
 
     assert briefing is not None
     assert "Briefing" in briefing
+    assert mock_openai.chat.completions.create.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_plan_search_skips_llm_for_obvious_queries(mock_openai):
+    """Test that recency and very short queries don't call the LLM."""
+    from src.agents.intelligence_agent import plan_search
+
+    result = await plan_search({"query": "What are the latest chip export rules?"})
+    assert result["search_strategy"] == "EXTERNAL"
+
+    result = await plan_search({"query": "AI regulation"})
+    assert result["search_strategy"] == "BOTH"
+
+    mock_openai.chat.completions.create.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_analyze_and_brief_falls_back_to_raw_text(mock_openai):
+    """Test that a non-JSON reply is kept as the briefing."""
+    from src.agents.intelligence_agent import analyze_and_brief
+
+    mock_openai.chat.completions.create.return_value = MagicMock(
+        choices=[MagicMock(message=MagicMock(content="Plain briefing"))]
+    )
+
+    result = await analyze_and_brief(
+        {"query": "test", "internal_docs": [{"text": "Doc"}], "external_articles": []}
+    )
+
+    assert result["briefing"] == "Plain briefing"
+    assert result["key_facts"] == []
+
+
+def test_searches_fan_out_from_plan():
+    """Test that both searches follow plan_search and feed analyze_and_brief."""
+    from src.agents.intelligence_agent import get_intelligence_agent
+
+    agent = get_intelligence_agent()
+    edges = {(e.source, e.target) for e in agent.get_graph().edges}
+
+    assert get_intelligence_agent() is agent
+
+    assert ("plan_search", "search_internal") in edges
+    assert ("plan_search", "search_external") in edges
+    assert ("search_internal", "analyze_and_brief") in edges
+    assert ("search_external", "analyze_and_brief") in edges
+    assert ("search_internal", "search_external") not in edges
+
+
+@pytest.mark.asyncio
+async def test_briefings_run_concurrently_in_order():
+    """Test that batch briefings are bounded and keep query order."""
+    import asyncio
+
+    from src.agents import intelligence_agent
+
+    running = 0
+    peak = 0
+
+    async def fake_briefing(query: str) -> str:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+        return f"Briefing: {query}"
+
+    queries = [f"query {i}" for i in range(5)]
+    with patch.object(intelligence_agent, "get_intelligence_briefing", fake_briefing):
+        briefings = await intelligence_agent.get_intelligence_briefings(
+            queries, max_concurrent=2
+        )
+
+    assert briefings == [f"Briefing: {q}" for q in queries]
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_follow_up_in_thread_reuses_sources():
+    """Test that a related follow-up in a thread is briefed without searching again."""
+    from src.agents import intelligence_agent
+
+    vectors = {
+        "AI news": [1.0, 0.0],
+        "What did regulators say about AI?": [0.9, 0.3],
+        "Chip news": [0.0, 1.0],
+    }
+    embeddings = MagicMock()
+    embeddings.embed_query.side_effect = vectors.__getitem__
+
+    searches = MagicMock()
+    searches.ainvoke = AsyncMock(
+        side_effect=lambda state: {**state, "internal_docs": [{"text": state["query"]}]}
+    )
+
+    async def fake_brief(state):
+        return {
+            "briefing": f"{state['query']} from {state['internal_docs'][0]['text']}"
+        }
+
+    with (
+        patch.object(intelligence_agent, "embedding_service", embeddings),
+        patch.object(intelligence_agent, "get_search_agent", lambda: searches),
+        patch.object(intelligence_agent, "analyze_and_brief", fake_brief),
+    ):
+        first = await intelligence_agent.get_intelligence_briefing("AI news", "t1")
+        follow_up = await intelligence_agent.get_intelligence_briefing(
+            "What did regulators say about AI?", "t1"
+        )
+        other = await intelligence_agent.get_intelligence_briefing(
+            "What did regulators say about AI?", "t2"
+        )
+        new = await intelligence_agent.get_intelligence_briefing("Chip news", "t1")
+
+    assert first == "AI news from AI news"
+    assert follow_up == "What did regulators say about AI? from AI news"
+    assert (
+        other
+        == "What did regulators say about AI? from What did regulators say about AI?"
+    )
+    assert new == "Chip news from Chip news"
+    assert searches.ainvoke.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_stream_briefing_yields_tokens(mock_openai, mock_rag):
+    """Test that the streamed briefing is yielded piece by piece."""
+    from src.agents.intelligence_agent import stream_intelligence_briefing
+
+    async def fake_stream():
+        for piece in ["## Brief", "ing", None]:
+            yield MagicMock(choices=[MagicMock(delta=MagicMock(content=piece))])
+
+    mock_openai.chat.completions.create.return_value = fake_stream()
+    mock_rag.retrieve.return_value = [{"text": "Test content", "score": 0.9}]
+
+    stream = await stream_intelligence_briefing("Test query")
+    pieces = [piece async for piece in stream]
+
+    assert pieces == ["## Brief", "ing"]
+    assert mock_openai.chat.completions.create.call_args.kwargs["stream"] is True
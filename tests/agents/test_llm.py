@@ -0,0 +1,34 @@
+"""Tests for the shared OpenAI helpers."""
+
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents import intelligence_agent, llm, research_agent
+from src.agents.semcache import SemanticCache
+
+
+def test_agents_share_one_chat_helper():
+    """Test that both agents go through the same client, cap and cache."""
+    assert intelligence_agent.chat is llm.chat
+    assert research_agent.chat is llm.chat
+    assert intelligence_agent.chat_stream is llm.chat_stream
+
+
+@pytest.mark.asyncio
+async def test_chat_caches_identical_requests():
+    """Test that an identical request is answered from the chat cache."""
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(
+        return_value=MagicMock(choices=[MagicMock(message=MagicMock(content="Hi"))])
+    )
+    messages = [{"role": "user", "content": "Hello"}]
+
+    with (
+        patch.object(llm, "get_openai_client", return_value=client),
+        patch.object(llm, "_chat_cache", SemanticCache()),
+    ):
+        assert await llm.chat(messages) == "Hi"
+        assert await llm.chat(messages) == "Hi"
+
+    client.chat.completions.create.assert_awaited_once()
@@ -0,0 +1,167 @@
+"""Tests for the Research Agent."""
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.agents import llm
+from src.agents import research_agent as research_module
+
+FACTS = [f"Fact {i}" for i in range(5)]
+
+
+@pytest.fixture
+def mock_embeddings():
+    """Mock the embedding service used for the coverage check."""
+    with patch.object(research_module, "embedding_service") as mock:
+        yield mock
+
+
+@pytest.mark.asyncio
+async def test_decide_next_step_answers_when_facts_cover_query(mock_embeddings):
+    """Test that enough on-topic facts go straight to the answer."""
+    mock_embeddings.embed_texts.return_value = [[1.0, 0.0]] + [[0.9, 0.1]] * 5
+
+    state = {"query": "q", "facts": FACTS, "iteration_count": 0}
+
+    assert await research_module.decide_next_step(state) == "generate_answer"
+    mock_embeddings.embed_texts.assert_called_once_with(["q", *FACTS])
+
+
+@pytest.mark.asyncio
+async def test_decide_next_step_researches_more(mock_embeddings):
+    """Test that too few or off-topic facts trigger another retrieval."""
+    state = {"query": "q", "facts": FACTS[:2], "iteration_count": 0}
+    assert await research_module.decide_next_step(state) == "retrieve_documents"
+
+    mock_embeddings.embed_texts.return_value = [[1.0, 0.0]] + [[0.0, 1.0]] * 5
+    state = {"query": "q", "facts": FACTS, "iteration_count": 0}
+    assert await research_module.decide_next_step(state) == "retrieve_documents"
+
+    # Iteration limit wins regardless of the facts
+    state = {"query": "q", "facts": [], "iteration_count": 2}
+    assert await research_module.decide_next_step(state) == "generate_answer"
+
+
+@pytest.mark.asyncio
+async def test_call_mcp_tool_reuses_server_process():
+    """Test that repeated tool calls share one server process and session."""
+    spawned = []
+
+    @asynccontextmanager
+    async def fake_stdio_client(server_params):
+        spawned.append(server_params)
+        yield MagicMock(), MagicMock()
+
+    session = MagicMock()
+    session.__aenter__ = AsyncMock(return_value=session)
+    session.__aexit__ = AsyncMock(return_value=None)
+    session.initialize = AsyncMock()
+    session.call_tool = AsyncMock(
+        return_value=MagicMock(content=[MagicMock(text='{"articles": []}')])
+    )
+
+    with (
+        patch.object(research_module, "stdio_client", fake_stdio_client),
+        patch.object(research_module, "ClientSession", return_value=session),
+    ):
+        try:
+            for _ in range(3):
+                result = await research_module.call_mcp_tool(
+                    "news_search", "search_news", {"query": "ai"}
+                )
+        finally:
+            await research_module.close_mcp_sessions()
+
+    assert result == '{"articles": []}'
+    assert len(spawned) == 1
+    session.initialize.assert_awaited_once()
+    assert session.call_tool.await_count == 3
+
+
+@pytest.mark.asyncio
+async def test_extract_facts_parses_json():
+    """Test that facts are read from the JSON reply (with a bullet fallback)."""
+    replies = ['{"facts": ["Fact A", "Fact B"]}', "Facts:\n- Fact C\n* Fact D"]
+    client = MagicMock()
+    client.chat.completions.create = AsyncMock(
+        side_effect=[
+            MagicMock(choices=[MagicMock(message=MagicMock(content=reply))])
+            for reply in replies
+        ]
+    )
+    disabled = research_module.SemanticCache(enabled=False)
+
+    with (
+        patch.object(llm, "get_openai_client", return_value=client),
+        patch.object(llm, "_chat_cache", disabled),
+    ):
+        state = {"query": "q", "retrieved_docs": [{"text": "Doc"}]}
+        first = await research_module.extract_facts(state)
+        second = await research_module.extract_facts(state)
+
+    assert first["facts"] == ["Fact A", "Fact B"]
+    assert second["facts"] == ["Fact C", "Fact D"]
+    kwargs = client.chat.completions.create.call_args.kwargs
+    assert kwargs["response_format"] == {"type": "json_object"}
+
+
+@pytest.mark.asyncio
+async def test_extract_facts_fans_out_over_many_docs():
+    """Test that large retrievals get one call per document, merged."""
+    docs = [{"text": f"Doc {i}"} for i in range(research_module.MAP_EXTRACT_MIN_DOCS)]
+
+    async def fake_chat(messages, **kwargs):
+        doc = messages[-1]["content"].rsplit("\n", 1)[-1]
+        return f'{{"facts": ["{doc} fact", "Shared fact"]}}'
+
+    with patch.object(research_module, "chat", side_effect=fake_chat) as mock_chat:
+        result = await research_module.extract_facts(
+            {"query": "q", "retrieved_docs": docs}
+        )
+
+    assert mock_chat.call_count == len(docs)
+    assert result["facts"][:2] == ["Doc 0 fact", "Shared fact"]
+    assert result["facts"].count("Shared fact") == 1
+    assert len(result["facts"]) == len(docs) + 1
+
+
+@pytest.mark.asyncio
+async def test_search_external_news_parses_large_results_off_the_loop():
+    """Test that tool results over LARGE_JSON_BYTES (encoded) parse in a thread."""
+    result = '{"articles": [{"title": "Café"}]}'
+    to_thread = AsyncMock(side_effect=lambda fn, arg: fn(arg))
+
+    with (
+        patch.object(research_module, "call_mcp_tool", AsyncMock(return_value=result)),
+        patch.object(research_module.asyncio, "to_thread", to_thread),
+    ):
+        small = await research_module.search_external_news({"query": "q"})
+        with patch.object(research_module, "LARGE_JSON_BYTES", len(result)):
+            # One more byte than characters: "é" is two bytes in UTF-8
+            large = await research_module.search_external_news({"query": "q"})
+
+    assert small["external_sources"] == large["external_sources"] == [{"title": "Café"}]
+    to_thread.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_full_retrieval_takes_the_map_extract_path():
+    """Test that a full retrieval is large enough to fan out fact extraction."""
+    docs = [{"text": f"Doc {i}"} for i in range(research_module.RETRIEVE_LIMIT)]
+    chat = AsyncMock(return_value='{"facts": []}')
+
+    with (
+        patch.object(research_module, "rag_retriever") as mock_rag,
+        patch.object(
+            research_module, "_retrieval_cache", research_module.SemanticCache()
+        ),
+        patch.object(research_module, "chat", chat),
+    ):
+        mock_rag.retrieve.return_value = docs
+        state = {"query": "q", **research_module.retrieve_documents({"query": "q"})}
+        await research_module.extract_facts(state)
+
+    assert mock_rag.retrieve.call_args.kwargs["limit"] == research_module.RETRIEVE_LIMIT
+    assert chat.await_count == len(docs)
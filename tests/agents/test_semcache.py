@@ -0,0 +1,89 @@
+"""Tests for the agent semantic cache."""
+
+from unittest.mock import MagicMock
+
+from src.agents.semcache import SemanticCache, request_key
+
+# Tiny fake embedding space: paraphrases map to the same direction
+VECTORS = {
+    "latest AI news": [1.0, 0.0, 0.0],
+    "newest AI news": [0.99, 0.05, 0.0],
+    "football scores": [0.0, 1.0, 0.0],
+}
+
+
+def fake_embed(text: str) -> list[float]:
+    return VECTORS[text]
+
+
+def test_exact_hit_and_miss():
+    """Test exact lookups by request key."""
+    cache = SemanticCache()
+    key = request_key("gpt-4o", [{"role": "user", "content": "hi"}], 1000)
+
+    assert cache.get(key) is None
+    cache.set(key, "hello")
+    assert cache.get(key) == "hello"
+    assert cache.get(request_key("gpt-4o", [], 1000)) is None
+
+
+def test_similar_query_hits():
+    """Test that a paraphrased query reuses the cached result."""
+    cache = SemanticCache(embed=fake_embed, threshold=0.95)
+
+    value, vector = cache.get_similar("latest AI news")
+    assert value is None
+    cache.set_similar("latest AI news", ["doc"], vector)
+
+    assert cache.get_similar("newest AI news")[0] == ["doc"]
+    assert cache.get_similar("football scores")[0] is None
+
+
+def test_exact_text_skips_embedding():
+    """Test that a repeated query is served without embedding it again."""
+    embed = MagicMock(side_effect=fake_embed)
+    cache = SemanticCache(embed=embed)
+
+    _, vector = cache.get_similar("latest AI news")
+    cache.set_similar("latest AI news", "BOTH", vector)
+    assert cache.get_similar("latest AI news")[0] == "BOTH"
+
+    embed.assert_called_once()
+
+
+def test_lru_eviction_and_ttl():
+    """Test that old entries are evicted by size and by age."""
+    cache = SemanticCache(max_entries=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")  # "b" is now least recently used
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+
+    expired = SemanticCache(ttl_seconds=-1)
+    expired.set("a", 1)
+    assert expired.get("a") is None
+
+
+def test_similar_query_skips_expired_match():
+    """Test that an expired best match falls back to the next valid one."""
+    vectors = {**VECTORS, "AI news today": [1.0, 0.01, 0.0]}
+    cache = SemanticCache(embed=vectors.get, threshold=0.95, ttl_seconds=60)
+    for text, value in (("latest AI news", ["stale"]), ("newest AI news", ["fresh"])):
+        cache.set(request_key(text), value, cache._normalize(vectors[text]))
+
+    # Age out the closest match to the query
+    key = request_key("latest AI news")
+    stored_at, value = cache._entries[key]
+    cache._entries[key] = (stored_at - 120, value)
+
+    assert cache.get_similar("AI news today")[0] == ["fresh"]
+    assert len(cache) == 1
+
+
+def test_embedding_failure_is_a_miss():
+    """Test that an unavailable embedding model degrades to exact-only."""
+    cache = SemanticCache(embed=MagicMock(side_effect=RuntimeError("no model")))
+
+    assert cache.get_similar("anything") == (None, None)
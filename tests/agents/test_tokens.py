@@ -0,0 +1,76 @@
+"""Tests for prompt token budgeting."""
+
+from unittest.mock import MagicMock, patch
+
+from src.agents import tokens
+
+
+class WordEncoding:
+    """Fake tokenizer: one token per space-separated word."""
+
+    def encode(self, text: str, disallowed_special=()) -> list[str]:
+        return text.split(" ")
+
+    def decode(self, ids: list[str]) -> str:
+        return " ".join(ids)
+
+
+def test_fit_tokens_truncates_to_budget():
+    """Test that text over budget is cut to exactly budget tokens."""
+    with patch.object(tokens, "_encoding", return_value=WordEncoding()):
+        assert tokens.fit_tokens("a b c d e", budget=3) == "a b c"
+        assert tokens.fit_tokens("a b", budget=3) == "a b"
+        assert tokens.count_tokens("a b c") == 3
+
+
+def test_fit_tokens_estimates_without_tokenizer():
+    """Test the chars-per-token fallback when tiktoken can't load."""
+    with patch.object(tokens, "_encoding", return_value=None):
+        assert tokens.fit_tokens("x" * 100, budget=10) == "x" * 40
+        assert tokens.count_tokens("x" * 100) == 25
+
+
+def test_source_budget_reserves_reply_and_overhead():
+    """Test that the source budget leaves room for the reply."""
+    with patch.object(tokens.settings, "OPENAI_CONTEXT_TOKENS", 10_000):
+        assert tokens.source_budget(reply_tokens=1500) == (
+            10_000 - 1500 - tokens.PROMPT_OVERHEAD_TOKENS
+        )
+
+
+def test_special_token_text_is_plain_text():
+    """Test that "<|endoftext|>" in article text is counted, not rejected."""
+    encoding = MagicMock()
+    encoding.encode.return_value = [1, 2, 3]
+
+    with patch.object(tokens, "_encoding", return_value=encoding):
+        assert tokens.count_tokens("ends <|endoftext|>") == 3
+        tokens.fit_tokens("ends <|endoftext|>", budget=10)
+
+    for call in encoding.encode.call_args_list:
+        assert call.kwargs["disallowed_special"] == ()
+
+
+def test_failed_encoding_load_is_retried():
+    """Test that a failed tokenizer load isn't cached for good."""
+    encoding = WordEncoding()
+    with (
+        patch.object(tokens, "_loaded", None),
+        patch.object(tokens, "_failed_at", None),
+        patch.object(
+            tokens.tiktoken, "encoding_for_model", side_effect=OSError("offline")
+        ),
+        patch.object(tokens.time, "monotonic", return_value=1000.0),
+    ):
+        assert tokens.load_encoding() is False
+
+        with patch.object(tokens.tiktoken, "encoding_for_model", return_value=encoding):
+            assert tokens._encoding() is None  # Still within the retry delay
+
+            with patch.object(
+                tokens.time,
+                "monotonic",
+                return_value=1000.0 + tokens.ENCODING_RETRY_SECONDS,
+            ):
+                assert tokens._encoding() is encoding
+                assert tokens.count_tokens("a b") == 2
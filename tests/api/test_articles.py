@@ -1,7 +1,36 @@
 """Tests for articles endpoints."""
 
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import patch
+
 import pytest
+import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from src.api.models import Article, Base, IngestJob, User
+from src.api.routers.articles import _create_running_ingest_job
+
+
+@pytest_asyncio.fixture(scope="function")
+async def test_engine(tmp_path):
+    """
+    File-backed test database.
+
+    The in-memory database shares one connection between sessions, so the
+    ingest job's concurrent sessions would roll back each other's writes.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'test.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
 
 
 async def get_auth_token(client: AsyncClient, user_data: dict) -> str:
@@ -17,6 +46,14 @@ async def get_auth_token(client: AsyncClient, user_data: dict) -> str:
     return response.json()["access_token"]
 
 
+async def make_superuser(engine, email: str) -> None:
+    """Helper to grant superuser rights (there is no endpoint for it)."""
+    async with engine.begin() as conn:
+        await conn.execute(
+            update(User).where(User.email == email).values(is_superuser=True)
+        )
+
+
 async def create_source(client: AsyncClient, token: str, source_data: dict) -> dict:
     """Helper to create a source and return the response data."""
     response = await client.post(
@@ -55,6 +92,32 @@ async def test_create_article(
     assert "id" in data
 
 
+@pytest.mark.asyncio
+async def test_create_article_ingests_in_background(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that a new article is ingested into Qdrant by a background task."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+
+    with patch("src.api.routers.articles.rag_retriever") as mock_retriever:
+        mock_retriever.ingest_document.side_effect = RuntimeError("Qdrant down")
+        response = await client.post(
+            "/api/v1/articles/",
+            json={**test_article_data, "source_id": source["id"]},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    # Ingest failures don't affect the created article
+    assert response.status_code == 201
+    kwargs = mock_retriever.ingest_document.call_args.kwargs
+    assert kwargs["text"] == test_article_data["content"]
+    assert kwargs["metadata"]["article_id"] == response.json()["id"]
+
+
 @pytest.mark.asyncio
 async def test_create_article_unauthorized(
     client: AsyncClient,
@@ -125,6 +188,34 @@ async def test_create_article_duplicate_url(
     assert "already exists" in response.json()["detail"].lower()
 
 
+@pytest.mark.asyncio
+async def test_create_article_concurrent_duplicate_url(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that concurrent creates with the same URL store only one article."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+
+    article_data = {**test_article_data, "source_id": source["id"]}
+    responses = await asyncio.gather(
+        *(
+            client.post(
+                "/api/v1/articles/",
+                json=article_data,
+                headers={"Authorization": f"Bearer {token}"},
+            )
+            for _ in range(3)
+        )
+    )
+
+    assert sorted(r.status_code for r in responses) == [201, 400, 400]
+    count = await client.get("/api/v1/articles/count")
+    assert count.json()["total"] == 1
+
+
 @pytest.mark.asyncio
 async def test_list_articles(
     client: AsyncClient,
@@ -150,9 +241,9 @@ async def test_list_articles(
     assert response.status_code == 200
     data = response.json()
     assert "items" in data
-    assert "total" in data
-    assert "page" in data
     assert "per_page" in data
+    assert data["has_more"] is False
+    assert data["next_cursor"] is None
     assert len(data["items"]) >= 1
     assert data["items"][0]["title"] == test_article_data["title"]
 
@@ -185,6 +276,125 @@ async def test_list_articles_filter_by_source(
     assert all(item["source_id"] == source["id"] for item in data["items"])
 
 
+@pytest.mark.asyncio
+async def test_list_articles_cursor_pagination(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test walking every page with next_cursor, including tied fetched_at."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+
+    # Two articles per timestamp, so pages split rows with equal fetched_at
+    for i in range(5):
+        await client.post(
+            "/api/v1/articles/",
+            json={
+                **test_article_data,
+                "source_id": source["id"],
+                "url": f"https://example.com/article/{i}",
+                "fetched_at": f"2024-01-15T{10 + i // 2:02d}:00:00Z",
+            },
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    seen = []
+    cursor = None
+    while True:
+        params = {"per_page": 2, **({"cursor": cursor} if cursor else {})}
+        response = await client.get("/api/v1/articles/", params=params)
+        assert response.status_code == 200
+        data = response.json()
+        seen.extend(data["items"])
+        if not data["has_more"]:
+            assert data["next_cursor"] is None
+            break
+        cursor = data["next_cursor"]
+
+    assert len(seen) == 5
+    assert len({item["id"] for item in seen}) == 5
+    fetched = [item["fetched_at"] for item in seen]
+    assert fetched == sorted(fetched, reverse=True)
+
+
+@pytest.mark.asyncio
+async def test_list_articles_invalid_cursor(client: AsyncClient):
+    """Test that a malformed cursor is rejected."""
+    response = await client.get("/api/v1/articles/", params={"cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_list_articles_items_match_article_response(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that listed articles serialize exactly like GET /articles/{id}."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+    created = await client.post(
+        "/api/v1/articles/",
+        json={**test_article_data, "source_id": source["id"]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    listed = await client.get("/api/v1/articles/")
+    single = await client.get(f"/api/v1/articles/{created.json()['id']}")
+
+    assert listed.headers["content-type"] == "application/json"
+    assert listed.json()["items"] == [single.json()]
+
+
+@pytest.mark.asyncio
+async def test_count_articles(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test counting articles, overall and per source."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+
+    article_data = {**test_article_data, "source_id": source["id"]}
+    await client.post(
+        "/api/v1/articles/",
+        json=article_data,
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    response = await client.get("/api/v1/articles/count")
+    assert response.status_code == 200
+    assert response.json() == {"total": 1, "estimated": False}
+
+    response = await client.get(
+        "/api/v1/articles/count",
+        params={"source_id": "00000000-0000-0000-0000-000000000000"},
+    )
+    assert response.json() == {"total": 0, "estimated": False}
+
+    # Only SQL Server has a catalog estimate; elsewhere it's an exact count
+    response = await client.get("/api/v1/articles/count", params={"estimate": True})
+    assert response.json() == {"total": 1, "estimated": False}
+
+
+@pytest.mark.asyncio
+async def test_count_articles_estimate_on_mssql(client: AsyncClient):
+    """Test that an estimated total comes from the catalog query on SQL Server."""
+    with (
+        patch("src.api.routers.articles.settings.DATABASE_URL", "mssql+aioodbc://"),
+        patch("src.api.routers.articles._MSSQL_ARTICLE_ROWS", text("SELECT 42")),
+    ):
+        response = await client.get("/api/v1/articles/count", params={"estimate": True})
+
+    assert response.json() == {"total": 42, "estimated": True}
+
+
 @pytest.mark.asyncio
 async def test_get_article_by_id(
     client: AsyncClient,
@@ -214,6 +424,74 @@ async def test_get_article_by_id(
     assert data["title"] == test_article_data["title"]
 
 
+@pytest.mark.asyncio
+async def test_get_article_not_modified(
+    client: AsyncClient,
+    test_engine,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that a matching If-None-Match gets 304 until the article changes."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+    create_response = await client.post(
+        "/api/v1/articles/",
+        json={**test_article_data, "source_id": source["id"]},
+        headers={"Authorization": f"Bearer {token}"},
+    )
+    article_id = create_response.json()["id"]
+    url = f"/api/v1/articles/{article_id}"
+
+    etag = (await client.get(url)).headers["etag"]
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert response.content == b""
+
+    response = await client.get(url, headers={"If-None-Match": 'W/"stale", ' + etag})
+    assert response.status_code == 304
+
+    async with test_engine.begin() as conn:
+        await conn.execute(
+            update(Article)
+            .where(Article.id == uuid.UUID(article_id))
+            .values(updated_at=datetime(2030, 1, 1, tzinfo=UTC))
+        )
+
+    response = await client.get(url, headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+@pytest.mark.asyncio
+async def test_get_article_modified_within_a_second(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that a PATCH right after a GET invalidates the GET's ETag."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    source = await create_source(client, token, test_source_data)
+    create_response = await client.post(
+        "/api/v1/articles/",
+        json={**test_article_data, "source_id": source["id"]},
+        headers=headers,
+    )
+    url = f"/api/v1/articles/{create_response.json()['id']}"
+
+    etag = (await client.get(url)).headers["etag"]
+    await client.patch(url, json={"title": "Updated"}, headers=headers)
+    response = await client.get(url, headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json()["title"] == "Updated"
+    assert response.headers["etag"] != etag
+
+
 @pytest.mark.asyncio
 async def test_get_nonexistent_article(client: AsyncClient):
     """Test getting an article that doesn't exist."""
@@ -261,6 +539,32 @@ async def test_update_article(
     assert data["url"] == test_article_data["url"]
 
 
+@pytest.mark.asyncio
+async def test_update_article_persists_and_allows_empty_patch(
+    client: AsyncClient,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that an update is saved, and an empty update returns the article."""
+    token = await get_auth_token(client, test_user_data)
+    source = await create_source(client, token, test_source_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    create_response = await client.post(
+        "/api/v1/articles/",
+        json={**test_article_data, "source_id": source["id"]},
+        headers=headers,
+    )
+    url = f"/api/v1/articles/{create_response.json()['id']}"
+
+    await client.patch(url, json={"summary": "Saved summary"}, headers=headers)
+    response = await client.patch(url, json={}, headers=headers)
+
+    assert response.status_code == 200
+    assert response.json()["summary"] == "Saved summary"
+    assert (await client.get(url)).json()["summary"] == "Saved summary"
+
+
 @pytest.mark.asyncio
 async def test_update_article_unauthorized(
     client: AsyncClient,
@@ -380,3 +684,223 @@ async def test_delete_nonexistent_article(
     )
 
     assert response.status_code == 404
+
+
+@pytest.fixture
+def ingest_job_sessions(test_engine):
+    """Point the ingest job's own sessions at the test database."""
+    sessionmaker = async_sessionmaker(test_engine, expire_on_commit=False)
+    with patch("src.api.routers.articles.AsyncSessionLocal", sessionmaker):
+        yield
+
+
+async def create_articles(
+    client: AsyncClient, headers: dict, source: dict, article_data: dict, count: int
+) -> None:
+    """Helper to create count articles with distinct URLs and titles."""
+    for i in range(count):
+        await client.post(
+            "/api/v1/articles/",
+            json={
+                **article_data,
+                "source_id": source["id"],
+                "url": f"https://example.com/article/{i}",
+                "title": f"Article {i}",
+            },
+            headers=headers,
+        )
+
+
+async def wait_for_ingest_job(
+    client: AsyncClient, headers: dict, status_url: str
+) -> dict:
+    """Helper to poll an ingest job until it finishes."""
+    for _ in range(500):
+        job = (await client.get(status_url, headers=headers)).json()
+        if not job["running"]:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError("Ingest job did not finish")
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_articles_runs_in_background(
+    client: AsyncClient,
+    test_engine,
+    ingest_job_sessions,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that bulk ingest returns a job and embeds articles in batches."""
+    token = await get_auth_token(client, test_user_data)
+    await make_superuser(test_engine, test_user_data["email"])
+    source = await create_source(client, token, test_source_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    await create_articles(client, headers, source, test_article_data, 3)
+    empty = {**test_article_data, "content": "", "url": "https://example.com/empty"}
+    await client.post(
+        "/api/v1/articles/", json={**empty, "source_id": source["id"]}, headers=headers
+    )
+
+    with patch("src.api.routers.articles.rag_retriever") as mock_retriever:
+        mock_retriever.ingest_documents_batch.side_effect = lambda texts, **_: (
+            [2] * len(texts)
+        )
+        response = await client.post("/api/v1/articles/ingest-all", headers=headers)
+        assert response.status_code == 202
+        data = response.json()
+        assert data["status_url"] == f"/api/v1/articles/ingest-jobs/{data['job_id']}"
+
+        job = await wait_for_ingest_job(client, headers, data["status_url"])
+
+    assert job["articles_total"] == 3
+    assert job["articles_ingested"] == 3
+    assert job["articles_failed"] == 0
+    assert job["total_chunks_created"] == 6
+    assert job["error"] is None
+    assert job["finished_at"] is not None
+    mock_retriever.ingest_documents_batch.assert_called_once()
+    mock_retriever.store.pause_indexing.assert_called_once()
+    mock_retriever.store.resume_indexing.assert_called_once_with(
+        mock_retriever.store.pause_indexing.return_value
+    )
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_articles_counts_failed_batches(
+    client: AsyncClient,
+    test_engine,
+    ingest_job_sessions,
+    test_user_data: dict,
+    test_source_data: dict,
+    test_article_data: dict,
+):
+    """Test that a failing batch is reported without losing the others."""
+    token = await get_auth_token(client, test_user_data)
+    await make_superuser(test_engine, test_user_data["email"])
+    source = await create_source(client, token, test_source_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    await create_articles(client, headers, source, test_article_data, 3)
+
+    def ingest(texts, metadatas, **_):
+        if metadatas[0]["title"] == "Article 1":
+            raise RuntimeError("Qdrant unavailable")
+        return [2] * len(texts)
+
+    with (
+        patch("src.api.routers.articles.INGEST_ARTICLES_PER_BATCH", 1),
+        patch("src.api.routers.articles.rag_retriever") as mock_retriever,
+    ):
+        mock_retriever.ingest_documents_batch.side_effect = ingest
+        response = await client.post("/api/v1/articles/ingest-all", headers=headers)
+        job = await wait_for_ingest_job(client, headers, response.json()["status_url"])
+
+    assert job["articles_ingested"] == 2
+    assert job["articles_failed"] == 1
+    assert job["total_chunks_created"] == 4
+    assert mock_retriever.ingest_documents_batch.call_count == 3
+    mock_retriever.store.resume_indexing.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_articles_one_job_at_a_time(
+    client: AsyncClient,
+    test_engine,
+    ingest_job_sessions,
+    test_user_data: dict,
+):
+    """Test that starting an ingest while one runs returns the running job."""
+    token = await get_auth_token(client, test_user_data)
+    await make_superuser(test_engine, test_user_data["email"])
+    headers = {"Authorization": f"Bearer {token}"}
+
+    with patch("src.api.routers.articles.rag_retriever"):
+        first = await client.post("/api/v1/articles/ingest-all", headers=headers)
+        second = await client.post("/api/v1/articles/ingest-all", headers=headers)
+        await wait_for_ingest_job(client, headers, first.json()["status_url"])
+
+    assert second.json()["job_id"] == first.json()["job_id"]
+    assert second.json()["message"] == "Ingest already in progress"
+
+
+@pytest.mark.asyncio
+async def test_database_allows_one_running_ingest_job(test_session):
+    """Test that the unique index rejects a second running ingest job."""
+    test_session.add_all([IngestJob(running=False), IngestJob(running=True)])
+    await test_session.commit()
+
+    test_session.add(IngestJob(running=True))
+    with pytest.raises(IntegrityError):
+        await test_session.commit()
+    await test_session.rollback()
+
+    # Losing that race is reported, not raised
+    assert await _create_running_ingest_job(test_session) is None
+
+
+@pytest.mark.asyncio
+async def test_get_nonexistent_ingest_job(client: AsyncClient, test_user_data: dict):
+    """Test getting an ingest job that doesn't exist."""
+    token = await get_auth_token(client, test_user_data)
+    response = await client.get(
+        "/api/v1/articles/ingest-jobs/00000000-0000-0000-0000-000000000000",
+        headers={"Authorization": f"Bearer {token}"},
+    )
+
+    assert response.status_code == 404
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_articles_requires_superuser(
+    client: AsyncClient,
+    test_user_data: dict,
+):
+    """Test that regular users can't start a bulk ingest."""
+    token = await get_auth_token(client, test_user_data)
+
+    with patch("src.api.routers.articles.rag_retriever") as mock_retriever:
+        response = await client.post(
+            "/api/v1/articles/ingest-all",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == 403
+    mock_retriever.store.pause_indexing.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_ingest_all_articles_replaces_abandoned_job(
+    client: AsyncClient,
+    test_engine,
+    test_session,
+    ingest_job_sessions,
+    test_user_data: dict,
+):
+    """Test that a job lost mid-run is failed instead of blocking new ingests."""
+    token = await get_auth_token(client, test_user_data)
+    await make_superuser(test_engine, test_user_data["email"])
+    headers = {"Authorization": f"Bearer {token}"}
+    abandoned = IngestJob(
+        running=True,
+        started_at=datetime(2026, 1, 1, tzinfo=UTC),
+        updated_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+    test_session.add(abandoned)
+    await test_session.commit()
+
+    with patch("src.api.routers.articles.rag_retriever") as mock_retriever:
+        response = await client.post("/api/v1/articles/ingest-all", headers=headers)
+        await wait_for_ingest_job(client, headers, response.json()["status_url"])
+
+    assert response.json()["message"] == "Ingest started"
+    assert response.json()["job_id"] != str(abandoned.id)
+    mock_retriever.store.resume_indexing.assert_called()
+
+    job = (
+        await client.get(
+            f"/api/v1/articles/ingest-jobs/{abandoned.id}", headers=headers
+        )
+    ).json()
+    assert job["running"] is False
+    assert job["error"].startswith("Abandoned")
@@ -83,6 +83,27 @@ async def test_login_nonexistent_user(client: AsyncClient):
     assert response.status_code == 401
 
 
+@pytest.mark.asyncio
+async def test_login_nonexistent_user_still_verifies_a_hash(client: AsyncClient):
+    """Test that unknown emails cost a full hash check (no timing oracle)."""
+    from unittest.mock import patch
+
+    from src.api.core.security import DUMMY_PASSWORD_HASH
+    from src.api.routers import auth
+
+    with patch.object(auth, "verify_password", return_value=False) as verify:
+        response = await client.post(
+            "/api/v1/auth/login",
+            data={
+                "username": "nonexistent@example.com",
+                "password": "anypassword",
+            },
+        )
+
+    assert response.status_code == 401
+    verify.assert_called_once_with("anypassword", DUMMY_PASSWORD_HASH)
+
+
 @pytest.mark.asyncio
 async def test_get_current_user(client: AsyncClient, test_user_data: dict):
     """Test getting current user info with valid token."""
@@ -205,3 +226,108 @@ async def test_token_contains_user_info(client: AsyncClient, test_user_data: dic
 
     assert me_response.status_code == 200
     assert me_response.json()["id"] == user_id
+
+
+@pytest.mark.asyncio
+async def test_login_rehashes_legacy_bcrypt_password(
+    client: AsyncClient, test_session, test_user_data: dict
+):
+    """Test that a bcrypt hash still logs in and is upgraded to argon2."""
+    from sqlalchemy import select
+
+    from src.api.core.security import pwd_context
+    from src.api.models import User
+
+    test_session.add(
+        User(
+            email=test_user_data["email"],
+            hashed_password=pwd_context.hash(
+                test_user_data["password"], scheme="bcrypt"
+            ),
+        )
+    )
+    await test_session.commit()
+
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": test_user_data["email"],
+            "password": test_user_data["password"],
+        },
+    )
+
+    assert response.status_code == 200
+    test_session.expire_all()
+    result = await test_session.execute(
+        select(User).where(User.email == test_user_data["email"])
+    )
+    assert result.scalar_one().hashed_password.startswith("$argon2id$")
+
+
+def test_decode_access_token_caches_valid_tokens():
+    """Test that a verified token is served from cache until it expires."""
+    import uuid
+    from datetime import timedelta
+    from unittest.mock import patch
+
+    from src.api.core import security
+
+    token = security.create_access_token(uuid.uuid4(), timedelta(minutes=5))
+    payload = security.decode_access_token(token)
+
+    with patch.object(security.jwt, "decode") as decode:
+        assert security.decode_access_token(token) == payload
+        decode.assert_not_called()
+
+        payload["exp"] = 0  # Expired while cached
+        assert security.decode_access_token(token) is None
+
+
+@pytest.mark.asyncio
+async def test_cached_user_changes_are_saved(
+    client: AsyncClient, test_session, test_user_data: dict
+):
+    """Test that the cached current user can still be updated and saved."""
+    from sqlalchemy import select
+
+    from src.api.models import User
+
+    await client.post("/api/v1/auth/register", json=test_user_data)
+    login_response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": test_user_data["email"],
+            "password": test_user_data["password"],
+        },
+    )
+    headers = {"Authorization": f"Bearer {login_response.json()['access_token']}"}
+
+    # First request loads and caches the user, the second is served from cache
+    assert (await client.get("/api/v1/users/me", headers=headers)).status_code == 200
+    setup_response = await client.post("/api/v1/auth/2fa/setup", headers=headers)
+    assert setup_response.status_code == 200
+
+    result = await test_session.execute(
+        select(User).where(User.email == test_user_data["email"])
+    )
+    assert result.scalar_one().totp_secret == setup_response.json()["secret"]
+
+    # The change invalidated the cache, so the new secret is seen
+    again = await client.post("/api/v1/auth/2fa/setup", headers=headers)
+    assert again.status_code == 400
+
+
+def test_qr_code_is_a_display_sized_png():
+    """Test that the 2FA QR code renders as a PNG about the size it's shown at."""
+    import base64
+    from io import BytesIO
+
+    from PIL import Image
+
+    from src.api.routers.auth import _qr_code_base64
+
+    uri = "otpauth://totp/NewsMinds:test%40example.com?secret=JBSWY3DPEHPK3PXP&issuer=NewsMinds"
+    image = Image.open(BytesIO(base64.b64decode(_qr_code_base64(uri))))
+
+    assert image.format == "PNG"
+    assert image.width == image.height <= 200
@@ -0,0 +1,283 @@
+"""Tests for collection endpoints."""
+
+import asyncio
+import uuid
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.api.models import CollectionTask, Source
+from src.api.routers import collection
+
+
+async def get_auth_token(client: AsyncClient, user_data: dict) -> str:
+    """Helper to register a user and get auth token."""
+    await client.post("/api/v1/auth/register", json=user_data)
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": user_data["email"],
+            "password": user_data["password"],
+        },
+    )
+    return response.json()["access_token"]
+
+
+@pytest.fixture(autouse=True)
+def clear_status_reads():
+    """Don't let a coalesced status read leak from one test into the next."""
+    collection._status_reads.clear()
+
+
+@pytest.fixture
+def collection_sessions(test_engine):
+    """Point the background collection's own sessions at the test database."""
+    sessionmaker = async_sessionmaker(test_engine, expire_on_commit=False)
+    with patch("src.api.routers.collection.AsyncSessionLocal", sessionmaker):
+        yield
+
+
+async def wait_for_collections() -> None:
+    """Helper to let background collections finish."""
+    await asyncio.gather(*collection._collection_tasks)
+
+
+@pytest.mark.asyncio
+async def test_collect_all_runs_on_the_event_loop(
+    client: AsyncClient, collection_sessions, test_user_data: dict
+):
+    """Test that collect-all runs in the background and records its result."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    result = {"sources_processed": 0, "total_new": 0}
+
+    with patch(
+        "src.api.routers.collection.collect_all", AsyncMock(return_value=result)
+    ):
+        response = await client.post("/api/v1/collection/collect-all", headers=headers)
+        assert response.json()["status"] == "running"
+        await wait_for_collections()
+
+    status = (await client.get("/api/v1/collection/status", headers=headers)).json()
+    assert status["running"] is False
+    assert status["result"] == result
+    assert status["error"] is None
+
+
+@pytest.mark.asyncio
+async def test_cancelled_collection_is_finished(
+    client: AsyncClient, collection_sessions, test_user_data: dict
+):
+    """Test that a collection cancelled mid-run doesn't stay running."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    started = asyncio.Event()
+
+    async def hang(db):
+        started.set()
+        await asyncio.Event().wait()
+
+    with patch("src.api.routers.collection.collect_all", hang):
+        await client.post("/api/v1/collection/collect-all", headers=headers)
+        await started.wait()
+        for task in collection._collection_tasks:
+            task.cancel()
+        await asyncio.gather(*collection._collection_tasks, return_exceptions=True)
+
+    status = (await client.get("/api/v1/collection/status", headers=headers)).json()
+    assert status["running"] is False
+    assert status["error"] == "Cancelled"
+
+
+@pytest.mark.asyncio
+async def test_collect_source_records_failure(
+    client: AsyncClient,
+    collection_sessions,
+    test_user_data: dict,
+    test_source_data: dict,
+):
+    """Test that a failing single-source collection is recorded as an error."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    source = (
+        await client.post("/api/v1/sources/", json=test_source_data, headers=headers)
+    ).json()
+
+    with patch(
+        "src.api.routers.collection.collect_from_source",
+        AsyncMock(side_effect=RuntimeError("feed unreachable")),
+    ):
+        await client.post(f"/api/v1/collection/collect/{source['id']}", headers=headers)
+        await wait_for_collections()
+
+    status = (
+        await client.get(f"/api/v1/collection/status/{source['id']}", headers=headers)
+    ).json()
+    assert status["running"] is False
+    assert status["error"] == "feed unreachable"
+
+
+@pytest.mark.asyncio
+async def test_database_allows_one_running_task_per_source(test_session):
+    """Test that the unique index rejects a second running task for a source."""
+    source = Source(name="Feed", url="https://example.com/feed", source_type="rss")
+    test_session.add(source)
+    await test_session.flush()
+
+    test_session.add_all(
+        [
+            CollectionTask(source_id=source.id, running=False),
+            CollectionTask(source_id=source.id, running=True),
+        ]
+    )
+    await test_session.commit()
+
+    test_session.add(CollectionTask(source_id=source.id, running=True))
+    with pytest.raises(IntegrityError):
+        await test_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_database_allows_one_running_collect_all(test_session):
+    """Test that the unique index rejects a second running collect-all."""
+    test_session.add_all(
+        [
+            CollectionTask(source_id=None, running=False),
+            CollectionTask(source_id=None, running=True),
+        ]
+    )
+    await test_session.commit()
+
+    test_session.add(CollectionTask(source_id=None, running=True))
+    with pytest.raises(IntegrityError):
+        await test_session.commit()
+
+
+@pytest.mark.asyncio
+async def test_collect_source_already_running(
+    client: AsyncClient,
+    test_session,
+    test_user_data: dict,
+    test_source_data: dict,
+):
+    """Test that a second trigger reports the running collection."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    source = (
+        await client.post("/api/v1/sources/", json=test_source_data, headers=headers)
+    ).json()
+    test_session.add(CollectionTask(source_id=uuid.UUID(source["id"]), running=True))
+    await test_session.commit()
+
+    response = await client.post(
+        f"/api/v1/collection/collect/{source['id']}", headers=headers
+    )
+
+    assert response.json()["message"].startswith("Collection already in progress")
+
+
+@pytest.mark.asyncio
+async def test_bulk_collection_status_returns_latest_task_per_source(
+    client: AsyncClient,
+    test_session,
+    test_user_data: dict,
+):
+    """Test that bulk status reports each source's most recent task only."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    sources = [
+        Source(name=f"Feed {i}", url=f"https://example.com/{i}", source_type="rss")
+        for i in range(3)
+    ]
+    test_session.add_all(sources)
+    await test_session.flush()
+    test_session.add_all(
+        [
+            CollectionTask(
+                source_id=sources[0].id,
+                error="old failure",
+                created_at=datetime(2026, 1, 1, tzinfo=UTC),
+            ),
+            CollectionTask(
+                source_id=sources[0].id,
+                running=True,
+                created_at=datetime(2026, 1, 2, tzinfo=UTC),
+            ),
+            CollectionTask(source_id=sources[1].id, result={"new": 3}),
+            CollectionTask(source_id=None, running=True),
+        ]
+    )
+    await test_session.commit()
+
+    response = await client.get("/api/v1/collection/status/bulk", headers=headers)
+    statuses = response.json()
+
+    assert response.status_code == 200
+    assert set(statuses) == {str(sources[0].id), str(sources[1].id)}
+    assert statuses[str(sources[0].id)]["running"] is True
+    assert statuses[str(sources[0].id)]["error"] is None
+    assert statuses[str(sources[1].id)]["result"] == {"new": 3}
+
+    response = await client.get(
+        "/api/v1/collection/status/bulk",
+        params={"source_id": [str(sources[1].id), str(sources[2].id)]},
+        headers=headers,
+    )
+    assert set(response.json()) == {str(sources[1].id)}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_status_polls_share_one_read(
+    client: AsyncClient, test_user_data: dict
+):
+    """Test that simultaneous polls for the same status run one query."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+    status = {"running": True, "started_at": None, "finished_at": None}
+
+    with patch(
+        "src.api.routers.collection._read_status", AsyncMock(return_value=status)
+    ) as read_status:
+        responses = await asyncio.gather(
+            *(
+                client.get("/api/v1/collection/status", headers=headers)
+                for _ in range(5)
+            )
+        )
+
+    assert [r.json() for r in responses] == [status] * 5
+    read_status.assert_awaited_once_with(None)
+
+
+@pytest.mark.asyncio
+async def test_collection_status_not_modified(
+    client: AsyncClient, collection_sessions, test_session, test_user_data: dict
+):
+    """Test that polling with the status ETag gets 304 until the status changes."""
+    token = await get_auth_token(client, test_user_data)
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await client.get("/api/v1/collection/status", headers=headers)
+    etag = response.headers["ETag"]
+    assert response.headers["Cache-Control"] == "no-cache"
+
+    response = await client.get(
+        "/api/v1/collection/status", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 304
+    assert response.content == b""
+
+    test_session.add(CollectionTask(source_id=None, running=True))
+    await test_session.commit()
+    collection._status_reads.clear()
+
+    response = await client.get(
+        "/api/v1/collection/status", headers={**headers, "If-None-Match": etag}
+    )
+    assert response.status_code == 200
+    assert response.json()["running"] is True
+    assert response.headers["ETag"] != etag
@@ -0,0 +1,79 @@
+"""Tests for database session helpers."""
+
+import uuid
+
+import pytest
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import async_sessionmaker
+
+from src.api.core.database import TrackedSession, has_pending_writes
+from src.api.models import Base, Source
+
+
+@pytest.mark.asyncio
+async def test_has_pending_writes_tracks_uncommitted_changes(test_engine):
+    """Test that reads don't need a commit but flushed or bulk writes do."""
+    sessionmaker = async_sessionmaker(test_engine, sync_session_class=TrackedSession)
+
+    async with sessionmaker() as session:
+        await session.execute(select(Source))
+        assert not has_pending_writes(session)
+
+        session.add(
+            Source(name="Example", source_type="rss", url="https://example.com")
+        )
+        assert has_pending_writes(session)
+
+        await session.flush()
+        assert has_pending_writes(session)
+
+        await session.commit()
+        assert not has_pending_writes(session)
+
+        await session.execute(update(Source).values(name="Renamed"))
+        assert has_pending_writes(session)
+
+        await session.rollback()
+        assert not has_pending_writes(session)
+
+
+def test_uuid7_is_time_ordered():
+    """Test that uuid7 keys are valid version 7 UUIDs that sort by creation."""
+    import time
+
+    from src.api.models.base import uuid7
+
+    first = uuid7()
+    time.sleep(0.002)
+    second = uuid7()
+
+    assert first.version == 7
+    assert first.variant == uuid.RFC_4122
+    assert first < second
+    assert first.hex < second.hex  # Also ordered as stored in SQLite
+
+
+def test_mssql_ids_are_ordered_like_uniqueidentifier():
+    """Test that SQL Server ids sort by creation in UNIQUEIDENTIFIER order."""
+    import time
+
+    from src.api.models.base import new_id
+
+    def uniqueidentifier_order(value: uuid.UUID) -> tuple[bytes, ...]:
+        # SQL Server compares bytes 10-15, then 8-9, 6-7, 4-5 and 0-3
+        raw = value.bytes
+        return raw[10:], raw[8:10], raw[6:8], raw[4:6], raw[:4]
+
+    first = new_id("mssql")
+    time.sleep(0.002)
+    second = new_id("mssql")
+
+    assert uniqueidentifier_order(first) < uniqueidentifier_order(second)
+    assert new_id("sqlite").version == 7
+
+
+def test_relationships_never_lazy_load():
+    """Test that every relationship must be loaded explicitly (no N+1 queries)."""
+    for mapper in Base.registry.mappers:
+        for relationship in mapper.relationships:
+            assert relationship.lazy == "raise", str(relationship)
@@ -0,0 +1,61 @@
+"""Tests for FastAPI dependencies."""
+
+import inspect
+
+import pytest
+from fastapi.routing import APIRoute
+
+from src.api.routers import articles, auth, collection, intelligence, sources, users
+
+
+def _is_async(call) -> bool:
+    if inspect.isclass(call):
+        return False
+    return (
+        inspect.iscoroutinefunction(call)
+        or inspect.isasyncgenfunction(call)
+        or inspect.iscoroutinefunction(getattr(call, "__call__", None))  # noqa: B004
+    )
+
+
+def _sync_dependencies(dependant) -> list:
+    found = []
+    for sub in dependant.dependencies:
+        if sub.call is not None and not _is_async(sub.call):
+            found.append(sub.call)
+        found.extend(_sync_dependencies(sub))
+    return found
+
+
+@pytest.mark.parametrize(
+    "router",
+    [r.router for r in (auth, users, sources, articles, intelligence, collection)],
+)
+def test_route_dependencies_are_async(router):
+    """Test that no endpoint or dependency runs in the threadpool."""
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        assert _is_async(route.dependant.call), route.path
+        assert _sync_dependencies(route.dependant) == [], route.path
+
+
+def _uncached_dependencies(dependant) -> list:
+    found = []
+    for sub in dependant.dependencies:
+        if sub.call is not None and not sub.use_cache:
+            found.append(sub.call)
+        found.extend(_uncached_dependencies(sub))
+    return found
+
+
+@pytest.mark.parametrize(
+    "router",
+    [r.router for r in (auth, users, sources, articles, intelligence, collection)],
+)
+def test_route_dependencies_are_cached_per_request(router):
+    """Test that shared dependencies (session, user) resolve once per request."""
+    for route in router.routes:
+        if not isinstance(route, APIRoute):
+            continue
+        assert _uncached_dependencies(route.dependant) == [], route.path
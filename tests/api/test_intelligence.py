@@ -0,0 +1,64 @@
+"""Tests for intelligence endpoints."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+from httpx import AsyncClient
+
+
+async def get_auth_token(client: AsyncClient, user_data: dict) -> str:
+    """Helper to register a user and get auth token."""
+    await client.post("/api/v1/auth/register", json=user_data)
+    response = await client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": user_data["email"],
+            "password": user_data["password"],
+        },
+    )
+    return response.json()["access_token"]
+
+
+@pytest.mark.asyncio
+async def test_stream_briefing(client: AsyncClient, test_user_data: dict):
+    """Test that the briefing is streamed for the user's session thread."""
+    token = await get_auth_token(client, test_user_data)
+
+    async def pieces():
+        yield "## Brief"
+        yield "ing"
+
+    with patch(
+        "src.api.routers.intelligence.stream_intelligence_briefing",
+        AsyncMock(return_value=pieces()),
+    ) as stream:
+        response = await client.post(
+            "/api/v1/intelligence/briefing/stream",
+            json={"query": "AI news", "session_id": "s1"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == 200
+    assert response.text == "## Briefing"
+    assert stream.await_args.kwargs["thread_id"].endswith(":s1")
+
+
+@pytest.mark.asyncio
+async def test_stream_briefing_search_failure(
+    client: AsyncClient, test_user_data: dict
+):
+    """Test that a failure before streaming starts is a 500, not a cut-off 200."""
+    token = await get_auth_token(client, test_user_data)
+
+    with patch(
+        "src.api.routers.intelligence.stream_intelligence_briefing",
+        AsyncMock(side_effect=ValueError("OPENAI_API_KEY is not configured")),
+    ):
+        response = await client.post(
+            "/api/v1/intelligence/briefing/stream",
+            json={"query": "AI news"},
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+    assert response.status_code == 500
+    assert response.json()["detail"] == "OPENAI_API_KEY is not configured"
@@ -0,0 +1,24 @@
+"""Tests for document chunking."""
+
+from src.rag.chunking import chunk_text
+
+
+def test_chunk_text_breaks_at_sentence_boundary():
+    """Test that chunks end at the last sentence boundary in the window."""
+    text = "First sentence. Second sentence. " + "x" * 100
+
+    chunks = chunk_text(text, chunk_size=40, chunk_overlap=0)
+
+    assert chunks[0].text == "First sentence. Second sentence."
+    assert [c.chunk_index for c in chunks] == list(range(len(chunks)))
+
+
+def test_chunk_text_terminates_when_break_is_inside_overlap():
+    """Test that a boundary near the window start doesn't stall the loop."""
+    # The only ". " in the first window sits inside the 50-char overlap
+    text = "Short. " + "a" * 600 + "\n" + "b" * 600
+
+    chunks = chunk_text(text, chunk_size=500, chunk_overlap=50)
+
+    assert chunks[0].text == "Short."
+    assert "".join(c.text for c in chunks).count("b") >= 600
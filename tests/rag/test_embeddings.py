@@ -0,0 +1,25 @@
+"""Tests for the embedding service."""
+
+from unittest.mock import MagicMock
+
+import numpy as np
+
+from src.rag.embeddings import EmbeddingService
+
+
+def test_embed_query_reuses_repeated_queries():
+    """Test that the same query is only run through the model once."""
+    service = EmbeddingService()
+    service._model = MagicMock()
+    service._model.encode.return_value = np.array([0.1, 0.2])
+
+    first = service.embed_query("ai regulation")
+    second = service.embed_query("ai regulation")
+    first.append(0.3)  # Callers get their own copy
+
+    assert second == [0.1, 0.2]
+    assert service.embed_query("ai regulation") == [0.1, 0.2]
+    service._model.encode.assert_called_once()
+
+    service.embed_query("chip exports")
+    assert service._model.encode.call_count == 2
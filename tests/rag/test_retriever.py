@@ -0,0 +1,57 @@
+"""Tests for the RAG retriever."""
+
+from unittest.mock import MagicMock, patch
+
+from src.rag.retriever import RAGRetriever
+
+
+def test_ingest_documents_batch_single_upsert():
+    """Test that batch ingestion writes all chunks in one store call."""
+    retriever = RAGRetriever()
+    retriever.store = MagicMock()
+
+    counts = retriever.ingest_documents_batch(
+        texts=["First document.", "Second document.", ""],
+        metadatas=[{"article_id": "1"}, {"article_id": "2"}, {"article_id": "3"}],
+    )
+
+    assert counts == [1, 1, 0]
+    retriever.store.add_chunks.assert_called_once()
+    chunks = retriever.store.add_chunks.call_args.args[0]
+    assert [c.metadata["article_id"] for c in chunks] == ["1", "2"]
+
+
+def test_ingest_documents_batch_flushes_by_chunk_count():
+    """Test that batch_size caps the chunks per store call across documents."""
+    retriever = RAGRetriever()
+    retriever.store = MagicMock()
+
+    counts = retriever.ingest_documents_batch(
+        texts=[f"Document {i}." for i in range(5)],
+        batch_size=2,
+    )
+
+    assert counts == [1, 1, 1, 1, 1]
+    sizes = [len(call.args[0]) for call in retriever.store.add_chunks.call_args_list]
+    assert sizes == [2, 2, 1]
+
+
+def test_ingest_documents_batch_empty():
+    """Test that nothing is written when there are no chunks."""
+    retriever = RAGRetriever()
+    retriever.store = MagicMock()
+
+    assert retriever.ingest_documents_batch(texts=[]) == []
+    retriever.store.add_chunks.assert_not_called()
+
+
+def test_ensure_ready_warms_model_and_collection():
+    """Test that ensure_ready loads the model and prepares the collection."""
+    retriever = RAGRetriever()
+    retriever.store = MagicMock()
+
+    with patch("src.rag.retriever.embedding_service") as mock_embeddings:
+        retriever.ensure_ready()
+
+    mock_embeddings.warmup.assert_called_once()
+    retriever.store.ensure_collection.assert_called_once()
@@ -0,0 +1,37 @@
+"""Tests for the Qdrant vector store."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from src.rag.vector_store import DEFAULT_INDEXING_THRESHOLD, VectorStore
+
+
+def _store(indexing_threshold: int | None) -> VectorStore:
+    store = VectorStore()
+    store._client = MagicMock()
+    store._client.get_collections.return_value.collections = [
+        SimpleNamespace(name=store.collection_name)
+    ]
+    info = store._client.get_collection.return_value
+    info.config.optimizer_config.indexing_threshold = indexing_threshold
+    return store
+
+
+def test_pause_and_resume_indexing_restores_threshold():
+    """Test that resuming puts back the threshold the collection had."""
+    store = _store(indexing_threshold=20_000)
+
+    threshold = store.pause_indexing()
+    paused = store.client.update_collection.call_args.kwargs["optimizer_config"]
+    store.resume_indexing(threshold)
+    resumed = store.client.update_collection.call_args.kwargs["optimizer_config"]
+
+    assert paused.indexing_threshold == 0
+    assert resumed.indexing_threshold == 20_000
+
+
+def test_pause_indexing_when_already_paused():
+    """Test that a paused collection is resumed to the default, not left off."""
+    store = _store(indexing_threshold=0)
+
+    assert store.pause_indexing() == DEFAULT_INDEXING_THRESHOLD